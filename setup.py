@@ -42,4 +42,7 @@ setup(
         "wheel",
         "minizinc >= 0.7",
     ],
+    extras_require={
+        "numpy": ["numpy"],
+    },
 )
@@ -0,0 +1,94 @@
+import pytest
+
+import zython as zn
+from zython._compile.graph import ConstraintGraph
+
+
+class MyModel(zn.Model):
+    def __init__(self):
+        self.n = zn.par(3)
+        self.x = zn.var(range(10))
+        self.y = zn.var(range(100))
+        self.z = zn.var(range(3))
+        self.a = zn.Array(zn.var(range(5)), shape=(2, 3))
+        self.s = zn.var(zn.sum(self.a))
+        self.f = zn.var(float)
+        self.constraints = [
+            self.x > self.n,
+            self.x + self.y < self.s,
+            zn.alldifferent(self.a[0, :]),
+            self.z != self.a[1, self.z],
+            zn.forall(range(3), lambda i: self.a[0, i] <= self.x),
+        ]
+
+
+def _graph():
+    model = MyModel()
+    model.compile("satisfy")
+    return model, ConstraintGraph(model._ir, model.constraints)
+
+
+def test_degree():
+    _, graph = _graph()
+    assert graph.degree == {"x": 3, "y": 1, "z": 1, "a": 4, "s": 2, "f": 0}
+    assert graph.neighbours["y"] == {"x", "s"}
+
+
+def test_components():
+    _, graph = _graph()
+    assert graph.components() == [["x", "y", "z", "a", "s"], ["f"]]
+
+
+def test_decision_vars():
+    _, graph = _graph()
+    assert graph.decision_vars() == ["x", "y", "z", "a"]
+
+
+@pytest.mark.parametrize(
+    "ordering, expected",
+    [
+        ("most_constrained", ["a", "z", "x", "y"]),
+        ("degree", ["a", "x", "y", "z"]),
+        ("bandwidth", ["z", "a", "x", "y"]),
+    ],
+)
+def test_order(ordering, expected):
+    _, graph = _graph()
+    assert graph.order(ordering) == expected
+
+
+def test_unknown_order():
+    _, graph = _graph()
+    with pytest.raises(ValueError):
+        graph.order("unknown")
+
+
+def test_auto_search_compile():
+    model = MyModel()
+    src = model.compile(("satisfy",), model._solve_annotations(None, zn.restart_luby(10), "degree"))
+    assert src.splitlines()[-1] == (
+        "solve :: restart_luby(10) :: seq_search([int_search(array1d(a), input_order, indomain_min), "
+        "int_search([x, y, z], input_order, indomain_min)]) satisfy;"
+    )
+
+
+def test_auto_search_after_user_search():
+    model = MyModel()
+    search = zn.int_search(model.y, "first_fail")
+    src = model.compile(("satisfy",), model._solve_annotations(None, search, True))
+    assert src.splitlines()[-1].startswith("solve :: int_search([y], first_fail, indomain_min) :: seq_search(")
+
+
+def test_graph_follows_constraints():
+    model = MyModel()
+    model._compile_declarations()
+    before = model._constraint_graph().degree["y"]
+    assert model._constraint_graph([model.y > 1]).degree["y"] == before + 1
+    model.constraints = model.constraints + [model.y < 5]
+    assert model._constraint_graph().degree["y"] == before + 1
+
+
+def test_auto_search_solve():
+    model = MyModel()
+    result = model.solve_minimize(model.y, auto_search=True)
+    assert result["y"] == 0
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+import zython as zn
+from zython._compile.vectorised import Evaluator
+
+
+class MyModel(zn.Model):
+    def __init__(self):
+        self.n = zn.par(3)
+        self.p = zn.Array([[1, 2], [3, 4]])
+        self.x = zn.var(range(-5, 6))
+        self.y = zn.var(range(-5, 6))
+        self.a = zn.Array(zn.var(range(4)), shape=3)
+        self.s = zn.var(zn.sum(self.a))
+
+
+def _evaluator(**values):
+    model = MyModel()
+    model.compile("satisfy")
+    size = len(next(iter(values.values())))
+    return model, Evaluator(model._ir, {name: np.asarray(v) for name, v in values.items()}, size)
+
+
+@pytest.mark.parametrize(
+    "x, y, div, mod",
+    [(7 - 2, 2, 2, 1), (-5, 2, -2, -1), (5, -2, -2, 1), (-5, -2, 2, -1)],
+)
+def test_truncated_division(x, y, div, mod):
+    model, ev = _evaluator(x=[x], y=[y])
+    assert ev(model.x // model.y).tolist() == [div]
+    assert ev(model.x % model.y).tolist() == [mod]
+
+
+def test_division_by_zero():
+    model, ev = _evaluator(x=[4, 4], y=[2, 0])
+    assert ev(model.x // model.y).tolist() == [2, 4]
+    assert ev.invalid.tolist() == [False, True]
+
+
+def test_domain():
+    model, ev = _evaluator(x=[1, 6], y=[0, 0], a=[[0, 1, 2], [3, 3, 3]])
+    assert ev.invalid.tolist() == [False, True]
+    # the sum is out of the domain of the array elements
+    assert ev.feasible([]).tolist() == [True, False]
+
+
+@pytest.mark.parametrize(
+    "constraint, expected",
+    [
+        (lambda m: zn.alldifferent(m.a), [True, False, False]),
+        (lambda m: zn.alldifferent(m.a, except0=True), [True, True, False]),
+        (lambda m: zn.count(m.a, 0) == 2, [False, True, False]),
+        (lambda m: zn.count(m.a, lambda e: e > 0) == 2, [True, False, False]),
+        (lambda m: zn.sum(zn.range(m.n), lambda i: m.a[i] * m.x) == m.y, [True, False, True]),
+        (lambda m: zn.exists(m.a, lambda e: e == m.x), [True, False, False]),
+        (lambda m: m.p[m.a[0], 1] == 4, [False, False, True]),
+        (lambda m: zn.increasing(m.a) & (m.x != 1) | (m.y == 0), [False, True, True]),
+        (lambda m: zn.ndistinct(m.a) == 1, [False, False, True]),
+    ],
+)
+def test_constraints(constraint, expected):
+    model, ev = _evaluator(x=[1, 2, 0], y=[3, 0, 0], a=[[0, 1, 2], [0, 0, 3], [1, 1, 1]])
+    assert ev.feasible([constraint(model)]).tolist() == expected
+
+
+def test_index_out_of_bounds():
+    model, ev = _evaluator(x=[1, 3], y=[0, 0], a=[[0, 0, 0], [0, 0, 0]])
+    assert ev.feasible([model.p[model.x, 0] > 0]).tolist() == [True, False]
+
+
+def test_unsupported():
+    class SetModel(zn.Model):
+        def __init__(self):
+            self.s = zn.Set(zn.var(range(3)))
+
+    model = SetModel()
+    model.compile("satisfy")
+    with pytest.raises(ValueError, match="set variable"):
+        Evaluator(model._ir, {}, 1).feasible([])
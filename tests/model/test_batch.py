@@ -0,0 +1,61 @@
+from datetime import timedelta
+
+import pytest
+
+import zython as zn
+
+
+class MyModel(zn.Model):
+    def __init__(self, a: int, b: int):
+        self.a = zn.par(a)
+        self.b = zn.par(b)
+        self.x = zn.var(range(-100, 101))
+        self.constraints = [self.a < self.x, self.x < self.b]
+
+
+def test_satisfy():
+    kwargs = [dict(a=i, b=i + 2) for i in range(5)]
+    results = dict(zn.solve_batch(MyModel, kwargs, workers=2))
+    assert sorted(results) == list(range(5))
+    assert all(results[i]["x"] == i + 1 for i in range(5))
+
+
+def test_minimize():
+    kwargs = [dict(a=i, b=i + 10) for i in range(3)]
+    results = dict(zn.solve_batch(MyModel, kwargs, method="minimize", objective=lambda m: m.x, workers=2))
+    assert all(results[i]["x"] == i + 1 for i in range(3))
+
+
+def test_failure_isolation():
+    kwargs = [dict(a=1, b=3), dict(a=1, b="wrong"), dict(a=1, b=2)]
+    results = dict(zn.solve_batch(MyModel, kwargs, workers=2, instance_timeout=timedelta(seconds=30)))
+    assert results[0]["x"] == 2
+    assert isinstance(results[1], Exception)
+    assert len(results[2]) == 0
+
+
+def test_programming_error_is_raised():
+    def objective(model):
+        raise TypeError("wrong objective")
+
+    with pytest.raises(TypeError):
+        dict(zn.solve_batch(MyModel, [dict(a=1, b=3)], method="minimize", objective=objective))
+
+
+def test_verify():
+    results = dict(zn.solve_batch(MyModel, [dict(a=1, b=10)], method="minimize", objective=lambda m: m.x, workers=1))
+    assert results[0].verify()
+
+
+def test_instances_are_created_lazily():
+    created = []
+
+    def kwargs_list():
+        for i in range(100):
+            created.append(i)
+            yield dict(a=1, b="wrong")
+
+    results = zn.solve_batch(MyModel, kwargs_list(), workers=1)
+    assert isinstance(next(results)[1], ValueError)
+    assert created == [0]
+    results.close()
@@ -0,0 +1,60 @@
+import minizinc
+
+import zython as zn
+
+
+class MyModel(zn.Model):
+    def __init__(self, n: int):
+        self.n = zn.par(n)
+        self.a = zn.var(range(10))
+        self.b = zn.var(range(10))
+        self.constraints = [self.a + self.b == self.n]
+
+
+def test_branch_constraint():
+    model = MyModel(10)
+    result = model.branch(model.a == 3).solve_satisfy()
+    assert (result["a"], result["b"]) == (3, 7)
+
+
+def test_branches_are_independent():
+    model = MyModel(10)
+    assert model.branch(model.a == 3).solve_satisfy()["b"] == 7
+    assert model.branch(model.a == 6).solve_satisfy()["b"] == 4
+    assert model.solve_maximize(model.a)["a"] == 9
+
+
+def test_different_goals():
+    model = MyModel(10)
+    assert model.branch().solve_minimize(model.a)["a"] == 1
+    assert model.branch().solve_maximize(model.a)["a"] == 9
+
+
+def test_nested_branch():
+    model = MyModel(10)
+    child = model.branch(model.a > 2)
+    grandchild = child.branch(model.a < 5)
+    grandchild.constraints.append(model.b % 2 == 0)
+    result = grandchild.solve_satisfy(all_solutions=True)
+    assert [solution.a for solution in result._solution] == [4]
+    assert child.solve_minimize(model.a)["a"] == 3
+
+
+def test_unsatisfiable_branch():
+    model = MyModel(10)
+    result = model.branch(model.a == 0).solve_satisfy()
+    assert result.original.status == minizinc.Status.UNSATISFIABLE
+
+
+def test_base_instance_reused():
+    model = MyModel(10)
+    model.branch(model.a == 1).solve_satisfy()
+    inst = model._base_instances["org.gecode.gecode"]
+    model.branch(model.a == 2).solve_satisfy()
+    assert model._base_instances["org.gecode.gecode"] is inst
+
+
+def test_global_constraint_in_branch():
+    model = MyModel(10)
+    result = model.branch(zn.alldifferent((model.a, model.b))).solve_minimize(model.a)
+    assert (result["a"], result["b"]) == (1, 9)
@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+
+import minizinc
+import pytest
+
+import zython as zn
+from zython.result import Result
+
+
+class MyModel(zn.Model):
+    def __init__(self):
+        self.a = zn.Array(zn.var(range(5)), shape=3)
+        self.x = zn.var(range(10))
+        self.y = zn.var(self.x * 2)
+        self.constraints = [zn.alldifferent(self.a), zn.sum(self.a) == self.x]
+
+
+def test_evaluate():
+    model = MyModel()
+    evaluation = model.evaluate({"a": [[0, 1, 2], [1, 1, 1], [0, 1, 4]], "x": [3, 3, 4]}, objective=model.y + 1)
+    assert evaluation.satisfied.tolist() == [[True, True], [False, True], [True, False]]
+    assert evaluation.valid.tolist() == [True, True, True]
+    assert evaluation.feasible.tolist() == [True, False, False]
+    assert evaluation.objective.tolist() == [7, 7, 9]
+
+
+def test_evaluate_rows():
+    model = MyModel()
+    evaluation = model.evaluate([{"a": [0, 1, 2], "x": 3, "y": 6}, {"a": [0, 1, 2], "x": 3, "y": 5}])
+    # value of the variable defined by expression is checked
+    assert evaluation.feasible.tolist() == [True, False]
+
+
+def test_evaluate_out_of_domain():
+    model = MyModel()
+    assert model.evaluate({"a": [[0, 1, 5]], "x": [6]}).valid.tolist() == [False]
+
+
+@pytest.mark.parametrize(
+    "assignments", [{"a": [[0, 1, 2]]}, {"a": [[0, 1, 2]], "x": [3], "z": [1]}, {"a": [[0, 1, 2]], "x": [3, 4]}]
+)
+def test_evaluate_invalid_assignments(assignments):
+    with pytest.raises(ValueError):
+        MyModel().evaluate(assignments)
+
+
+def test_evaluate_branch():
+    model = MyModel()
+    evaluation = model.branch(model.x > 3).evaluate({"a": [[0, 1, 2], [0, 1, 3]], "x": [3, 4]})
+    assert evaluation.satisfied.tolist() == [[True, True, False], [True, True, True]]
+
+
+def test_verify():
+    model = MyModel()
+    result = model.solve_maximize(model.x, solver="numpy")
+    assert result.verify()
+
+
+def test_verify_wrong_solution():
+    model = MyModel()
+    solution = SimpleNamespace(objective=3, a=[0, 1, 2], x=3, y=6)
+    assert Result(minizinc.Result(minizinc.Status.SATISFIED, solution, {}), model=model, objective=model.x).verify()
+    solution = SimpleNamespace(objective=4, a=[0, 1, 2], x=3, y=6)
+    assert not Result(minizinc.Result(minizinc.Status.SATISFIED, solution, {}), model=model, objective=model.x).verify()
+    solution = SimpleNamespace(a=[0, 1, 1], x=2, y=4)
+    assert not Result(minizinc.Result(minizinc.Status.SATISFIED, solution, {}), model=model).verify()
+
+
+def test_verify_unbound_result():
+    solution = SimpleNamespace(a=[0, 1, 2], x=3, y=6)
+    with pytest.raises(ValueError):
+        Result(minizinc.Result(minizinc.Status.SATISFIED, solution, {})).verify()
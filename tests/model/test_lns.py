@@ -0,0 +1,99 @@
+import random
+from datetime import timedelta
+from types import SimpleNamespace
+
+import minizinc
+import pytest
+
+import zython as zn
+from zython._compile.zinc.to_str import to_str
+from zython.lns import _elements, _neighbourhood
+from zython.result import Result
+
+
+class Knapsack(zn.Model):
+    def __init__(self, weights, values, capacity):
+        self.weights = zn.Array(weights)
+        self.values = zn.Array(values)
+        self.capacity = zn.par(capacity)
+        self.take = zn.Array(zn.var(range(2)), shape=len(weights))
+        self.extra = zn.var(range(3))
+        self.value = zn.var(zn.sum(range(len(weights)), lambda i: self.take[i] * self.values[i]) + self.extra)
+        self.constraints = [
+            zn.sum(range(len(weights)), lambda i: self.take[i] * self.weights[i]) + self.extra <= self.capacity
+        ]
+
+
+def _model():
+    return Knapsack([3, 4, 5, 6, 2], [4, 5, 7, 8, 1], 12)
+
+
+def test_elements():
+    model = _model()
+    model.compile(("maximize", model.value))
+    assert _elements(model) == [
+        ("take", (0,)),
+        ("take", (1,)),
+        ("take", (2,)),
+        ("take", (3,)),
+        ("take", (4,)),
+        ("extra", None),
+    ]
+
+
+def test_random_neighbourhood():
+    model = _model()
+    model.compile(("maximize", model.value))
+    incumbent = Result(minizinc.Result(minizinc.Status.SATISFIED, SimpleNamespace(take=[1, 0, 1, 0, 1], extra=2), {}))
+    constraints = _neighbourhood(model, _elements(model), incumbent, 0.5, random.Random(0))
+    compiled = [to_str(c) for c in constraints]
+    assert len(compiled) == 3
+    expected = {
+        "(take[0] == 1)",
+        "(take[1] == 0)",
+        "(take[2] == 1)",
+        "(take[3] == 0)",
+        "(take[4] == 1)",
+        "(extra == 2)",
+    }
+    assert set(compiled) <= expected
+
+
+@pytest.mark.parametrize("neighbourhood", [0, 1.5])
+def test_invalid_neighbourhood(neighbourhood):
+    model = _model()
+    with pytest.raises(ValueError):
+        model.solve_lns(model.value, maximize=True, neighbourhood=neighbourhood)
+
+
+def test_solve_lns():
+    model = _model()
+    result = model.solve_lns(model.value, maximize=True, iterations=10, random_seed=1)
+    assert result["value"] == 16
+
+
+def test_solve_lns_custom_neighbourhood():
+    model = _model()
+
+    def keep_first(best, rng):
+        return [model.take[0] == best["take"][0]]
+
+    result = model.solve_lns(model.value, neighbourhood=keep_first, iterations=3)
+    assert result["value"] == 0
+
+
+def test_solve_lns_parallel():
+    model = _model()
+    result = model.solve_lns(
+        model.value, maximize=True, iterations=8, workers=2, time_per_iteration=timedelta(seconds=5), random_seed=1
+    )
+    assert result["value"] == 16
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_solve_lns_branch(workers):
+    model = _model()
+    result = model.branch(model.extra == 0).solve_lns(model.value, maximize=True, iterations=4, workers=workers)
+    assert result["extra"] == 0
+    assert result["value"] == 16
+    assert result.verify()
@@ -0,0 +1,62 @@
+import pytest
+
+import zython as zn
+from zython._compile.zinc.to_str import to_str
+from zython.multiobjective import _goals, _not_dominated
+
+
+class MyModel(zn.Model):
+    def __init__(self):
+        self.x = zn.var(range(5))
+        self.y = zn.var(range(5))
+        self.z = zn.var(range(5))
+        self.constraints = [self.x + self.y <= 4]
+
+
+def test_not_dominated():
+    model = MyModel()
+    model.compile(("satisfy",))
+    goals = _goals([model.x, model.y], [True, False])
+    assert to_str(_not_dominated(goals, (1, 2))) == "((x > 1) \\/ (y < 2))"
+
+
+@pytest.mark.parametrize("objectives, maximize", [([], False), (["x", "y"], [True])])
+def test_invalid_goals(objectives, maximize):
+    with pytest.raises(ValueError):
+        _goals(objectives, maximize)
+
+
+def test_solve_lexicographic():
+    model = MyModel()
+    stages = model.solve_lexicographic([model.x, model.z, model.y], maximize=[False, True, True])
+    assert [stage.result.original.objective for stage in stages] == [0, 4, 4]
+    assert stages[-1].result["x"] == 0
+    assert all(stage.time.total_seconds() > 0 for stage in stages)
+
+
+def test_solve_lexicographic_branch():
+    model = MyModel()
+    stages = model.branch(model.x >= 2).solve_lexicographic([model.x, model.y], maximize=[False, True])
+    assert [stage.result.original.objective for stage in stages] == [2, 2]
+    assert all(stage.result.verify() for stage in stages)
+
+
+def test_solve_lexicographic_unsatisfiable():
+    model = MyModel()
+    stages = model.branch(model.x > 4).solve_lexicographic([model.x, model.y])
+    assert len(stages) == 1
+    assert stages[0].result.original.status.name == "UNSATISFIABLE"
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_pareto_front(workers):
+    model = MyModel()
+    front = model.pareto_front([model.x, model.y], maximize=True, workers=workers)
+    assert [point.values for point in front] == [(0, 4), (1, 3), (2, 2), (3, 1), (4, 0)]
+    assert all(point.result["x"] == point.values[0] for point in front)
+
+
+def test_pareto_front_max_points():
+    model = MyModel()
+    front = model.branch(model.y <= 2).pareto_front([model.x, model.y], maximize=True, max_points=2)
+    assert [point.values for point in front] == [(3, 1), (4, 0)]
@@ -0,0 +1,72 @@
+import pytest
+
+import zython as zn
+
+
+class MyModel(zn.Model):
+    def __init__(self):
+        self.x = zn.var(range(1, 4))
+        self.a = zn.Array(zn.var(range(1, 4)), shape=3)
+        self.helper = zn.var(range(10), output=False)
+        self.total = self.x + zn.sum(self.a)
+        self.constraints = [zn.alldifferent(self.a), self.helper == self.x * 2]
+
+
+def test_compile_internal_var():
+    src = MyModel().compile(("satisfy",))
+    assert "var 0..9: helper :: no_output;" in src
+    assert "var 1..3: x;" in src
+
+
+def test_compile_output():
+    model = MyModel()
+    src = model.compile(("satisfy",), output=["x", "total"])
+    assert "var 1..3: x;" in src
+    assert "array[0..2] of var 1..3: a :: no_output;" in src
+    assert "var 0..9: helper :: no_output;" in src
+
+
+def test_compile_output_of_internal_var():
+    src = MyModel().compile(("satisfy",), output=["helper"])
+    assert "var 0..9: helper;" in src
+    assert "var 1..3: x :: no_output;" in src
+
+
+def test_compile_output_once():
+    model = MyModel()
+    full = model.compile(("satisfy",))
+    model.compile(("satisfy",), output=["x"])
+    assert model.compile(("satisfy",)) == full
+    assert full.count("constraint (total ==") == 1
+
+
+def test_unknown_output():
+    with pytest.raises(ValueError, match="'y'"):
+        MyModel().compile(("satisfy",), output=["x", "y"])
+
+
+@pytest.mark.parametrize("solver", ["gecode", "numpy"])
+def test_solve_output(solver):
+    result = MyModel().solve_satisfy(solver=solver, output=["x", "total"])
+    assert set(result.original.solution.__dict__) >= {"x", "total"}
+    assert not hasattr(result.original.solution, "a")
+    assert result["total"] == result["x"] + 6
+
+
+@pytest.mark.parametrize("solver", ["gecode", "numpy"])
+def test_solve_without_internal_var(solver):
+    result = MyModel().solve_satisfy(solver=solver)
+    assert not hasattr(result.original.solution, "helper")
+    assert sorted(result["a"]) == [1, 2, 3]
+
+
+@pytest.mark.parametrize("output", [None, ["x", "total"]])
+def test_verify_projected_result(output):
+    result = MyModel().solve_satisfy(solver="numpy", output=output)
+    with pytest.raises(ValueError, match="output"):
+        result.verify()
+
+
+def test_verify_output_with_all_decision_vars():
+    result = MyModel().solve_satisfy(solver="numpy", output=["x", "a", "helper"])
+    assert result.verify()
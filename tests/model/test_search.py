@@ -0,0 +1,85 @@
+import pytest
+
+import zython as zn
+
+
+class MyModel(zn.Model):
+    def __init__(self):
+        self.x = zn.var(range(10))
+        self.a = zn.Array(zn.var(range(10)), shape=(2, 3))
+        self.constraints = [zn.alldifferent(self.a), self.x >= self.a[0, 0]]
+
+
+def _solve_item(model, search):
+    return model.compile(("satisfy",), model._solve_annotations(None, search)).splitlines()[-1]
+
+
+@pytest.mark.parametrize(
+    "search, expected",
+    [
+        (lambda m: zn.int_search(m.x), "int_search([x], input_order, indomain_min)"),
+        (
+            lambda m: zn.int_search(m.a, "first_fail", "indomain_max"),
+            "int_search(array1d(a), first_fail, indomain_max)",
+        ),
+        (lambda m: zn.int_search([m.x, m.a[1, 2]], "dom_w_deg"), "int_search([x, a[1, 2]], dom_w_deg, indomain_min)"),
+        (lambda m: zn.restart_luby(100), "restart_luby(100)"),
+        (lambda m: zn.restart_geometric(2, 50), "restart_geometric(2.0, 50)"),
+        (lambda m: zn.restart_none(), "restart_none"),
+        (
+            lambda m: zn.seq_search([zn.int_search(m.x), zn.int_search(m.a)]),
+            "seq_search([int_search([x], input_order, indomain_min), "
+            "int_search(array1d(a), input_order, indomain_min)])",
+        ),
+    ],
+)
+def test_compile(search, expected):
+    model = MyModel()
+    assert _solve_item(model, search(model)) == f"solve :: {expected} satisfy;"
+
+
+def test_compile_several():
+    model = MyModel()
+    solve_item = _solve_item(model, [zn.int_search(model.x), zn.restart_constant(10)])
+    assert solve_item == "solve :: int_search([x], input_order, indomain_min) :: restart_constant(10) satisfy;"
+
+
+@pytest.mark.parametrize(
+    "create",
+    [
+        lambda m: zn.int_search(m.x, "unknown"),
+        lambda m: zn.int_search(m.x, "first_fail", "unknown"),
+        lambda m: zn.float_search(m.x, 0.1, val_select="indomain_min"),
+        lambda m: zn.seq_search([]),
+    ],
+)
+def test_invalid_choice(create):
+    with pytest.raises(ValueError):
+        create(MyModel())
+
+
+def test_invalid_variables():
+    model = MyModel()
+    with pytest.raises(TypeError):
+        zn.int_search([model.x, model.a], "first_fail")
+    with pytest.raises(TypeError):
+        model.solve_satisfy(search="first_fail")
+
+
+def test_solve_with_search():
+    model = MyModel()
+    result = model.solve_satisfy(search=zn.int_search(model.a, "input_order", "indomain_max"))
+    assert result["a"] == [[9, 8, 7], [6, 5, 4]]
+
+
+def test_solve_with_slice_search():
+    model = MyModel()
+    search = zn.seq_search([zn.int_search(model.a[1, :], "input_order", "indomain_max"), zn.int_search(model.x)])
+    result = model.solve_satisfy(search=search)
+    assert result["a"][1] == [9, 8, 7]
+
+
+def test_solve_with_restarts():
+    model = MyModel()
+    result = model.solve_minimize(model.x, search=[zn.int_search(model.a, "first_fail"), zn.restart_luby(50)])
+    assert result["x"] == 0
@@ -0,0 +1,71 @@
+import pytest
+
+import zython as zn
+from zython.stacking import _stack
+
+
+class MyModel(zn.Model):
+    def __init__(self, a: int, b: int):
+        self.a = zn.par(a)
+        self.b = zn.par(b)
+        self.x = zn.var(range(-100, 101))
+        self.y = zn.var(self.x * 2)
+        self.constraints = [self.a < self.x, self.x < self.b]
+
+
+def test_stack():
+    models = [MyModel(1, 5), MyModel(2, 8)]
+    src, data, names = _stack(models, "maximize", lambda m: m.x)
+    assert src == "\n".join(
+        [
+            " int: s0_a;",
+            " int: s0_b;",
+            "var -100..100: s0_x;",
+            "var int: s0_y;",
+            "constraint (s0_a < s0_x);",
+            "constraint (s0_b > s0_x);",
+            "constraint (s0_y == (s0_x * 2));",
+            " int: s1_a;",
+            " int: s1_b;",
+            "var -100..100: s1_x;",
+            "var int: s1_y;",
+            "constraint (s1_a < s1_x);",
+            "constraint (s1_b > s1_x);",
+            "constraint (s1_y == (s1_x * 2));",
+            "solve maximize (s0_x) + (s1_x);",
+        ]
+    )
+    assert data == {"s0_a": 1, "s0_b": 5, "s1_a": 2, "s1_b": 8}
+    assert names == [["x", "y"], ["x", "y"]]
+    # models can be solved separately after stacking
+    assert models[0].compile(("satisfy",)).count("constraint") == 3
+    assert models[1].x._name == "x"
+
+
+def test_objective_required():
+    with pytest.raises(ValueError):
+        zn.solve_stacked(MyModel, [dict(a=1, b=3)], method="minimize")
+
+
+def test_satisfy():
+    results = zn.solve_stacked(MyModel, [dict(a=i, b=i + 2) for i in range(20)])
+    assert [r["x"] for r in results] == list(range(1, 21))
+    assert [r["y"] for r in results] == list(range(2, 42, 2))
+
+
+def test_maximize():
+    results = zn.solve_stacked(
+        MyModel, [dict(a=i, b=i + 10) for i in range(3)], method="maximize", objective=lambda m: m.x
+    )
+    assert [r["x"] for r in results] == [9, 10, 11]
+    assert all(r.original.status.name == "OPTIMAL_SOLUTION" for r in results)
+    assert all(r.verify() for r in results)
+
+
+def test_unsatisfiable_scenarios():
+    kwargs = [dict(a=1, b=3), dict(a=1, b=2), dict(a=5, b=7), dict(a=0, b=0)]
+    results = zn.solve_stacked(MyModel, kwargs)
+    assert [len(r) for r in results] == [1, 0, 1, 0]
+    assert results[0]["x"] == 2
+    assert results[1].original.status.name == "UNSATISFIABLE"
+    assert results[2]["x"] == 6
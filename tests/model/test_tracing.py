@@ -0,0 +1,98 @@
+from datetime import timedelta
+
+import minizinc
+import pytest
+
+import zython as zn
+from zython import tracing
+from zython.model import _timings
+from zython.result import Result
+
+
+class MyModel(zn.Model):
+    def __init__(self):
+        self.x = zn.var(range(1, 4))
+        self.a = zn.Array(zn.var(range(1, 4)), shape=3)
+        self.constraints = [zn.alldifferent(self.a), self.x == self.a[0]]
+
+
+@pytest.fixture
+def events():
+    events = []
+    hook = tracing.add_hook(events.append)
+    yield events
+    tracing.remove_hook(hook)
+
+
+def test_timings():
+    model = MyModel()
+    result = model.solve_satisfy(solver="numpy")
+    assert set(result.timings) == {"solve", "ir", "to_zinc", "solver", "search"}
+    assert result.timings["solve"] >= result.timings["solver"] >= 0
+    assert result["x"] == 1
+    assert str(result)
+    assert "convert" in result.timings
+
+
+def test_compiled_once():
+    model = MyModel()
+    model.solve_satisfy(solver="numpy")
+    result = model.branch(model.x > 1).solve_satisfy(solver="numpy")
+    assert set(result.timings) == {"solve", "solver", "search"}
+
+
+def test_events(events):
+    MyModel().solve_satisfy(solver="numpy")
+    assert [(e.phase, e.kind) for e in events] == [
+        ("solve", "start"),
+        ("ir", "start"),
+        ("ir", "end"),
+        ("to_zinc", "start"),
+        ("to_zinc", "end"),
+        ("solver", "start"),
+        ("solver", "end"),
+        ("solve", "end"),
+    ]
+    assert all(e.elapsed is None if e.kind == "start" else e.elapsed >= 0 for e in events)
+
+
+def test_phase_accumulates(events):
+    timings = {}
+    for _ in range(2):
+        with tracing.phase("step", timings):
+            pass
+    assert list(timings) == ["step"]
+    assert len(events) == 4
+
+
+def test_result_as():
+    result = MyModel().solve_satisfy(solver="numpy", result_as=zn.as_original)
+    assert result.solution.x == 1
+    assert tracing.current_timings() is None
+
+
+def test_results_of_one_solve():
+    @tracing.traced
+    def solve():
+        results = [minizinc.Result(minizinc.Status.SATISFIED, None, {"flatTime": timedelta(seconds=s)}) for s in (1, 2)]
+        return [Result(result, timings=_timings(result)) for result in results]
+
+    first, second = solve()
+    assert (first.timings["flatten"], second.timings["flatten"]) == (1, 2)
+    assert first.timings["solve"] == second.timings["solve"] > 0
+
+
+def test_failed_hook(events, caplog):
+    def fail(event):
+        raise RuntimeError("hook failed")
+
+    tracing.add_hook(fail)
+    try:
+        model = MyModel()
+        result = model.solve_satisfy(solver="numpy")
+    finally:
+        tracing.remove_hook(fail)
+    assert result["x"] == 1
+    # other hooks get every event, and every failure is logged
+    assert events and len(caplog.records) == len(events)
+    assert "hook failed" in caplog.text
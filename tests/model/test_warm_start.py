@@ -0,0 +1,57 @@
+import pytest
+
+import zython as zn
+
+
+class MyModel(zn.Model):
+    def __init__(self, n: int):
+        self.n = zn.par(n)
+        self.x = zn.var(range(100))
+        self.a = zn.Array(zn.var(range(10)), shape=(2, 2))
+        self.constraints = [self.x == zn.sum(self.a), self.x >= self.n]
+
+
+def test_compile():
+    model = MyModel(5)
+    src = model.compile(("minimize", model.x), model._solve_annotations({"x": 10, "a": [[1, 2], [3, 4]]}))
+    assert src.splitlines()[-1] == (
+        "solve :: warm_start_array([warm_start([x], [10]), warm_start(array1d(a), [1, 2, 3, 4])]) minimize x;"
+    )
+
+
+def test_compile_skips_missing_values():
+    model = MyModel(5)
+    assert model._solve_annotations({"x": None}) == []
+
+
+def test_unknown_name():
+    model = MyModel(5)
+    with pytest.raises(ValueError, match="'y'"):
+        model._solve_annotations({"y": 1})
+
+
+def test_wrong_type():
+    model = MyModel(5)
+    with pytest.raises(TypeError):
+        model._solve_annotations([1, 2])
+
+
+def test_warm_start_dict():
+    model = MyModel(5)
+    result = model.solve_minimize(model.x, warm_start={"x": 10, "a": [[1, 2], [3, 4]]})
+    assert result["x"] == 5
+
+
+def test_warm_start_from_result():
+    previous_model = MyModel(5)
+    previous = previous_model.solve_minimize(previous_model.x)
+    model = MyModel(7)
+    result = model.solve_minimize(model.x, warm_start=previous)
+    assert result["x"] == 7
+    assert "warm_start" in model.src
+
+
+def test_warm_start_branch():
+    model = MyModel(5)
+    result = model.branch(model.a[0, 0] == 3).solve_minimize(model.x, warm_start={"a": [[3, 3], [3, 3]]})
+    assert result["x"] == 5
@@ -1,6 +1,10 @@
+from types import SimpleNamespace
+
+import minizinc
 import pytest
 
 import zython as zn
+from zython.result import Result
 
 
 class TestOriginal:
@@ -65,3 +69,39 @@ class TestLen:
 
         result = MyModel().solve_satisfy(all_solutions=False)
         assert len(result) == 1
+
+
+def _result(solution):
+    return Result(minizinc.Result(minizinc.Status.ALL_SOLUTIONS, solution, {}))
+
+
+class TestColumns:
+    def test_to_numpy(self):
+        result = _result([SimpleNamespace(a=[[1, 2], [3, 4]], x=-0.0), SimpleNamespace(a=[[5, 6], [7, 8]], x=1.5)])
+        assert result.to_numpy("a").shape == (2, 2, 2)
+        assert result.to_numpy("a")[1, 1].tolist() == [7, 8]
+        assert str(result.to_numpy("x")[0]) == "0.0"
+        assert result.to_numpy("x") is result.to_numpy("x")
+
+    def test_to_numpy_single_solution(self):
+        result = _result(SimpleNamespace(a=[1, 2], x=3))
+        assert result.to_numpy("a").tolist() == [1, 2]
+        assert result.to_numpy("x").shape == ()
+
+    @pytest.mark.parametrize("solution", [None, []])
+    def test_to_numpy_no_solution(self, solution):
+        with pytest.raises(KeyError):
+            _result(solution).to_numpy("x")
+
+    def test_to_dataframe(self):
+        pd = pytest.importorskip("pandas")
+        result = _result([SimpleNamespace(a=[[1, 2], [3, 4]], x=0), SimpleNamespace(a=[[5, 6], [7, 8]], x=1)])
+        expected = pd.DataFrame(
+            {"a[0, 0]": [1, 5], "a[0, 1]": [2, 6], "a[1, 0]": [3, 7], "a[1, 1]": [4, 8], "x": [0, 1]}
+        )
+        pd.testing.assert_frame_equal(result.to_dataframe(), expected)
+
+    def test_solution_class_is_shared(self):
+        first, second = _result(SimpleNamespace(a=[1, 2], x=3)), _result(SimpleNamespace(a=[2, 1], x=4))
+        assert type(first._solution) is type(second._solution)
+        assert str(second) == "Solution(a=[2, 1], x=4)"
@@ -0,0 +1,126 @@
+import threading
+
+import pytest
+
+import zython as zn
+from zython.serve import client, close_server, create_server
+from zython.serve import service as service_module
+from zython.serve.service import DeadlineError, Job, JobError, QueueFullError, ServiceStoppedError, SolveService
+
+
+class MyModel(zn.Model):
+    def __init__(self, a: int, b: int):
+        self.a = zn.par(a)
+        self.b = zn.par(b)
+        self.x = zn.var(range(-100, 101))
+        self.constraints = [self.a < self.x, self.x < self.b]
+
+
+@pytest.fixture
+def address(tmp_path):
+    socket_path = str(tmp_path / "zython.sock")
+    server = create_server(socket_path=socket_path, workers=2, max_queue=10)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"unix://{socket_path}"
+    server.shutdown()
+    close_server(server)
+
+
+def test_model_job(address):
+    job = {"model": f"{__name__}:MyModel", "kwargs": {"a": 1, "b": 10}, "method": "minimize", "objective": "x"}
+    result = client.solve(job, address)
+    assert result["solution"]["x"] == 2
+    assert result["status"] == "OPTIMAL_SOLUTION"
+
+
+def test_src_job(address):
+    model = MyModel(1, 3)
+    src = model.compile("satisfy")
+    result = client.solve({"src": src, "data": {"a": 1, "b": 3}}, address)
+    assert result["solution"]["x"] == 2
+
+
+def test_bad_job(address):
+    with pytest.raises(client.ServiceError) as e:
+        client.solve({"data": {}}, address)
+    assert e.value.status == 400
+
+
+@pytest.mark.parametrize("body", [b"[1, 2]", b"{not json", b"\xff"])
+def test_invalid_body(address, body):
+    conn = client._connect(address, timeout=10)
+    try:
+        conn.request("POST", "/solve", body=body, headers={"Content-Type": "application/json"})
+        response = conn.getresponse()
+        response.read()
+    finally:
+        conn.close()
+    assert response.status == 400
+
+
+def test_failed_job(address):
+    with pytest.raises(client.ServiceError) as e:
+        client.solve({"model": "unknown_module:Model"}, address)
+    assert e.value.status == 422
+    assert client.metrics(address)["failed"] == 1
+
+
+def test_metrics(address):
+    metrics = client.metrics(address)
+    assert metrics["queue_depth"] == 0
+    assert metrics["workers"] == 2
+    assert metrics["latency"] is None
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [{}, {"src": "", "model": ""}, {"src": "", "solver": ["gecode", "chuffed"]}, {"src": "", "priority": "high"}, []],
+)
+def test_invalid_job(spec):
+    with pytest.raises(JobError):
+        Job(spec)
+
+
+def test_queue_is_full():
+    service = SolveService(workers=1, max_queue=1)  # not started, so jobs stay in the queue
+    service.submit(Job({"src": ""}))
+    with pytest.raises(QueueFullError):
+        service.submit(Job({"src": ""}))
+    assert service.metrics()["rejected"] == 1
+
+
+def test_priority_and_deadline():
+    service = SolveService(workers=1)
+    low = service.submit(Job({"model": "unknown_module:Model", "priority": 0}))
+    expired = service.submit(Job({"src": "", "priority": 1, "deadline": 0}))
+    service.start()
+    assert low.wait(10) and expired.wait(10)
+    service.stop()
+    assert expired.started < low.started
+    assert isinstance(expired.error, DeadlineError)
+    assert service.metrics()["expired"] == 1
+
+
+def test_stop_finishes_queued_jobs():
+    service = SolveService(workers=1)  # not started, so jobs stay in the queue
+    job = service.submit(Job({"src": ""}))
+    service.stop()
+    assert job.wait(0)
+    assert isinstance(job.error, ServiceStoppedError)
+    assert service.metrics()["cancelled"] == 1
+    with pytest.raises(ServiceStoppedError):
+        service.submit(Job({"src": ""}))
+
+
+def test_deadline_while_solving(monkeypatch):
+    def solve_source(*args):
+        raise TimeoutError("the solve was terminated")
+
+    monkeypatch.setattr(service_module, "solve_source", solve_source)
+    service = SolveService(workers=1).start()
+    job = service.submit(Job({"src": "", "deadline": 60}))
+    assert job.wait(10)
+    service.stop()
+    assert isinstance(job.error, DeadlineError)
+    assert service.metrics()["expired"] == 1
@@ -0,0 +1,68 @@
+import pytest
+
+import zython as zn
+from zython._compile.zinc.to_str import to_str
+from zython.model import _objective_bounds
+from zython.solver.bisection import probes
+
+
+class MyModel(zn.Model):
+    def __init__(self):
+        self.a = zn.Array(zn.var(range(1, 10)), shape=4)
+        self.total = zn.var(range(40))
+        self.constraints = [zn.alldifferent(self.a), self.a[0] + self.a[1] >= 9, self.total == zn.sum(self.a)]
+
+
+@pytest.mark.parametrize(
+    "lower, upper, workers, expected",
+    [
+        (0, 10, 1, [5]),
+        (0, 10, 3, [2, 5, 7]),
+        (4, 5, 3, [4]),
+        (-6, 0, 2, [-4, -2]),
+    ],
+)
+def test_probes(lower, upper, workers, expected):
+    assert probes(lower, upper, workers) == expected
+
+
+def test_objective_bounds():
+    model = MyModel()
+    model.compile(("minimize", model.total))
+    bounds = _objective_bounds(("minimize", model.total), 3, 30, "default")
+    assert [to_str(c) for c in bounds] == ["(total >= 3)", "(total <= 30)"]
+    assert _objective_bounds(("satisfy",), 3, None, "default") == []
+
+
+def test_unknown_strategy():
+    model = MyModel()
+    with pytest.raises(ValueError, match="strategy"):
+        model.solve_minimize(model.total, strategy="binary")
+
+
+def test_bisect_requires_bound():
+    model = MyModel()
+    with pytest.raises(ValueError, match="lower_bound"):
+        model.solve_minimize(model.total, strategy="bisect")
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_bisect_minimize(workers):
+    model = MyModel()
+    result = model.solve_minimize(model.total, lower_bound=0, strategy="bisect", workers=workers)
+    assert result["total"] == 12
+    assert result.original.status.name == "OPTIMAL_SOLUTION"
+    assert result.original.statistics["lower_bound"] == result.original.statistics["upper_bound"] == 12
+
+
+def test_bisect_maximize_branch():
+    model = MyModel()
+    result = model.branch(model.a[3] < 5).solve_maximize(model.total, upper_bound=40, strategy="bisect", workers=2)
+    assert result["total"] == 28
+    assert result.original.statistics["upper_bound"] == 28
+
+
+def test_known_bounds():
+    model = MyModel()
+    result = model.solve_minimize(model.total, lower_bound=15)
+    assert result["total"] == 15
@@ -0,0 +1,219 @@
+import enum
+from datetime import timedelta
+from types import SimpleNamespace
+
+import minizinc
+import numpy as np
+import pytest
+from minizinc import Status
+
+import zython as zn
+from zython.solver import cache as cache_module
+from zython.solver.cache import get_result_cache, solve_cached
+
+
+class Colour(enum.Enum):
+    red = 1
+    green = 2
+
+
+def _result(status=Status.SATISFIED, x=1):
+    return minizinc.Result(status, SimpleNamespace(x=x, _output_item=""), {"nodes": 10})
+
+
+class Solver:
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.result
+
+
+@pytest.fixture(autouse=True)
+def solver_version(monkeypatch):
+    versions = {"gecode": "6.3.0", "chuffed": "0.13.1"}
+    monkeypatch.setattr(cache_module, "_solver_version", versions.get)
+    return versions
+
+
+@pytest.fixture
+def cache():
+    cache = zn.ResultCache(maxsize=2)
+    zn.set_result_cache(cache)
+    yield cache
+    zn.set_result_cache(None)
+
+
+def test_key():
+    cache = zn.ResultCache()
+    key = cache.key("var 1..3: x;", {"n": 3, "s": {3, 1, 2}}, "gecode", None, all_solutions=False)
+    assert key == cache.key("var 1..3: x;", {"s": {1, 2, 3}, "n": 3}, "gecode", None, timeout=timedelta(1))
+    assert key != cache.key("var 1..3: x;", {"n": 3, "s": {1, 2, 3}}, "chuffed", None)
+    assert key != cache.key("var 1..3: x;", {"n": 3, "s": {1, 2, 3}}, "gecode", None, random_seed=1)
+    assert key != cache.key("var 1..3: x;", {"n": 4, "s": {1, 2, 3}}, "gecode", None)
+    assert cache.key("", {"c": Colour}, "gecode", None) == cache.key("", {"c": Colour}, "gecode", None)
+
+
+def test_key_of_numpy_array():
+    cache = zn.ResultCache()
+    first = np.arange(5000)
+    second = first.copy()
+    second[2500] = -1
+    assert repr(first) == repr(second)
+    assert cache.key("", {"a": first}, "gecode", None) != cache.key("", {"a": second}, "gecode", None)
+    assert cache.key("", {"a": first}, "gecode", None) == cache.key("", {"a": np.arange(5000)}, "gecode", None)
+    assert cache.key("", {"a": first}, "gecode", None) != cache.key("", {"a": first.reshape(50, 100)}, "gecode", None)
+
+
+def test_key_of_inexact_data():
+    cache = zn.ResultCache()
+    assert cache.key("", {"a": object()}, "gecode", None) is None
+    assert cache.key("", {}, "unknown_solver", None) is None
+
+
+def test_key_of_solver_version(solver_version):
+    cache = zn.ResultCache()
+    key = cache.key("", {}, "gecode", None)
+    solver_version["gecode"] = "6.4.0"
+    assert cache.key("", {}, "gecode", None) != key
+
+
+def test_inexact_data_is_skipped(cache):
+    solver = Solver(_result())
+    for _ in range(2):
+        solve_cached(solver, "satisfy", "src", {"a": object()}, "gecode", None, {})
+    assert solver.calls == 2
+    assert cache.stats.skipped == 2
+
+
+@pytest.mark.parametrize(
+    "n_processes, random_seed, allowed, cached",
+    [
+        (None, None, False, True),
+        (1, None, False, True),
+        (4, None, False, False),
+        (4, 1, False, True),
+        (4, None, True, True),
+    ],
+)
+def test_nondeterministic(n_processes, random_seed, allowed, cached):
+    cache = zn.ResultCache(allow_nondeterministic=allowed)
+    assert (cache.key("", {}, "gecode", n_processes, random_seed=random_seed) is not None) == cached
+
+
+def test_get(cache):
+    key = cache.key("src", {}, "gecode", None)
+    assert cache.get(key) is None
+    cache.put(key, _result())
+    result = cache.get(key)
+    assert result.solution.x == 1
+    assert result.statistics == {"nodes": 10, "cached": True}
+    assert cache.stats == (1, 1, 0, 0)
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_lru(cache):
+    cache.put("a", _result(x=1))
+    cache.put("b", _result(x=2))
+    cache.get("a")
+    cache.put("c", _result(x=3))
+    assert cache.get("b") is None
+    assert cache.get("a").solution.x == 1
+    assert cache.stats.evictions == 1
+
+
+def test_ttl():
+    cache = zn.ResultCache(ttl=timedelta(seconds=-1))
+    cache.put("a", _result())
+    assert cache.get("a") is None
+    assert cache.stats.evictions == 1
+
+
+def test_disk(tmp_path):
+    zn.ResultCache(directory=tmp_path).put("a", _result(x=Colour.green))
+    cache = zn.ResultCache(directory=tmp_path)
+    result = cache.get("a")
+    assert result.solution.x is Colour.green
+    assert result.status == Status.SATISFIED
+    cache.clear()
+    assert cache.get("a") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_disk_size(tmp_path):
+    cache = zn.ResultCache(maxsize=0, directory=tmp_path, max_bytes=1)
+    cache.put("a", _result())
+    assert list(tmp_path.iterdir()) == []
+    assert cache.get("a") is None
+
+
+def test_damaged_file(tmp_path):
+    (tmp_path / "a.pickle").write_bytes(b"not a pickle")
+    assert zn.ResultCache(directory=tmp_path).get("a") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_max_bytes_without_directory():
+    with pytest.raises(ValueError):
+        zn.ResultCache(max_bytes=100)
+
+
+def test_solve_cached(cache):
+    solver = Solver(_result())
+    for _ in range(3):
+        result = solve_cached(solver, "satisfy", "src", {}, "gecode", None, {"all_solutions": False})
+    assert solver.calls == 1
+    assert result.statistics["cached"]
+    assert cache.stats == (2, 1, 0, 0)
+
+
+@pytest.mark.parametrize(
+    "status, method, all_solutions",
+    [(Status.SATISFIED, "minimize", False), (Status.SATISFIED, "satisfy", True), (Status.UNKNOWN, "satisfy", False)],
+)
+def test_incomplete_result(cache, status, method, all_solutions):
+    solver = Solver(_result(status))
+    for _ in range(2):
+        solve_cached(solver, method, "src", {}, "gecode", None, {"all_solutions": all_solutions})
+    assert solver.calls == 2
+
+
+def test_skipped(cache):
+    solver = Solver(_result())
+    for _ in range(2):
+        solve_cached(solver, "satisfy", "src", {}, "gecode", 4, {})
+    assert solver.calls == 2
+    assert cache.stats.skipped == 2
+
+
+def test_disabled():
+    assert get_result_cache() is None
+    solver = Solver(_result())
+    solve_cached(solver, "satisfy", "src", {}, "gecode", None, {})
+    solve_cached(solver, "satisfy", "src", {}, "gecode", None, {})
+    assert solver.calls == 2
+
+
+class MyModel(zn.Model):
+    def __init__(self, n):
+        self.n = zn.par(n)
+        self.x = zn.var(range(10))
+        self.constraints = [self.x > self.n]
+
+
+def test_model(cache):
+    first = MyModel(3).solve_satisfy()
+    second = MyModel(3).solve_satisfy()
+    assert second["x"] == first["x"]
+    assert second.original.statistics["cached"]
+    assert cache.stats.hits == 1
+
+
+def test_hit_without_solver(cache):
+    model = MyModel(3)
+    src = model.compile(("satisfy",))
+    cache.put(cache.key(src, model._instance_data(), "gecode", None), _result(x=7))
+    assert MyModel(3).solve_satisfy()["x"] == 7
+    assert cache.stats.hits == 1
@@ -0,0 +1,95 @@
+import enum
+import json
+from datetime import timedelta
+from types import SimpleNamespace
+
+import minizinc
+import pytest
+
+import zython as zn
+from zython.solver.checkpoint import Checkpoint, load, model_name
+
+
+class Colour(enum.Enum):
+    red = 1
+
+
+class MyModel(zn.Model):
+    def __init__(self):
+        self.a = zn.Array(zn.var(range(1, 10)), shape=4)
+        self.total = zn.var(range(40))
+        self.constraints = [zn.alldifferent(self.a), self.a[0] + self.a[1] >= 9, self.total == zn.sum(self.a)]
+
+
+def _save(path, model, objective_value=20, elapsed=0.0, timeout=None):
+    options = dict(solver="gecode", n_processes=None, optimisation_level=None, random_seed=None, timeout=timeout)
+    checkpoint = Checkpoint(path, model_name(model), "minimize", "total", options, elapsed)
+    solution = SimpleNamespace(a=[9, 8, 2, 1], total=objective_value, objective=objective_value, s={1}, c=Colour.red)
+    checkpoint.save(minizinc.Result(minizinc.Status.SATISFIED, solution, {}), 12)
+
+
+def test_save_and_load(tmp_path):
+    path = tmp_path / "run.json"
+    _save(path, MyModel())
+    data = load(path)
+    assert data["model"] == "tests.solver.test_checkpoint.MyModel"
+    assert data["method"] == "minimize"
+    assert data["objective"] == "total"
+    assert data["status"] == "SATISFIED"
+    assert data["objective_value"] == 20
+    assert data["bound"] == 12
+    assert data["solution"] == {"a": [9, 8, 2, 1], "total": 20}
+    assert [p.name for p in tmp_path.iterdir()] == ["run.json"]
+
+
+def test_load_not_checkpoint(tmp_path):
+    path = tmp_path / "run.json"
+    path.write_text(json.dumps({"a": 1}))
+    with pytest.raises(ValueError):
+        load(path)
+
+
+def test_resume_another_model(tmp_path):
+    class AnotherModel(zn.Model):
+        def __init__(self):
+            self.x = zn.var(range(3))
+
+    path = tmp_path / "run.json"
+    _save(path, AnotherModel())
+    with pytest.raises(ValueError, match="AnotherModel"):
+        MyModel().resume(path)
+
+
+def test_resume_spent_timeout(tmp_path):
+    path = tmp_path / "run.json"
+    _save(path, MyModel(), elapsed=10.0, timeout=5.0)
+    with pytest.raises(ValueError, match="timeout"):
+        MyModel().resume(path)
+
+
+def test_checkpoint(tmp_path):
+    path = tmp_path / "run.json"
+    model = MyModel()
+    result = model.solve_minimize(model.total, checkpoint=path, timeout=timedelta(seconds=30))
+    data = load(path)
+    assert data["status"] == "OPTIMAL_SOLUTION"
+    assert data["objective_value"] == result["total"] == 12
+    assert data["options"]["timeout"] == 30
+
+
+def test_resume(tmp_path):
+    path = tmp_path / "run.json"
+    _save(path, MyModel())
+    result = MyModel().resume(path)
+    assert result["total"] == 12
+    data = load(path)
+    assert data["status"] == "OPTIMAL_SOLUTION"
+    assert data["objective_value"] == 12
+
+
+def test_resume_branch(tmp_path):
+    path = tmp_path / "run.json"
+    model = MyModel()
+    _save(path, model)
+    result = model.branch(model.a[0] == 9).resume(path)
+    assert result["total"] == 15
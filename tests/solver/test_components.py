@@ -0,0 +1,85 @@
+import pytest
+
+import zython as zn
+from zython.solver.components import decompose
+
+
+class MyModel(zn.Model):
+    def __init__(self):
+        self.n = zn.par(3)
+        self.x = zn.var(range(5))
+        self.y = zn.var(range(5))
+        self.a = zn.Array(zn.var(range(4)), shape=2)
+        self.free = zn.var(range(2))
+        self.s = zn.var(self.x + self.y)
+        self.constraints = [self.x < self.y, self.a[0] + self.a[1] == self.n]
+
+
+def _decompose(model, *how_to_solve):
+    model.compile(how_to_solve)
+    return decompose(model, model.constraints, how_to_solve)
+
+
+def test_components():
+    model = MyModel()
+    components = _decompose(model, "maximize", model.s - model.a[0])
+    assert [c.names for c in components] == [["x", "y", "free", "s"], ["a"]]
+    assert components[0].src == (
+        " int: n;\n"
+        "var 0..4: x;\n"
+        "var 0..4: y;\n"
+        "var 0..1: free;\n"
+        "var int: s;\n"
+        "constraint (x < y);\n"
+        "constraint (s == (x + y));\n"
+        "solve maximize s;"
+    )
+    assert components[1].src == (
+        " int: n;\narray[0..1] of var 0..3: a;\nconstraint (n == (a[0] + a[1]));\nsolve maximize (0 - a[0]);"
+    )
+
+
+def test_component_without_objective():
+    model = MyModel()
+    components = _decompose(model, "minimize", model.x)
+    assert [c.method for c in components] == ["minimize", "satisfy"]
+
+
+def test_not_separable_objective():
+    model = MyModel()
+    assert _decompose(model, "minimize", model.x * model.a[0]) is None
+
+
+def test_single_component():
+    model = MyModel()
+    model.constraints.append(model.y != model.a[1])
+    assert _decompose(model, "satisfy") is None
+
+
+def test_solve_maximize():
+    model = MyModel()
+    result = model.solve_maximize(model.s - model.a[0], decompose=True)
+    assert result["s"] == 7
+    assert result["a"] == [0, 3]
+    assert result.original.objective == 7
+    assert result.original.status.name == "OPTIMAL_SOLUTION"
+    assert result.original.statistics["components"] == [["x", "y", "free", "s"], ["a"]]
+
+
+def test_solve_satisfy():
+    model = MyModel()
+    result = model.branch(model.a[0] == 1).solve_satisfy(decompose=True)
+    assert result["x"] < result["y"]
+    assert result["a"] == [1, 2]
+
+
+def test_unsatisfiable():
+    model = MyModel()
+    result = model.branch(model.a[0] > 3).solve_satisfy(decompose=True)
+    assert result.original.status.name == "UNSATISFIABLE"
+
+
+def test_several_solvers():
+    model = MyModel()
+    with pytest.raises(ValueError):
+        model.solve_satisfy(decompose=True, solver=["gecode", "chuffed"])
@@ -0,0 +1,147 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import zython as zn
+from zython.solver.cpu_budget import CpuBudget, get_cpu_budget, solver_threads
+
+
+def test_fair_share():
+    budget = CpuBudget(cores=8)
+    with budget.acquire() as first:
+        assert first == 8
+        assert budget.free == 0
+    assert budget.free == 8
+    assert budget.running == 0
+
+
+def test_fair_share_split():
+    budget = CpuBudget(cores=8)
+    with budget.acquire(4) as first, budget.acquire(8) as second:
+        assert (first, second) == (4, 4)
+
+
+def _acquire_in_thread(budget, order, name, requested=None, priority=0, hold=0.0):
+    def run():
+        with budget.acquire(requested, priority) as threads:
+            order.append((name, threads))
+            time.sleep(hold)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def _wait_for_waiters(budget, n):
+    for _ in range(1000):
+        if budget.waiting == n:
+            return
+        time.sleep(0.001)
+    raise AssertionError("waiters were not enqueued")
+
+
+def test_wait_and_rebalance():
+    budget = CpuBudget(cores=4)
+    order = []
+    with budget.acquire(4):
+        thread = _acquire_in_thread(budget, order, "waiting", requested=2)
+        _wait_for_waiters(budget, 1)
+        assert order == []
+    thread.join()
+    assert order == [("waiting", 2)]
+
+
+def test_priority():
+    budget = CpuBudget(cores=2, policy="priority")
+    order = []
+    with budget.acquire(2):
+        low = _acquire_in_thread(budget, order, "low", requested=2, priority=0)
+        _wait_for_waiters(budget, 1)
+        high = _acquire_in_thread(budget, order, "high", requested=2, priority=10)
+        _wait_for_waiters(budget, 2)
+    low.join()
+    high.join()
+    assert order == [("high", 2), ("low", 2)]
+
+
+def test_max_throughput():
+    budget = CpuBudget(cores=2, policy="max_throughput")
+    with budget.acquire(8) as first, budget.acquire(8) as second:
+        assert (first, second) == (1, 1)
+        assert budget.free == 0
+
+
+def test_async():
+    budget = CpuBudget(cores=2)
+
+    async def solve(requested):
+        async with budget.acquire_async(requested) as threads:
+            await asyncio.sleep(0.01)
+            return threads
+
+    async def main():
+        return await asyncio.gather(solve(2), solve(2), solve(1))
+
+    # the second and the third solves share released cores
+    assert asyncio.run(main()) == [2, 1, 1]
+    assert budget.free == 2
+
+
+def test_async_cancel():
+    budget = CpuBudget(cores=1)
+
+    async def main():
+        async with budget.acquire_async(1):
+            task = asyncio.create_task(budget.acquire_async(1).__aenter__())
+            await asyncio.sleep(0.01)
+            assert budget.waiting == 1
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            assert budget.waiting == 0
+
+    asyncio.run(main())
+    assert budget.free == 1
+
+
+@pytest.mark.parametrize("kwargs", [dict(policy="unknown"), dict(cores=2, min_threads=3), dict(min_threads=0)])
+def test_invalid(kwargs):
+    with pytest.raises(ValueError):
+        CpuBudget(**kwargs)
+
+
+def test_solve_with_budget():
+    class MyModel(zn.Model):
+        def __init__(self):
+            self.a = zn.var(range(10))
+            self.constraints = [self.a > 5]
+
+    zn.set_cpu_budget(zn.CpuBudget(cores=2))
+    try:
+        result = MyModel().solve_satisfy(n_processes=8)
+        assert result["a"] > 5
+        assert get_cpu_budget().free == 2
+    finally:
+        zn.set_cpu_budget(None)
+
+
+def test_not_more_than_requested():
+    budget = CpuBudget(cores=4, min_threads=2)
+    with budget.acquire(1) as threads:
+        assert threads == 1
+        assert budget.free == 3
+
+
+def test_default_threads_of_solver():
+    zn.set_cpu_budget(zn.CpuBudget(cores=4))
+    try:
+        with solver_threads(SimpleNamespace(stdFlags=["-p"]), None) as threads:
+            assert threads is None
+            assert get_cpu_budget().free == 3
+        with solver_threads(SimpleNamespace(stdFlags=["-p"]), 2) as threads:
+            assert threads == 2
+    finally:
+        zn.set_cpu_budget(None)
@@ -0,0 +1,82 @@
+import pytest
+
+import zython as zn
+from zython._compile.zinc.to_str import to_str
+from zython.solver.partition import _chunks
+
+
+class MyModel(zn.Model):
+    def __init__(self):
+        self.x = zn.var(range(3))
+        self.a = zn.Array(zn.var(range(1, 6)), shape=3)
+        self.constraints = [zn.alldifferent(self.a), self.x < self.a[0]]
+
+
+def _parts(model, split, split_on=None):
+    return [[to_str(c) for c in part] for part in model._split_parts(split, split_on)]
+
+
+@pytest.mark.parametrize(
+    "domain, k, expected",
+    [
+        (range(10), 3, [range(0, 4), range(4, 7), range(7, 10)]),
+        (range(1, 3), 2, [range(1, 2), range(2, 3)]),
+    ],
+)
+def test_chunks(domain, k, expected):
+    assert _chunks(domain, k) == expected
+
+
+def test_split_on_var():
+    model = MyModel()
+    assert _parts(model, 2, model.x) == [["((x >= 0) /\\ (x <= 1))"], ["(x == 2)"]]
+
+
+def test_split_on_array():
+    model = MyModel()
+    assert _parts(model, 10, model.a) == [
+        [f"(a[0] == {i})", cond]
+        for i in range(1, 6)
+        for cond in ["((a[1] >= 1) /\\ (a[1] <= 3))", "((a[1] >= 4) /\\ (a[1] <= 5))"]
+    ]
+
+
+def test_split_default():
+    model = MyModel()
+    # a has smaller domain per constraint than x
+    assert _parts(model, 3) == [
+        ["((a[0] >= 1) /\\ (a[0] <= 2))"],
+        ["((a[0] >= 3) /\\ (a[0] <= 4))"],
+        ["(a[0] == 5)"],
+    ]
+
+
+def test_split_unsupported():
+    class FloatModel(zn.Model):
+        def __init__(self):
+            self.f = zn.var(float)
+
+    model = FloatModel()
+    with pytest.raises(ValueError):
+        model._split_parts(2, model.f)
+
+
+def test_all_solutions():
+    model = MyModel()
+    expected = model.solve_satisfy(all_solutions=True)
+    result = model.solve_satisfy(all_solutions=True, split=4)
+    assert len(result) == len(expected) == 144
+    assert sorted(map(tuple, result._solution)) == sorted(map(tuple, expected._solution))
+    assert result.original.statistics["partitions"] == 4
+
+
+def test_first_solution():
+    model = MyModel()
+    result = model.solve_satisfy(split=3, split_on=model.a[1])
+    assert result["x"] < result["a"][0]
+
+
+def test_unsatisfiable():
+    model = MyModel()
+    result = model.branch(model.x > 2).solve_satisfy(split=2)
+    assert result.original.status.name == "UNSATISFIABLE"
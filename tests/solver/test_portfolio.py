@@ -0,0 +1,111 @@
+from types import SimpleNamespace
+
+import minizinc
+import pytest
+from minizinc import Status
+
+import zython as zn
+from zython.solver import portfolio
+
+
+class MyModel(zn.Model):
+    def __init__(self):
+        self.a = zn.var(range(10))
+        self.b = zn.var(range(10))
+        self.constraints = [self.a + self.b == 12]
+
+
+def test_satisfy():
+    result = MyModel().solve_satisfy(solver=["gecode", "chuffed"])
+    assert result["a"] + result["b"] == 12
+    assert result.solver in ("gecode", "chuffed")
+
+
+def test_minimize():
+    model = MyModel()
+    result = model.solve_minimize(model.a, solver=["gecode", "chuffed"])
+    assert result["a"] == 3
+    assert result.original.status == Status.OPTIMAL_SOLUTION
+
+
+def test_unknown_solvers_are_skipped():
+    result = MyModel().solve_satisfy(solver=["unknown_solver", "gecode"])
+    assert result.solver == "gecode"
+
+
+def test_no_solver_available():
+    with pytest.raises(LookupError):
+        MyModel().solve_satisfy(solver=["unknown_solver"])
+
+
+def _result(status, objective=None):
+    solution = None if objective is None else SimpleNamespace(objective=objective)
+    return minizinc.Result(status, solution, {})
+
+
+@pytest.mark.parametrize(
+    "status, method, all_solutions, expected",
+    [
+        (Status.SATISFIED, "satisfy", False, True),
+        (Status.SATISFIED, "satisfy", True, False),
+        (Status.SATISFIED, "minimize", False, False),
+        (Status.OPTIMAL_SOLUTION, "minimize", False, True),
+        (Status.UNSATISFIABLE, "maximize", False, True),
+        (Status.UNKNOWN, "satisfy", False, False),
+    ],
+)
+def test_is_final(status, method, all_solutions, expected):
+    assert portfolio._is_final(_result(status, 1), method, all_solutions) is expected
+
+
+@pytest.mark.parametrize("method, expected", [("minimize", "b"), ("maximize", "c"), ("satisfy", "a")])
+def test_best(method, expected):
+    finished = [
+        ("unknown", _result(Status.UNKNOWN)),
+        ("a", _result(Status.SATISFIED, 5)),
+        ("b", _result(Status.SATISFIED, 3)),
+        ("c", _result(Status.SATISFIED, 7)),
+    ]
+    assert portfolio._best(finished, method)[0] == expected
+
+
+class FakeInstance:
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.kwargs = None
+
+    async def solve_async(self, **kwargs):
+        self.kwargs = kwargs
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def _solver(*flags):
+    return SimpleNamespace(id="fake", name="fake", version="1", tags=[], stdFlags=list(flags))
+
+
+def test_unsupported_flags_are_filtered():
+    parallel = FakeInstance(_result(Status.UNKNOWN))
+    sequential = FakeInstance(_result(Status.UNKNOWN))
+    instances = {"parallel": (_solver("-p", "-r"), parallel), "sequential": (_solver(), sequential)}
+    portfolio.solve(instances, "satisfy", processes=4, random_seed=1)
+    assert parallel.kwargs == {"processes": 4, "random_seed": 1}
+    assert sequential.kwargs == {"processes": None}
+
+
+def test_all_solvers_failed():
+    instances = {
+        "a": (_solver(), FakeInstance(error=minizinc.MiniZincError(message="a failed"))),
+        "b": (_solver(), FakeInstance(error=ValueError("b failed"))),
+    }
+    with pytest.raises(zn.PortfolioError) as error:
+        portfolio.solve(instances, "satisfy")
+    assert set(error.value.errors) == {"a", "b"}
+    assert isinstance(error.value.errors["b"], ValueError)
+
+
+def test_single_solver_error_is_raised():
+    with pytest.raises(ValueError):
+        portfolio.solve({"a": (_solver(), FakeInstance(error=ValueError("failed")))}, "satisfy")
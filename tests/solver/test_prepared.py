@@ -0,0 +1,75 @@
+import hashlib
+
+import pytest
+
+import zython as zn
+from zython.solver import prepared
+from zython.solver.prepared import InstancePool
+
+
+def _fill(pool, *keys, size=10):
+    for key in keys:
+        pool._put(key, object(), size)
+
+
+def test_take_and_put():
+    pool = InstancePool()
+    _fill(pool, ("a", "gecode"), ("a", "gecode"))
+    assert pool.stats == (0, 0, 0, 2, 20)
+    assert pool._take(("a", "gecode")) is not None
+    assert pool._take(("a", "chuffed")) is None
+    assert pool.stats == (1, 1, 0, 1, 10)
+    assert pool._take(("a", "gecode")) is not None
+    assert pool._sizes == {}
+
+
+def test_lru():
+    pool = InstancePool(maxsize=2)
+    _fill(pool, ("a", "gecode"), ("b", "gecode"))
+    pool._put(("a", "gecode"), pool._take(("a", "gecode")), 10)
+    _fill(pool, ("c", "gecode"))
+    assert pool._take(("b", "gecode")) is None
+    assert pool.stats.evictions == 1
+    assert pool.stats.instances == 2
+
+
+def test_max_bytes():
+    pool = InstancePool(max_bytes=25)
+    _fill(pool, ("a", "gecode"), ("b", "gecode"), ("c", "gecode"))
+    assert pool.stats.bytes == 20
+    assert pool._take(("a", "gecode")) is None
+
+
+def test_evict():
+    pool = InstancePool()
+    key = (hashlib.sha256(b"var 1..3: x;").hexdigest(), "gecode")
+    _fill(pool, key, key, ("other", "gecode"))
+    pool.evict("var 1..3: x;")
+    assert pool._take(key) is None
+    assert pool.stats.instances == 1
+    pool.evict()
+    assert pool.stats.instances == 0
+    assert pool.stats.evictions == 0
+    assert pool._sizes == {}
+
+
+def test_negative_maxsize():
+    with pytest.raises(ValueError):
+        InstancePool(maxsize=-1)
+
+
+def test_reuse():
+    class MyModel(zn.Model):
+        def __init__(self, n):
+            self.n = zn.par(n)
+            self.x = zn.var(range(10))
+            self.constraints = [self.x > self.n]
+
+    prepared.evict()
+    before = prepared.stats()
+    assert MyModel(3).solve_satisfy()["x"] > 3
+    assert MyModel(5).solve_satisfy()["x"] > 5
+    after = prepared.stats()
+    assert after.misses - before.misses == 1
+    assert after.hits - before.hits == 1
+    assert after.instances == 1
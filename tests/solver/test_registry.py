@@ -0,0 +1,69 @@
+import minizinc
+import pytest
+
+from zython.solver import registry
+from zython.solver.registry import SolverCapabilities, SolverRegistry
+
+
+def test_lookup_is_cached():
+    assert registry.lookup("gecode") is registry.lookup("gecode")
+
+
+def test_unknown_solver():
+    with pytest.raises(LookupError):
+        registry.lookup("unknown_solver")
+
+
+def test_refresh():
+    before = registry.lookup("gecode")
+    registry.refresh()
+    assert registry.lookup("gecode").id == before.id
+
+
+def test_gecode_capabilities():
+    capabilities = registry.capabilities("gecode")
+    assert capabilities.id == "org.gecode.gecode"
+    assert capabilities.parallel
+    assert capabilities.all_solutions
+
+
+def test_capabilities_from_solver():
+    solver = minizinc.Solver(
+        name="Test", version="1.0", id="org.test.test", tags=["cp", "float"], stdFlags=["-a", "-p"]
+    )
+    capabilities = SolverCapabilities.from_solver(solver)
+    assert capabilities.parallel
+    assert capabilities.all_solutions
+    assert capabilities.intermediate_solutions
+    assert capabilities.float
+    assert not capabilities.random_seed
+    assert not capabilities.free_search
+
+
+def test_no_driver():
+    saved, minizinc.default_driver = minizinc.default_driver, None
+    try:
+        with pytest.raises(minizinc.ConfigurationError):
+            SolverRegistry().lookup("gecode")
+    finally:
+        minizinc.default_driver = saved
+
+
+class FakeDriver:
+    def __init__(self):
+        self.refreshed = 0
+
+    def available_solvers(self, refresh=False):
+        self.refreshed += refresh
+        solver = minizinc.Solver(name="Test", version=str(self.refreshed), id="org.test.test", stdFlags=["-a"])
+        return {"test": [solver], "org.test.test": [solver]}
+
+
+def test_driver_solvers_are_used():
+    driver = FakeDriver()
+    solvers = SolverRegistry(driver)
+    assert solvers.tags() == ("test", "org.test.test")
+    assert solvers.capabilities("test").version == "0"
+    solvers.refresh()
+    assert driver.refreshed == 1
+    assert solvers.capabilities("test").version == "1"
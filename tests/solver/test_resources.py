@@ -0,0 +1,103 @@
+import asyncio
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+import minizinc
+import pytest
+
+import zython as zn
+from zython.solver import resources
+from zython.solver.resources import governed, with_usage
+
+BUSY = "import time\nstarted = time.process_time()\nwhile time.process_time() - started < {}: pass"
+
+
+async def _run(governor, code):
+    proc = await asyncio.create_subprocess_exec(sys.executable, "-c", code)
+    governor.attach(proc)
+    return await proc.wait()
+
+
+def _solve(limits, code):
+    with governed(limits, []) as governor:
+        code = asyncio.run(_run(governor, code))
+    return governor, code
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"memory": 0}, {"cpu": timedelta(0)}, {"flatten_time": timedelta(seconds=-1)}])
+def test_invalid_limits(kwargs):
+    with pytest.raises(ValueError):
+        zn.Limits(**kwargs)
+
+
+def test_usage():
+    governor, code = _solve(None, "data = bytearray(64 * 2**20)\n" + BUSY.format(0.3))
+    assert code == 0
+    usage = governor.usage
+    assert usage.user + usage.system >= timedelta(seconds=0.2)
+    assert usage.wall >= timedelta(seconds=0.3)
+    assert usage.peak_rss >= 64 * 2**20
+
+
+def test_cpu_limit():
+    with pytest.raises(zn.LimitExceeded, match="cpu"):
+        _solve(zn.Limits(cpu=timedelta(seconds=0.2)), BUSY.format(10))
+
+
+def test_memory_limit():
+    governor, code = _solve(zn.Limits(memory=512 * 2**20), "import time\ntime.sleep(0.2)\nbytearray(2**31)")
+    assert code != 0
+    assert governor.exceeded is None
+
+
+def test_flatten_time():
+    with pytest.raises(zn.LimitExceeded, match="flattening"):
+        _solve(zn.Limits(flatten_time=timedelta(seconds=0.2)), "import time\ntime.sleep(10)")
+
+
+def test_flattened():
+    code = f"import subprocess\nsubprocess.run([{sys.executable!r}, '-c', 'import time; time.sleep(0.6)'])"
+    governor, code = _solve(zn.Limits(flatten_time=timedelta(seconds=0.4)), code)
+    assert code == 0
+    assert governor.exceeded is None
+
+
+def test_without_processes():
+    with governed(None, "gecode") as governor:
+        pass
+    result = minizinc.Result(minizinc.Status.SATISFIED, None, {})
+    assert with_usage(result, governor.usage) is result
+
+
+def test_not_governed_without_limits(monkeypatch):
+    monkeypatch.setattr(minizinc, "default_driver", object())
+    with governed(None, "gecode") as governor:
+        assert resources._governor.get() is None
+    assert governor.usage is None
+
+
+def test_usage_accounting(monkeypatch):
+    monkeypatch.setattr(minizinc, "default_driver", None)
+    zn.set_usage_accounting(True)
+    try:
+        with governed(None, "gecode") as governor:
+            assert resources._governor.get() is governor
+    finally:
+        zn.set_usage_accounting(False)
+
+
+def test_driver_is_restored(monkeypatch):
+    driver = minizinc.Driver.__new__(minizinc.Driver)
+    driver._executable = Path("/usr/bin/minizinc")
+    monkeypatch.setattr(minizinc, "default_driver", driver)
+    zn.set_usage_accounting(True)
+    try:
+        with governed(None, "gecode"):
+            with governed(None, "gecode"):
+                assert isinstance(minizinc.default_driver, resources.GovernedDriver)
+            assert isinstance(minizinc.default_driver, resources.GovernedDriver)
+            assert minizinc.default_driver.executable == driver.executable
+        assert minizinc.default_driver is driver
+    finally:
+        zn.set_usage_accounting(False)
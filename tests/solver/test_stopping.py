@@ -0,0 +1,97 @@
+import asyncio
+import types
+from datetime import timedelta
+
+import minizinc
+import pytest
+
+import zython as zn
+from zython.solver import stopping
+from zython.solver.stopping import gap
+
+
+class MyModel(zn.Model):
+    def __init__(self):
+        self.a = zn.Array(zn.var(range(1, 10)), shape=4)
+        self.total = zn.var(range(40))
+        self.constraints = [zn.alldifferent(self.a), self.a[0] + self.a[1] >= 9, self.total == zn.sum(self.a)]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, {"gap": -0.1}, {"stall": timedelta(0)}],
+)
+def test_invalid_criteria(kwargs):
+    with pytest.raises(ValueError):
+        zn.StopWhen(**kwargs)
+
+
+@pytest.mark.parametrize(
+    "objective, bound, expected", [(10, 8, 0.2), (-10, -8, 0.2), (5, 5, 0.0), (0, 1, float("inf"))]
+)
+def test_gap(objective, bound, expected):
+    assert gap(objective, bound) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "criteria, objective, bound, maximize, expected",
+    [
+        (zn.StopWhen(target=10), 10, None, False, "target"),
+        (zn.StopWhen(target=10), 9, None, True, None),
+        (zn.StopWhen(gap=0.1), 10, 9, False, "gap"),
+        (zn.StopWhen(gap=0.1), 10, 8, False, None),
+        (zn.StopWhen(gap=0.1), 10, None, False, None),
+    ],
+)
+def test_reason(criteria, objective, bound, maximize, expected):
+    assert criteria.reason(objective, bound, maximize) == expected
+
+
+def test_stop_on_target():
+    model = MyModel()
+    result = model.solve_minimize(model.total, stop_when=zn.StopWhen(target=30))
+    assert result["total"] <= 30
+    assert result.original.statistics["stopped"] == "target"
+
+
+def test_stop_on_gap_with_known_bound():
+    model = MyModel()
+    result = model.branch(model.a[3] < 5).solve_maximize(model.total, upper_bound=100, stop_when=zn.StopWhen(gap=10.0))
+    assert result.original.statistics["stopped"] == "gap"
+
+
+def test_not_stopped():
+    model = MyModel()
+    result = model.solve_minimize(model.total, stop_when=zn.StopWhen(target=0, stall=timedelta(seconds=30)))
+    assert result["total"] == 12
+    assert result.original.status.name == "OPTIMAL_SOLUTION"
+    assert "stopped" not in result.original.statistics
+
+
+def test_several_solvers():
+    model = MyModel()
+    with pytest.raises(ValueError):
+        model.solve_minimize(model.total, solver=["gecode", "chuffed"], stop_when=zn.StopWhen(target=20))
+
+
+class StatusInstance:
+    # reports the first solution and then only statistics, as solvers do while they search
+    def __init__(self):
+        self.messages = 0
+
+    async def solutions(self, **kwargs):
+        yield minizinc.Result(minizinc.Status.SATISFIED, types.SimpleNamespace(objective=10), {})
+        while True:
+            await asyncio.sleep(0.02)
+            self.messages += 1
+            yield minizinc.Result(minizinc.Status.SATISFIED, None, {"nodes": self.messages})
+
+
+def test_stall_since_last_improvement():
+    inst = StatusInstance()
+    solver = minizinc.Solver(name="Test", version="1.0", id="org.test.test")
+    criteria = zn.StopWhen(stall=timedelta(seconds=0.2))
+    result = stopping.solve(inst, solver, None, criteria, maximize=False)
+    assert result.statistics["stopped"] == "stall"
+    assert result.objective == 10
+    assert inst.messages < 50
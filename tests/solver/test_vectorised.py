@@ -0,0 +1,76 @@
+import pytest
+
+import zython as zn
+from zython.solver import vectorised
+
+
+class MyModel(zn.Model):
+    def __init__(self):
+        self.a = zn.Array(zn.var(range(1, 6)), shape=4)
+        self.x = zn.var(range(10))
+        self.total = zn.var(range(40))
+        self.y = zn.var(self.x * 2)
+        self.constraints = [
+            zn.alldifferent(self.a),
+            self.a[0] + self.a[1] >= 7,
+            self.total == zn.sum(self.a),
+            zn.count(self.a, 3) == 1,
+            self.x == self.a[2] * 2 % 7,
+        ]
+
+
+def test_satisfy():
+    result = MyModel().solve_satisfy(solver="numpy")
+    assert result.solver == "numpy"
+    assert result.original.status.name == "SATISFIED"
+    assert result["a"] == [2, 5, 1, 3]
+    assert (result["x"], result["total"], result["y"]) == (2, 11, 4)
+
+
+def test_all_solutions():
+    result = MyModel().solve_satisfy(all_solutions=True, solver="numpy")
+    assert result.original.status.name == "ALL_SOLUTIONS"
+    assert len(result) == 40
+    assert all(result[i, "total"] == sum(result[i, "a"]) for i in range(len(result)))
+
+
+@pytest.mark.parametrize("method, expected", [("solve_minimize", 10), ("solve_maximize", 14)])
+def test_optimisation(method, expected):
+    model = MyModel()
+    result = getattr(model, method)(model.total, solver="numpy")
+    assert result.original.status.name == "OPTIMAL_SOLUTION"
+    assert result["objective"] == result["total"] == expected
+
+
+def test_branch():
+    model = MyModel()
+    result = model.branch(model.a[3] == 4).solve_minimize(model.x, solver="numpy")
+    assert result["a"][3] == 4
+    assert result["objective"] == 2
+
+
+def test_unsatisfiable():
+    model = MyModel()
+    result = model.branch(model.total > 14).solve_satisfy(solver="numpy")
+    assert result.original.status.name == "UNSATISFIABLE"
+    assert len(result) == 0
+
+
+def test_too_many_candidates(monkeypatch):
+    monkeypatch.setattr(vectorised, "MAX_CANDIDATES", 1000)
+    with pytest.raises(ValueError, match="assignments"):
+        MyModel().solve_satisfy(solver="numpy")
+
+
+def test_unsupported_domain():
+    class FloatModel(zn.Model):
+        def __init__(self):
+            self.x = zn.var(int)
+
+    with pytest.raises(ValueError, match="int range"):
+        FloatModel().solve_satisfy(solver="numpy")
+
+
+def test_unsupported_options():
+    with pytest.raises(ValueError):
+        MyModel().solve_satisfy(solver="numpy", split=2)
@@ -42,7 +42,25 @@ from zython.operations.functions_and_predicates import (
     table,
     implication,
 )
+from zython.operations.annotation import (
+    int_search,
+    float_search,
+    set_search,
+    seq_search,
+    restart_constant,
+    restart_linear,
+    restart_geometric,
+    restart_luby,
+    restart_none,
+)
 from zython.model import Model
+from zython.batch import solve_batch
+from zython.stacking import solve_stacked
+from zython.solver.cpu_budget import CpuBudget, set_cpu_budget
+from zython.solver.portfolio import PortfolioError
+from zython.solver.cache import CacheStats, ResultCache, set_result_cache
+from zython.solver.resources import LimitExceeded, Limits, ResourceUsage, set_usage_accounting
+from zython.solver.stopping import StopWhen
 from zython.result import as_original
 
 
@@ -0,0 +1,156 @@
+"""Incidence graph of model variables and constraints."""
+
+import math
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+from zython.operations.constraint import Constraint
+from zython.var_par.collections.array import ArrayView
+from zython.var_par.collections.set import SetVar
+from zython.var_par.get_type import is_int_range, is_range
+from zython.var_par.var import var
+
+ORDERINGS = ("most_constrained", "degree", "bandwidth")
+
+
+class ConstraintGraph:
+    """Shows which variables are used together in constraints
+
+    Every variable of the model (array variables are single nodes) is a node,
+    every constraint connects the variables it refers to.
+    Variables defined by expression, e.g. ``var(zn.sum(self.a))``, are connected with the variables of the expression.
+
+    Parameters
+    ----------
+    ir: IR
+        compiled model, variables should be named
+    constraints: Iterable
+        constraints of the model, strings added by the compiler are skipped
+    """
+
+    def __init__(self, ir, constraints: Iterable):
+        self._vars = ir.vars
+        self._ids = {id(v): name for name, v in ir.vars.items()}
+        self.scopes: List[Set[str]] = []
+        for c in constraints:
+            if isinstance(c, Constraint):
+                self._add_scope(referenced_vars(c, self._ids))
+        for name, v in ir.vars.items():
+            if isinstance(v.value, Constraint):
+                self._add_scope(referenced_vars(v.value, self._ids) | {name})
+        self.degree: Dict[str, int] = {name: 0 for name in ir.vars}
+        self.neighbours: Dict[str, Set[str]] = {name: set() for name in ir.vars}
+        for scope in self.scopes:
+            for name in scope:
+                self.degree[name] += 1
+                self.neighbours[name] |= scope - {name}
+
+    def _add_scope(self, scope: Set[str]):
+        if scope:
+            self.scopes.append(scope)
+
+    def decision_vars(self) -> List[str]:
+        """Integer variables which aren't defined by expression or fixed by value, in order of declaration"""
+        return [
+            name
+            for name, v in self._vars.items()
+            if v.value is None and (v.type is int or _is_int_range(v.type)) and not isinstance(v, SetVar)
+        ]
+
+    def components(self) -> List[List[str]]:
+        """Returns groups of variables, which are not connected by any constraint, in order of declaration"""
+        position = {name: i for i, name in enumerate(self._vars)}
+        seen: Set[str] = set()
+        result = []
+        for name in self._vars:
+            if name in seen:
+                continue
+            component = []
+            stack = [name]
+            seen.add(name)
+            while stack:
+                current = stack.pop()
+                component.append(current)
+                for n in self.neighbours[current] - seen:
+                    seen.add(n)
+                    stack.append(n)
+            result.append(sorted(component, key=position.__getitem__))
+        return result
+
+    def order(self, ordering: str) -> List[str]:
+        """Returns decision variables in the order they should be searched
+
+        Parameters
+        ----------
+        ordering: str
+            - "most_constrained": variables with smaller domain per constraint go first
+            - "degree": variables used by more constraints go first
+            - "bandwidth": reverse Cuthill-McKee order, connected variables are searched close to each other
+        """
+        names = self.decision_vars()
+        if ordering == "most_constrained":
+            return sorted(names, key=lambda n: (self._domain_size(n) / max(self.degree[n], 1), -self.degree[n]))
+        if ordering == "degree":
+            return sorted(names, key=lambda n: -self.degree[n])
+        if ordering == "bandwidth":
+            return self._reverse_cuthill_mckee(names)
+        raise ValueError(f"ordering should be one of {ORDERINGS}, but it is {ordering!r}")
+
+    def _domain_size(self, name: str) -> float:
+        t = self._vars[name].type
+        if _is_int_range(t):
+            return t.stop - t.start
+        return math.inf
+
+    def _reverse_cuthill_mckee(self, names: List[str]) -> List[str]:
+        # breadth-first traversal from the least connected variable, neighbours with smaller degree go first,
+        # variables defined by expressions are traversed, but aren't included to the result
+        position = {name: i for i, name in enumerate(self._vars)}
+
+        def key(n):
+            return self.degree[n], position[n]
+
+        searched = set(names)
+        seen: Set[str] = set()
+        order = []
+        for start in sorted(names, key=key):
+            if start in seen:
+                continue
+            seen.add(start)
+            queue = deque([start])
+            while queue:
+                current = queue.popleft()
+                if current in searched:
+                    order.append(current)
+                for n in sorted(self.neighbours[current] - seen, key=key):
+                    seen.add(n)
+                    queue.append(n)
+        return order[::-1]
+
+
+def referenced_vars(stmt, variables: Dict[int, str]) -> Set[str]:
+    """Returns names of model variables the statement refers to, ``variables`` maps id of the variable to its name"""
+    result = set()
+    stack = [stmt]
+    while stack:
+        current = stack.pop()
+        name = variables.get(id(current))
+        if name is not None:
+            result.add(name)
+        elif isinstance(current, ArrayView):
+            stack.append(current.array)
+            stack.extend(current.pos)
+        elif isinstance(current, var):
+            # parameters and local variables of comprehensions
+            continue
+        elif isinstance(current, Constraint):
+            stack.extend(current.params)
+        elif isinstance(current, (list, tuple)):
+            stack.extend(current)
+        elif isinstance(current, slice):
+            stack.extend((current.start, current.stop))
+    return result
+
+
+def _is_int_range(t) -> bool:
+    return is_range(t) and is_int_range(t)
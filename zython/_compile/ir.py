@@ -15,6 +15,7 @@ class IR:
         self._process_constraints(model)
         self._src = None
         self._how_to_solve = how_to_solve
+        self._defined = set()
 
     @property
     def vars(self):
@@ -36,6 +37,11 @@ class IR:
     def how_to_solve(self):
         return self._how_to_solve
 
+    @property
+    def defined(self):
+        """names of variables defined by expressions, which constraints are already added to the model"""
+        return self._defined
+
     def _get_vars_and_pars(self):
         _vars = {}
         _pars = {}
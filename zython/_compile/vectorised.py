@@ -0,0 +1,362 @@
+"""Evaluation of model expressions for a batch of assignments by numpy."""
+
+import itertools
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from zython._compile.ir import IR
+from zython.operations._op_codes import _Op_code
+from zython.operations.constraint import Constraint
+from zython.var_par.collections.array import ArrayMixin, ArrayPar, ArrayView
+from zython.var_par.collections.set import SetPar, SetVar
+from zython.var_par.get_type import is_int_range, is_range
+from zython.var_par.var import var
+
+
+class Evaluator:
+    """Evaluates constraints and expressions of the model for many assignments at once
+
+    Every value is a numpy array, the first axis of which is the number of the assignment,
+    values which are the same for all assignments (parameters, constants) have 1 as the size of this axis
+    or are scalars. Quantifiers and comprehensions are unrolled in python, every their item is vectorised.
+
+    Parameters
+    ----------
+    ir: IR
+        compiled model, variables should be named
+    values: dict
+        values of decision variables by name, shape of the value is ``(size, *shape of the variable)``.
+        Values of variables defined by expressions or fixed by value can be passed as well,
+        they are checked to be equal to the expression or the value.
+    size: int
+        number of assignments
+
+    Attributes
+    ----------
+    invalid: np.ndarray
+        boolean mask of assignments which can't be solutions: the value of the variable is out of its domain
+        or differs from its definition, division by zero or array index is out of bounds.
+        Undefined expressions make the whole assignment invalid, which is the same as minizinc does in the root context.
+    """
+
+    def __init__(self, ir: IR, values: Dict[str, np.ndarray], size: int):
+        self.size = size
+        self.invalid = np.zeros(size, dtype=bool)
+        self._ir = ir
+        self._values = {}
+        self._given = []
+        for name, value in values.items():
+            variable = ir.vars.get(name)
+            if variable is None:
+                raise ValueError(f"the model has no variable {name}")
+            value = np.asarray(value)
+            self._check_domain(variable, value)
+            self._values[id(variable)] = value
+            if variable.value is not None:
+                self._given.append(variable)
+
+    def __call__(self, stmt):
+        if id(stmt) in self._values:
+            return self._values[id(stmt)]
+        if isinstance(stmt, ArrayView):
+            return self._view(stmt)
+        if isinstance(stmt, var):
+            return self._var(stmt)
+        if isinstance(stmt, Constraint):
+            evaluate = _OPERATIONS.get(stmt.op)
+            if evaluate is None:
+                raise ValueError(f"{stmt.op.name} isn't supported by numpy evaluation")
+            return evaluate(self, *stmt.params)
+        if isinstance(stmt, (bool, int, float, np.generic, np.ndarray)):
+            return stmt
+        raise ValueError(f"{stmt!r} isn't supported by numpy evaluation")
+
+    def feasible(self, constraints: Iterable) -> np.ndarray:
+        """Returns boolean mask of assignments which satisfy all constraints and domains of all variables"""
+        mask = np.ones(self.size, dtype=bool)
+        for c in constraints:
+            # constraints added by the compiler as strings define variables, which are evaluated below
+            if isinstance(c, Constraint):
+                mask &= self(c)
+        return mask & self.valid()
+
+    def valid(self) -> np.ndarray:
+        """Returns boolean mask of assignments, which aren't invalid, see ``invalid``
+
+        All variables are evaluated, so domains of variables defined by expressions are checked,
+        given values of such variables should be equal to the expressions.
+        """
+        for v in self._ir.vars.values():
+            self(v)
+        for v in self._given:
+            expected = self(v.value) if isinstance(v.value, Constraint) else v.value
+            self.reject(np.not_equal(self._values[id(v)], expected))
+        return ~self.invalid
+
+    def reject(self, mask):
+        """Marks assignments as invalid"""
+        self.invalid |= mask
+
+    def scalar(self, stmt):
+        """Evaluates the expression, which should be the same for all assignments, e.g. bounds of the range"""
+        value = self(stmt)
+        if np.ndim(value) != 0:
+            raise ValueError(f"{stmt!r} should be the same for all assignments")
+        return value
+
+    def sequence(self, seq) -> np.ndarray:
+        """Evaluates the sequence as 2d array: assignments x items"""
+        if isinstance(seq, (ArrayMixin, SetVar)):
+            value = np.asarray(self(seq))
+            return value.reshape(value.shape[0], -1)
+        if isinstance(seq, SetPar):
+            seq = seq.value
+        if is_range(seq):
+            return np.arange(*self._bounds(seq))[None]
+        if isinstance(seq, (set, frozenset)):
+            return np.asarray(sorted(seq))[None]
+        return _stack([self(item) for item in seq])
+
+    def generate(self, seq, iter_var, func) -> np.ndarray:
+        """Evaluates ``func`` for every item of the sequence (or their product for several sequences),
+        returns 2d array: assignments x items
+        """
+        if isinstance(iter_var, (list, tuple)):
+            seqs, iter_vars = seq, iter_var
+        else:
+            seqs, iter_vars = (seq,), (iter_var,)
+        keys = [id(v) for v in iter_vars]
+        result = []
+        try:
+            for items in itertools.product(*(self._items(s) for s in seqs)):
+                self._values.update(zip(keys, items))
+                result.append(self(func))
+        finally:
+            for key in keys:
+                self._values.pop(key, None)
+        return _stack(result)
+
+    def _items(self, seq) -> List:
+        # python integers are kept for ranges, so array elements are accessed by basic indexing
+        if is_range(seq) or isinstance(seq, SetPar) and is_range(seq.value):
+            return list(range(*self._bounds(seq.value if isinstance(seq, SetPar) else seq)))
+        return list(self.sequence(seq).T)
+
+    def _bounds(self, r):
+        if not is_int_range(r):
+            raise ValueError("float ranges aren't supported by numpy evaluation")
+        return int(self.scalar(r.start)), int(self.scalar(r.stop))
+
+    def _var(self, v: var):
+        if isinstance(v, SetVar):
+            raise ValueError(f"set variable {v._name} isn't supported by numpy evaluation")
+        if isinstance(v.value, Constraint):
+            value = self(v.value)
+            self._check_domain(v, value)
+        elif isinstance(v, ArrayPar):
+            value = np.asarray(v.value)[None]
+        elif v.value is not None:
+            value = v.value
+        else:
+            raise ValueError(f"value of {v._name} isn't specified")
+        self._values[id(v)] = value
+        return value
+
+    def _view(self, view: ArrayView):
+        array = np.asarray(self(view.array))
+        shape = view.array._shape
+        if any(isinstance(p, slice) for p in view.pos):
+            index = tuple(
+                slice(self.scalar(p.start), self.scalar(p.stop), self.scalar(p.step))
+                if isinstance(p, slice)
+                else self.scalar(p)
+                for p in view.pos
+            )
+            return array[(slice(None),) + index]
+        index = []
+        for p, size in zip(view.pos, shape):
+            i = self(p)
+            out_of_bounds = np.less(i, 0) | np.greater_equal(i, size)
+            self.reject(out_of_bounds)
+            index.append(np.where(out_of_bounds, 0, i) if np.any(out_of_bounds) else i)
+        # parameters have single row, which is shared by all assignments
+        rows = np.arange(array.shape[0]) if array.shape[0] > 1 else 0
+        return array[(rows, *index)]
+
+    def _check_domain(self, v: var, value):
+        if not is_range(v.type):
+            return
+        stop = self.scalar(v.type.stop)
+        stop = stop - 1 if is_int_range(v.type) else stop
+        out = np.less(value, self.scalar(v.type.start)) | np.greater(value, stop)
+        if isinstance(v, ArrayMixin):
+            out = out.reshape(out.shape[0], -1).any(axis=1)
+        self.reject(out)
+
+
+def _stack(values: list) -> np.ndarray:
+    # every value is a scalar or an array of the values for every assignment
+    if not values:
+        return np.zeros((1, 0), dtype=int)
+    return np.stack(np.broadcast_arrays(*(np.reshape(v, (-1,)) for v in values)), axis=1)
+
+
+def _binary(func):
+    def evaluate(ev, left, right):
+        return func(ev(left), ev(right))
+
+    return evaluate
+
+
+def _unary(func):
+    def evaluate(ev, x):
+        return func(ev(x))
+
+    return evaluate
+
+
+def _implication(ev, left, right):
+    return np.logical_or(np.logical_not(ev(left)), ev(right))
+
+
+def _truncated_div(ev, left, right):
+    # minizinc rounds the quotient towards zero
+    a, b = ev(left), ev(right)
+    zero = np.equal(b, 0)
+    ev.reject(zero)
+    b = np.where(zero, 1, b)
+    quotient = np.abs(a) // np.abs(b)
+    return np.where(np.sign(a) * np.sign(b) < 0, -quotient, quotient), a, b
+
+
+def _floordiv(ev, left, right):
+    quotient, _, _ = _truncated_div(ev, left, right)
+    return quotient
+
+
+def _mod(ev, left, right):
+    quotient, a, b = _truncated_div(ev, left, right)
+    return a - b * quotient
+
+
+def _pow(ev, base, exponent):
+    a, b = ev(base), ev(exponent)
+    if np.issubdtype(np.result_type(a, b), np.integer):
+        negative = np.less(b, 0)
+        ev.reject(negative)
+        b = np.where(negative, 0, b)
+    return np.power(a, b)
+
+
+def _in(ev, item, collection):
+    x = ev(item)
+    if is_range(collection):
+        start, stop = collection.start, collection.stop
+        stop = ev.scalar(stop) - 1 if is_int_range(collection) else ev.scalar(stop)
+        return np.greater_equal(x, ev.scalar(start)) & np.less_equal(x, stop)
+    return np.any(ev.sequence(collection) == np.reshape(x, (-1, 1)), axis=1)
+
+
+def _reduce(func):
+    def evaluate(ev, seq, iter_var, operation):
+        if iter_var is None:
+            return func(ev.sequence(seq), axis=1)
+        return func(ev.generate(seq, iter_var, operation), axis=1)
+
+    return evaluate
+
+
+def _count(ev, seq, iter_var, operation):
+    if iter_var is None:
+        return np.sum(ev.sequence(seq) == np.reshape(ev(operation), (-1, 1)), axis=1)
+    return np.sum(ev.generate(seq, iter_var, operation), axis=1)
+
+
+def _sorted(ev, seq):
+    return np.sort(ev.sequence(seq), axis=1)
+
+
+def _alldifferent(ev, seq):
+    s = _sorted(ev, seq)
+    return np.all(s[:, 1:] != s[:, :-1], axis=1)
+
+
+def _alldifferent_except_0(ev, seq):
+    s = _sorted(ev, seq)
+    return np.all((s[:, 1:] != s[:, :-1]) | (s[:, 1:] == 0), axis=1)
+
+
+def _alldifferent_except(ev, seq, except_):
+    s = _sorted(ev, seq)
+    excluded = np.isin(s[:, 1:], ev.sequence(except_))
+    return np.all((s[:, 1:] != s[:, :-1]) | excluded, axis=1)
+
+
+def _allequal(ev, seq):
+    s = ev.sequence(seq)
+    return np.all(s == s[:, :1], axis=1)
+
+
+def _ndistinct(ev, seq):
+    s = _sorted(ev, seq)
+    return np.minimum(s.shape[1], 1) + np.sum(s[:, 1:] != s[:, :-1], axis=1)
+
+
+def _monotonic(compare):
+    def evaluate(ev, seq):
+        s = ev.sequence(seq)
+        return np.all(compare(s[:, 1:], s[:, :-1]), axis=1)
+
+    return evaluate
+
+
+def _size(ev, array, dim):
+    return array._shape[dim]
+
+
+def _table(ev, x, t):
+    rows = ev.sequence(x)
+    table = np.asarray(ev(t))[0]
+    return np.any(np.all(rows[:, None, :] == table[None], axis=2), axis=1)
+
+
+_OPERATIONS = {
+    _Op_code.add: _binary(np.add),
+    _Op_code.sub: _binary(np.subtract),
+    _Op_code.mul: _binary(np.multiply),
+    _Op_code.floordiv: _floordiv,
+    _Op_code.mod: _mod,
+    _Op_code.pow: _pow,
+    _Op_code.abs: _unary(np.abs),
+    _Op_code.eq: _binary(np.equal),
+    _Op_code.ne: _binary(np.not_equal),
+    _Op_code.lt: _binary(np.less),
+    _Op_code.gt: _binary(np.greater),
+    _Op_code.le: _binary(np.less_equal),
+    _Op_code.ge: _binary(np.greater_equal),
+    _Op_code.and_: _binary(np.logical_and),
+    _Op_code.or_: _binary(np.logical_or),
+    _Op_code.xor: _binary(np.logical_xor),
+    _Op_code.invert: _unary(np.logical_not),
+    _Op_code.implication: _implication,
+    _Op_code.in_: _in,
+    _Op_code.forall: _reduce(np.all),
+    _Op_code.exists: _reduce(np.any),
+    _Op_code.sum_: _reduce(np.sum),
+    _Op_code.product: _reduce(np.prod),
+    _Op_code.min_: _reduce(np.min),
+    _Op_code.max_: _reduce(np.max),
+    _Op_code.count: _count,
+    _Op_code.size: _size,
+    _Op_code.alldifferent: _alldifferent,
+    _Op_code.alldifferent_except_0: _alldifferent_except_0,
+    _Op_code.alldifferent_except: _alldifferent_except,
+    _Op_code.allequal: _allequal,
+    _Op_code.ndistinct: _ndistinct,
+    _Op_code.increasing: _monotonic(np.greater_equal),
+    _Op_code.strictly_increasing: _monotonic(np.greater),
+    _Op_code.decreasing: _monotonic(np.less_equal),
+    _Op_code.strictly_decreasing: _monotonic(np.less),
+    _Op_code.table: _table,
+}
@@ -9,6 +9,7 @@ from zython import var
 from zython._compile.zinc.flags import Flags
 from zython._helpers.validate import _start_stop_step_validate
 from zython.operations._op_codes import _Op_code
+from zython.operations.annotation import Annotation
 from zython.operations.constraint import Constraint
 from zython.operations.operation import Operation
 from zython.var_par.collections.array import ArrayView, ArrayMixin
@@ -37,6 +38,13 @@ def _(stmt, *, flatten_arg=False, flags_=None):
     return f"[{', '.join(to_str(s) for s in stmt)}]"
 
 
+@to_str.register
+def _(stmt: Annotation, *, flatten_arg=False, flags_=None):
+    if not stmt.params:
+        return stmt.name
+    return _call_func(stmt.name, *stmt.params, flatten_args=True, flags_=flags_)
+
+
 @to_str.register
 def _(stmt: enum.EnumMeta, *, flatten_arg=False, flags_=None):
     return stmt.__name__
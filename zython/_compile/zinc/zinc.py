@@ -1,6 +1,6 @@
 from collections import deque
 from functools import singledispatch
-from typing import Set
+from typing import AbstractSet, Optional, Set
 
 from zython._compile.ir import IR
 from zython._compile.zinc.flags import Flags, FLAG_PROCESSORS
@@ -12,14 +12,37 @@ from zython.var_par.collections.set import SetVar, SetPar
 from zython.var_par.get_type import is_range, is_int_range, is_enum
 
 
-def to_zinc(ir: IR):
+def to_zinc(ir: IR, output: Optional[AbstractSet[str]] = None):
+    """Compiles the model
+
+    Parameters
+    ----------
+    ir: IR
+        the model to compile
+    output: set of str, optional
+        names of variables, which are printed by the solver,
+        if it isn't set, all variables except ones created with ``output=False`` are printed
+    """
     result: SourceCode = deque()
     flags: Set[Flags] = set()
     _process_enums(ir, result, flags)
     _process_pars(ir, result, flags)
-    _process_vars(ir, result, flags)
+    _process_vars(ir, result, flags, output)
     _process_constraints(ir, result, flags)
-    _process_how_to_solve(ir, result)
+    if ir.how_to_solve is not None:
+        _process_how_to_solve(ir, result)
+    _process_flags(flags, result)
+    return "\n".join(result)
+
+
+def constraints_to_zinc(constraints, how_to_solve=None, annotations=()):
+    """Compiles constraints added to already compiled model, variables should be named by ``IR`` before"""
+    result: SourceCode = deque()
+    flags: Set[Flags] = set()
+    for c in constraints:
+        result.append(f"constraint {to_str(c, flags_=flags)};")
+    if how_to_solve is not None:
+        result.append(solve_item(how_to_solve, annotations))
     _process_flags(flags, result)
     return "\n".join(result)
 
@@ -34,11 +57,11 @@ def _process_enums(ir: IR, result: SourceCode, flags: Set[Flags]) -> None:
         result.append(f"enum {e.__name__};")
 
 
-def _process_pars_and_vars(ir, vars_or_pars, src, decl_prefix, flags):
+def _process_pars_and_vars(ir, vars_or_pars, src, decl_prefix, flags, annotate=lambda v: ""):
     for v in vars_or_pars.values():
         # TODO: check reserved word are not used as variable name
         declaration = _get_variable_decl(v, decl_prefix, flags)
-        src.append(declaration)
+        src.append(f"{declaration}{annotate(v)};")
         if isinstance(v.value, Constraint):
             _set_value_as_constraint(ir, v, flags)
 
@@ -47,8 +70,17 @@ def _process_pars(ir, src, flags):
     _process_pars_and_vars(ir, ir.pars, src, "", flags)
 
 
-def _process_vars(ir, src, flags):
-    _process_pars_and_vars(ir, ir.vars, src, "var", flags)
+def _process_vars(ir, src, flags, output=None):
+    def annotate(v):
+        # variables, which aren't needed by the caller, aren't printed by the solver and aren't parsed
+        return "" if is_output(v, output) else " :: no_output"
+
+    _process_pars_and_vars(ir, ir.vars, src, "var", flags, annotate)
+
+
+def is_output(v, output: Optional[AbstractSet[str]] = None) -> bool:
+    """Whether the variable is printed by the solver, see ``to_zinc``"""
+    return v.output if output is None else v.name in output
 
 
 @singledispatch
@@ -74,23 +106,27 @@ def _(v, decl_prefix, flags):
 def _elementary_var_decl(v, decl_prefix, flags):
     declaration = ""
     if v.type is int:
-        declaration += f"{decl_prefix} int: {v.name};"
+        declaration += f"{decl_prefix} int: {v.name}"
     elif v.type is float:
         flags.add(Flags.float_used)
-        declaration += f"{decl_prefix} float: {v.name};"
+        declaration += f"{decl_prefix} float: {v.name}"
     elif is_range(v.type):
         if not is_int_range(v.type):
             flags.add(Flags.float_used)
-        declaration += f"{decl_prefix} {to_str(v.type, flags_=flags)}: {v.name};"
+        declaration += f"{decl_prefix} {to_str(v.type, flags_=flags)}: {v.name}"
     elif is_enum(v.type):
-        declaration += f"{decl_prefix} {v.type.__name__}: {v.name};"
+        declaration += f"{decl_prefix} {v.type.__name__}: {v.name}"
     else:
         raise TypeError(f"Type {v.type} are not supported, please specify int or range")
     return declaration
 
 
 def _set_value_as_constraint(ir, variable, flags_):
-    # values like `var int: s = sum(a);` should be set as constraint or it won't be returned in result
+    # values like `var int: s = sum(a);` should be set as constraint or it won't be returned in result,
+    # the constraint is added once, even if the model is compiled again, e.g. with another output
+    if variable.name in ir.defined:
+        return
+    ir.defined.add(variable.name)
     ir.constraints.append(_binary_op("==", variable.name, to_str(variable.value, flags_=flags_), flags_=flags_))
 
 
@@ -101,14 +137,16 @@ def _process_constraints(ir, src, flags_):
 
 
 def _process_how_to_solve(ir, result):
-    how_to_solve = ir.how_to_solve
+    result.append(solve_item(ir.how_to_solve))
+
+
+def solve_item(how_to_solve, annotations=()) -> str:
+    annotations_str = "".join(f":: {to_str(a)} " for a in annotations)
     if isinstance(how_to_solve, tuple):
         if len(how_to_solve) == 2:
-            result.append(f"solve {how_to_solve[0]} {to_str(how_to_solve[1])};")
-            return
+            return f"solve {annotations_str}{how_to_solve[0]} {to_str(how_to_solve[1])};"
         assert len(how_to_solve) == 1
         how_to_solve = how_to_solve[0]
     if isinstance(how_to_solve, str):
-        result.append(f"solve {how_to_solve};")
-        return
-    assert False, "{} how to solve is unknown".format(ir.how_to_solve)  # pragma: no cover
+        return f"solve {annotations_str}{how_to_solve};"
+    assert False, "{} how to solve is unknown".format(how_to_solve)  # pragma: no cover
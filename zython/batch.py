@@ -0,0 +1,124 @@
+"""Solving of one model class for many data instances in a process pool."""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Type, Union
+
+import minizinc
+
+from zython.model import Model
+from zython.result import Result
+from zython.solver.source import solve_source
+
+# number of instances submitted to the pool per worker process, they are compiled ahead of solving
+WINDOW_PER_WORKER = 4
+
+
+def solve_batch(
+    model_cls: Type[Model],
+    kwargs_list: Iterable[Dict[str, Any]],
+    *,
+    method: str = "satisfy",
+    objective: Optional[Callable[[Model], Any]] = None,
+    workers: Optional[int] = None,
+    all_solutions=False,
+    solver="gecode",
+    optimisation_level: Optional[int] = None,
+    n_processes: Optional[int] = None,
+    timeout: Optional[timedelta] = None,
+    random_seed: Optional[int] = None,
+    instance_timeout: Optional[timedelta] = None,
+) -> Iterator[Tuple[int, Union[Result, Exception]]]:
+    """Solves ``model_cls(**kwargs)`` for every kwargs in ``kwargs_list`` in parallel processes
+
+    Models are created and compiled in the current process, solving is done by a pool of worker processes.
+    Instances are created lazily, at most ``WINDOW_PER_WORKER`` instances per worker are waiting for their results,
+    so ``kwargs_list`` can be a long generator.
+    Every worker prepares the minizinc model and looks up the solver only once for every distinct source code,
+    so the data of the next instance is just attached to already prepared model.
+
+    Parameters
+    ----------
+    model_cls: type
+        Subclass of ``zn.Model`` to solve.
+    kwargs_list: iterable of dict
+        Keyword arguments to create an instance of ``model_cls`` for every solve.
+    method: str
+        "satisfy", "minimize" or "maximize"
+    objective: Callable, optional
+        Function, which accepts created model and returns the expression to optimise.
+        Required if ``method`` is "minimize" or "maximize".
+    workers: Optional[int]
+        Number of worker processes, by default the number of CPUs.
+    solver: str
+        Name of the solver, racing of several solvers isn't supported here.
+    instance_timeout: Optional[timedelta]
+        Wall-clock limit for a single instance (including minizinc compilation),
+        the solver process is terminated when it is reached.
+
+    Other parameters have the same meaning as in ``zn.Model.solve_satisfy``.
+
+    Yields
+    ------
+    (index, result): tuple
+        Pairs in completion order, errors of creation of models are yielded as soon as they occur.
+        ``index`` is the position of the kwargs in ``kwargs_list`` and ``result`` is the ``Result`` of the instance
+        or the exception if its solving failed,
+        the failure of one instance doesn't affect other ones. Results keep their models, so they can be verified.
+        Invalid data of the model is reported as ``ValueError``, failures of minizinc as ``RuntimeError``
+        and instances, which reached ``instance_timeout``, as ``TimeoutError``, other exceptions are raised.
+
+    Notes
+    -----
+    Data of the models (``par`` values and enums) are sent to the worker processes, so it should be picklable.
+    """
+    if method != "satisfy" and objective is None:
+        raise ValueError(f"objective should be specified for {method}")
+    solve_kwargs = dict(
+        all_solutions=all_solutions,
+        optimisation_level=optimisation_level,
+        processes=n_processes,
+        timeout=timeout,
+        random_seed=random_seed,
+    )
+    hard_timeout = instance_timeout.total_seconds() if instance_timeout is not None else None
+    workers = workers or os.cpu_count() or 1
+    # instances are created and submitted in a bounded window, so only a few models are alive at once
+    window = workers * WINDOW_PER_WORKER
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        kwargs_iter = enumerate(kwargs_list)
+        futures = {}
+        try:
+            while True:
+                while len(futures) < window:
+                    item = next(kwargs_iter, None)
+                    if item is None:
+                        break
+                    i, kwargs = item
+                    try:
+                        model = model_cls(**kwargs)
+                        how_to_solve = (method,) if objective is None else (method, objective(model))
+                        src = model.compile(how_to_solve)
+                        data = model._instance_data()
+                    except (ValueError, minizinc.MiniZincError) as e:
+                        yield i, e
+                        continue
+                    future = executor.submit(solve_source, src, data, solver, solve_kwargs, hard_timeout)
+                    futures[future] = (i, model, how_to_solve[1] if len(how_to_solve) > 1 else None)
+                if not futures:
+                    return
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    # the model is dropped as soon as its result is yielded
+                    i, model, objective_expr = futures.pop(future)
+                    try:
+                        # solve_source re-raises all failures of the worker as RuntimeError or TimeoutError
+                        mzn_result = future.result()
+                    except (RuntimeError, TimeoutError) as e:
+                        yield i, e
+                    else:
+                        yield i, Result(mzn_result, solver=solver, model=model, objective=objective_expr)
+        finally:
+            for future in futures:
+                future.cancel()
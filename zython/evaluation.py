@@ -0,0 +1,71 @@
+"""Evaluation of constraints and the objective of the model for a batch of assignments without solver."""
+
+from typing import Any, Dict, Iterable, Mapping, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+from zython._compile.vectorised import Evaluator
+from zython.operations.constraint import Constraint
+
+Assignments = Union[Mapping[str, Sequence], Iterable[Mapping[str, Any]]]
+
+
+class Evaluation(NamedTuple):
+    """Values of constraints and the objective for every assignment
+
+    Attributes
+    ----------
+    satisfied: np.ndarray
+        boolean array (assignments x constraints), whether the constraint is satisfied by the assignment,
+        constraints are in the order they were added to the model and its branches
+    valid: np.ndarray
+        boolean array, whether values of the assignment are in domains of variables, values of variables defined
+        by expressions are equal to the expressions and all expressions are defined, e.g. there is no division by zero
+    objective: Optional[np.ndarray]
+        values of the objective, if it was passed
+    """
+
+    satisfied: np.ndarray
+    valid: np.ndarray
+    objective: Optional[np.ndarray]
+
+    @property
+    def feasible(self) -> np.ndarray:
+        """boolean array, whether the assignment is a solution of the model"""
+        return self.valid & self.satisfied.all(axis=1)
+
+
+def evaluate(ir, constraints: Iterable, assignments: Assignments, objective=None) -> Evaluation:
+    """Evaluates constraints and the objective for all assignments at once by numpy
+
+    Parameters
+    ----------
+    ir: IR
+        compiled model
+    constraints: Iterable
+        constraints to check, strings added by the compiler are skipped
+    assignments: dict of sequences or sequence of dicts
+        values of variables by name for every assignment, e.g. ``{"x": [1, 2], "a": [[1, 2], [3, 4]]}``
+        or ``[{"x": 1, "a": [1, 2]}, {"x": 2, "a": [3, 4]}]``, ``objective`` is ignored.
+        Values of all decision variables should be passed.
+    objective: optional
+        expression to evaluate
+    """
+    columns = _columns(assignments)
+    size = len(next(iter(columns.values()))) if columns else 1
+    evaluator = Evaluator(ir, columns, size)
+    satisfied = [np.broadcast_to(evaluator(c), (size,)) for c in constraints if isinstance(c, Constraint)]
+    satisfied = np.stack(satisfied, axis=1) if satisfied else np.ones((size, 0), dtype=bool)
+    values = None if objective is None else np.broadcast_to(evaluator(objective), (size,))
+    return Evaluation(satisfied, evaluator.valid(), values)
+
+
+def _columns(assignments: Assignments) -> Dict[str, np.ndarray]:
+    if not isinstance(assignments, Mapping):
+        rows = list(assignments)
+        names = rows[0].keys() if rows else ()
+        assignments = {name: [row[name] for row in rows] for name in names}
+    columns = {name: np.asarray(values) for name, values in assignments.items() if name != "objective"}
+    if len({len(values) for values in columns.values()}) > 1:
+        raise ValueError("all variables should have values for every assignment")
+    return columns
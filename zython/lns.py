@@ -0,0 +1,144 @@
+"""Large neighbourhood search: the solution is improved by re-solving its parts with other variables fixed."""
+
+import itertools
+import random
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+from minizinc import Status
+
+from zython._compile.zinc.zinc import constraints_to_zinc
+from zython.result import Result
+from zython.solver import registry
+from zython.solver.source import solve_source
+from zython.var_par.collections.array import ArrayMixin
+
+Neighbourhood = Union[float, Callable[[Result, random.Random], List[Any]]]
+
+
+def lns(
+    model,
+    objective,
+    *,
+    constraints: Sequence[Any] = (),
+    maximize: bool = False,
+    neighbourhood: Neighbourhood = 0.3,
+    iterations: int = 100,
+    time_per_iteration: timedelta = timedelta(seconds=1),
+    workers: int = 1,
+    solver: str = "gecode",
+    random_seed: Optional[int] = None,
+) -> Result:
+    """Looks for a good solution of the optimisation problem by large neighbourhood search
+
+    See ``zn.Model.solve_lns`` for the description of parameters,
+    ``constraints`` are added to every iteration, they are used to search in a branch of the model.
+    """
+    if not 0 < workers:
+        raise ValueError(f"workers should be positive, but it is {workers}")
+    if not callable(neighbourhood) and not 0 < neighbourhood <= 1:
+        raise ValueError(f"neighbourhood should be a callable or a fraction in (0, 1], but it is {neighbourhood}")
+    rng = random.Random(random_seed)
+    method = "maximize" if maximize else "minimize"
+    search = _Search(model, list(constraints), objective, method, solver, time_per_iteration, workers)
+    try:
+        best = search.solve([[]], rng)[0]
+        if not best.original.status.has_solution() or best.original.status == Status.OPTIMAL_SOLUTION:
+            return best
+        elements = None
+        if not callable(neighbourhood):
+            elements = _elements(model)
+            if not elements:
+                return best
+        done = 0
+        while done < iterations:
+            count = min(workers, iterations - done)
+            done += count
+            bound = objective > best.original.objective if maximize else objective < best.original.objective
+            neighbourhoods = [_neighbourhood(model, elements, best, neighbourhood, rng) + [bound] for _ in range(count)]
+            found = [r for r in search.solve(neighbourhoods, rng) if r.original.status.has_solution()]
+            if found:
+                objectives = [r.original.objective for r in found]
+                best = found[objectives.index(max(objectives) if maximize else min(objectives))]
+        return best
+    finally:
+        search.close()
+
+
+class _Search:
+    # solves neighbourhoods in the current process, or in a process pool if there are several workers
+
+    def __init__(self, model, constraints, objective, method: str, solver: str, timeout: timedelta, workers: int):
+        self._model = model
+        self._constraints = constraints
+        self._objective = objective
+        self._method = method
+        self._solver = solver
+        self._timeout = timeout
+        # solvers without ``-r`` flag fail if the seed is passed
+        self._seeded = registry.capabilities(solver).random_seed
+        self._executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    def solve(self, neighbourhoods: List[List[Any]], rng: random.Random) -> List[Result]:
+        seeds = [rng.randrange(2**31) if self._seeded else None for _ in neighbourhoods]
+        if self._executor is None:
+            results = [self._solve_branch(constraints, seed) for constraints, seed in zip(neighbourhoods, seeds)]
+        else:
+            declarations = self._model._compile_declarations()
+            data = self._model._instance_data()
+            futures = []
+            for constraints, seed in zip(neighbourhoods, seeds):
+                how_to_solve = (self._method, self._objective)
+                src = f"{declarations}\n{constraints_to_zinc(self._constraints + constraints, how_to_solve)}"
+                solve_kwargs = dict(timeout=self._timeout, random_seed=seed)
+                future = self._executor.submit(solve_source, src, data, self._solver, solve_kwargs)
+                # the result keeps the branch of the neighbourhood, as results of the sequential search do
+                futures.append((future, self._model.branch(*self._constraints, *constraints)))
+            results = [
+                Result(f.result(), solver=self._solver, model=branch, objective=self._objective)
+                for f, branch in futures
+            ]
+        return results
+
+    def _solve_branch(self, constraints: List[Any], seed: Optional[int]) -> Result:
+        branch = self._model.branch(*self._constraints, *constraints)
+        solve = branch.solve_maximize if self._method == "maximize" else branch.solve_minimize
+        return solve(self._objective, solver=self._solver, timeout=self._timeout, random_seed=seed)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+
+
+def _elements(model) -> List[Tuple[str, Optional[Tuple[int, ...]]]]:
+    # decision variables and elements of decision arrays, which can be fixed
+    result = []
+    for name in model._constraint_graph().decision_vars():
+        v = model._ir.vars[name]
+        if isinstance(v, ArrayMixin):
+            result.extend((name, index) for index in itertools.product(*(range(s) for s in v._shape)))
+        else:
+            result.append((name, None))
+    return result
+
+
+def _neighbourhood(
+    model, elements: Optional[list], incumbent: Result, neighbourhood: Neighbourhood, rng: random.Random
+) -> List[Any]:
+    if callable(neighbourhood):
+        return list(neighbourhood(incumbent, rng))
+    relaxed = set(rng.sample(range(len(elements)), max(1, round(neighbourhood * len(elements)))))
+    constraints = []
+    for i, (name, index) in enumerate(elements):
+        if i in relaxed:
+            continue
+        v = model._ir.vars[name]
+        value = incumbent[name]
+        if index is None:
+            constraints.append(v == value)
+        else:
+            for j in index:
+                value = value[j]
+            constraints.append(v[index] == value)
+    return constraints
@@ -1,21 +1,38 @@
-from abc import ABC
+import collections
+import contextlib
+import os
+from abc import ABC, abstractmethod
 from datetime import timedelta
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Callable, FrozenSet, List, NamedTuple, Optional, Sequence, Union
 
 import minizinc
 
-from zython._compile.zinc.zinc import to_zinc
+from zython._compile.zinc.zinc import constraints_to_zinc, solve_item, to_zinc
+from zython.lns import Neighbourhood, lns
+from zython.multiobjective import ParetoPoint, Stage, lexicographic, pareto_front
+from zython import tracing
 from zython.result import Result
+from zython.solver import bisection, components, partition, portfolio, prepared, registry, resources, stopping
+from zython.solver import checkpoint as checkpoint_file
+from zython.solver.cache import solve_cached
+from zython.solver.checkpoint import Checkpoint, model_name
+from zython.solver.resources import Limits
+from zython.solver.cpu_budget import solver_threads
+from zython.solver.stopping import StopWhen
+from zython._compile.graph import ConstraintGraph
 from zython._compile.ir import IR
+from zython.operations.annotation import Annotation, _as_annotations, _auto_search, _warm_start
 from zython.operations.constraint import Constraint
+from zython._compile.zinc.to_str import to_str
 from zython.var_par.par import par
 from zython.var_par.var import var
 
+if TYPE_CHECKING:
+    from zython.evaluation import Evaluation
 
-class Model(ABC):
-    """Base class for user-defined models to solve"""
 
-    constraint: List[Constraint]
+class _Solvable(ABC):
+    # solve methods shared by models and their branches
 
     def solve_satisfy(
         self,
@@ -28,6 +45,14 @@ class Model(ABC):
         n_processes: Optional[int] = None,
         timeout: Optional[timedelta] = None,
         random_seed: Optional[int] = None,
+        warm_start: Optional[Union[dict, Result]] = None,
+        search: Optional[Union[Annotation, List[Annotation]]] = None,
+        auto_search: Union[bool, str] = False,
+        split: Optional[int] = None,
+        split_on=None,
+        decompose: bool = False,
+        output: Optional[Sequence[str]] = None,
+        limits: Optional[Limits] = None,
     ):
         """Finds solution that satisfied constraints, or the error message if the model can't be solved
 
@@ -40,8 +65,15 @@ class Model(ABC):
             calculation hard
         verbose: bool
             If True the source code of the model will be print to stdout
-        solver: str
-            Name of the solver, that will look for solution
+        solver: str or list of str
+            Name of the solver, that will look for solution.
+            If several names are passed, the model is solved by all available of them concurrently,
+            the first answer is returned and other solvers are terminated.
+            For optimisation problems the first proven optimum wins,
+            or the best solution if no solver proved optimality before the timeout.
+            "numpy" solves tiny models with int range domains in process: all assignments are checked
+            by vectorised numpy expressions, ``zython.solver.vectorised.MAX_CANDIDATES`` at most,
+            search annotations, warm start and options of minizinc are ignored. It requires numpy to be installed.
         optimisation_level: Optional[int] = None
             Optimisation level for minizinc compiler
                 - 0: Disable optimisation
@@ -58,14 +90,51 @@ class Model(ABC):
         random_seed: Optional[int] = None
             Set the random seed for solver.
             (Only available when the ``-r`` flag is supported by the solver).
+        warm_start: Optional[Union[dict, Result]] = None
+            Values of variables by name, e.g. ``{"x": previous["x"]}``, or the previous result,
+            the solver starts its search from them. It is a hint only,
+            solvers without warm start support ignore it.
+        search: Optional[Union[Annotation, List[Annotation]]] = None
+            Search strategy and restart policy of the solver, e.g. ``zn.int_search(self.a, "first_fail")``,
+            ``zn.seq_search([...])`` or ``zn.restart_luby(100)``.
+            Several annotations can be passed as a list.
+        auto_search: Union[bool, str] = False
+            If set, the order of integer variables is derived from the constraints of the model:
+                - "most_constrained" (or True): variables with smaller domain per constraint go first
+                - "degree": variables used by more constraints go first
+                - "bandwidth": variables used together are searched close to each other
+            The order is placed after ``search`` annotations, so a search strategy passed with ``search``
+            takes precedence and restart policy can be added with it.
+        split: Optional[int] = None
+            If set, the problem is split into at least ``split`` disjoint parts by domains of branching variables,
+            the parts are solved concurrently by separate solver processes.
+            With ``all_solutions`` solutions of all parts are merged without duplicates,
+            otherwise the first solution found in any part is returned.
+        split_on: var, array, array element or list of them, optional
+            Integer variables which domains are split, they are taken in order until there are enough parts.
+            By default integer decision variables are used in "most_constrained" order (see ``auto_search``).
+        decompose: bool = False
+            If True and the constraints split the variables into independent groups, every group is solved
+            as a separate model concurrently and the solutions are stitched together.
+            For optimisation problems the objective should be a sum of terms, each of which uses variables
+            of one group only, otherwise the model is solved as a whole.
+            Can't be combined with several solvers, ``all_solutions``, ``split``, search annotations and ``output``.
+        output: Optional[Sequence[str]] = None
+            Names of variables to return, other variables aren't printed by the solver and aren't parsed,
+            it saves time for models with big auxiliary arrays. If it isn't set, all variables are returned
+            except ones created with ``output=False``, e.g. ``zn.var(range(10), output=False)``.
+        limits: Optional[zn.Limits] = None
+            Limits of memory, CPU time and flattening time of minizinc and solver processes,
+            ``zn.LimitExceeded`` is raised if any of them is exceeded.
+            Resources used by the solve are reported in ``Result.resources``, see ``zn.set_usage_accounting``
+            to measure solves without limits.
 
         Returns
         -------
         Result: Result
             result of the model solution, value of variables can be reached by dict syntax.
         """
-        return self._solve(
-            "satisfy",
+        options = _SolveOptions(
             all_solutions=all_solutions,
             result_as=result_as,
             verbose=verbose,
@@ -74,7 +143,16 @@ class Model(ABC):
             n_processes=n_processes,
             timeout=timeout,
             random_seed=random_seed,
+            warm_start=warm_start,
+            search=search,
+            auto_search=auto_search,
+            split=split,
+            split_on=split_on,
+            decompose=decompose,
+            output=output,
+            limits=limits,
         )
+        return self._solve(("satisfy",), options)
 
     def solve_maximize(
         self,
@@ -88,11 +166,21 @@ class Model(ABC):
         n_processes: Optional[int] = None,
         timeout: Optional[timedelta] = None,
         random_seed: Optional[int] = None,
+        warm_start: Optional[Union[dict, Result]] = None,
+        search: Optional[Union[Annotation, List[Annotation]]] = None,
+        auto_search: Union[bool, str] = False,
+        decompose: bool = False,
+        lower_bound: Optional[int] = None,
+        upper_bound: Optional[int] = None,
+        strategy: str = "default",
+        workers: int = 1,
+        stop_when: Optional[StopWhen] = None,
+        checkpoint: Optional[Union[str, os.PathLike]] = None,
+        output: Optional[Sequence[str]] = None,
+        limits: Optional[Limits] = None,
     ):
-        return self._solve(
-            "maximize",
-            eq,
-            all_solutions=False,
+        """Finds solution with the maximal value of ``eq``, see ``solve_minimize`` for the description of parameters"""
+        options = _SolveOptions(
             result_as=result_as,
             verbose=verbose,
             solver=solver,
@@ -100,7 +188,20 @@ class Model(ABC):
             n_processes=n_processes,
             timeout=timeout,
             random_seed=random_seed,
+            warm_start=warm_start,
+            search=search,
+            auto_search=auto_search,
+            decompose=decompose,
+            lower_bound=lower_bound,
+            upper_bound=upper_bound,
+            strategy=strategy,
+            workers=workers,
+            stop_when=stop_when,
+            checkpoint=checkpoint,
+            output=output,
+            limits=limits,
         )
+        return self._solve(("maximize", eq), options)
 
     def solve_minimize(
         self,
@@ -114,11 +215,52 @@ class Model(ABC):
         n_processes: Optional[int] = None,
         timeout: Optional[timedelta] = None,
         random_seed: Optional[int] = None,
+        warm_start: Optional[Union[dict, Result]] = None,
+        search: Optional[Union[Annotation, List[Annotation]]] = None,
+        auto_search: Union[bool, str] = False,
+        decompose: bool = False,
+        lower_bound: Optional[int] = None,
+        upper_bound: Optional[int] = None,
+        strategy: str = "default",
+        workers: int = 1,
+        stop_when: Optional[StopWhen] = None,
+        checkpoint: Optional[Union[str, os.PathLike]] = None,
+        output: Optional[Sequence[str]] = None,
+        limits: Optional[Limits] = None,
     ):
-        return self._solve(
-            "minimize",
-            eq,
-            all_solutions=False,
+        """Finds solution with the minimal value of ``eq``
+
+        Parameters
+        ----------
+        eq:
+            expression to minimize
+        lower_bound: Optional[int] = None
+            Known lower bound of the objective, it is added as a constraint to prune the search.
+        upper_bound: Optional[int] = None
+            Known upper bound of the objective, it is added as a constraint to prune the search.
+        strategy: str = "default"
+            - "default": the objective is optimised by the solver
+            - "bisect": integer objective is bisected by ``workers`` concurrent probes ``eq <= k``,
+              every probe is stopped after its first solution. The lower bound (upper bound for maximization)
+              is required. Proven bounds are reported in ``lower_bound`` and ``upper_bound`` statistics
+              of the original result, if the timeout is reached they are the best known ones.
+        workers: int = 1
+            Number of concurrent probes of "bisect" strategy.
+        stop_when: Optional[StopWhen] = None
+            Criteria to stop the solver before the optimum is proven, e.g. ``zn.StopWhen(gap=0.01)``,
+            the best solution found is returned.
+        checkpoint: Optional[Union[str, os.PathLike]] = None
+            Path of the file, where the best solution, its objective, the proven bound and solve options
+            are saved after every improvement, the solve can be continued from it with ``resume``.
+
+        Other parameters are the same as in ``solve_satisfy``.
+
+        Returns
+        -------
+        Result: Result
+            result of the model solution, value of variables can be reached by dict syntax.
+        """
+        options = _SolveOptions(
             result_as=result_as,
             verbose=verbose,
             solver=solver,
@@ -126,37 +268,333 @@ class Model(ABC):
             n_processes=n_processes,
             timeout=timeout,
             random_seed=random_seed,
+            warm_start=warm_start,
+            search=search,
+            auto_search=auto_search,
+            decompose=decompose,
+            lower_bound=lower_bound,
+            upper_bound=upper_bound,
+            strategy=strategy,
+            workers=workers,
+            stop_when=stop_when,
+            checkpoint=checkpoint,
+            output=output,
+            limits=limits,
         )
+        return self._solve(("minimize", eq), options)
 
-    def _solve(
+    def resume(
         self,
-        *how_to_solve,
-        all_solutions,
-        result_as,
-        verbose,
-        solver,
-        optimisation_level,
-        n_processes,
-        timeout,
-        random_seed,
+        checkpoint: Union[str, os.PathLike],
+        /,
+        *,
+        result_as=None,
+        verbose=False,
+        timeout: Optional[timedelta] = None,
+        stop_when: Optional[StopWhen] = None,
     ):
-        solver = minizinc.Solver.lookup(solver)
-        model = minizinc.Model()
-        src = self.compile(how_to_solve)
-        if verbose:
-            print(src)
-        model.add_string(src)
-        inst = self._create_inst(model, solver)
-        for e in self._ir.enums:
-            inst[e.__name__] = e
-        result: minizinc.Result = inst.solve(
-            all_solutions=all_solutions,
-            optimisation_level=optimisation_level,
-            processes=n_processes,
+        """Continues optimisation from the checkpoint saved by ``solve_minimize`` or ``solve_maximize``
+
+        The model (or the branch) should be created with the same data as the saved one.
+        The best saved solution is passed as a warm start, the objective is bounded by its value
+        and the proven bound, solve options are restored. The checkpoint is updated by the resumed solve.
+
+        Parameters
+        ----------
+        checkpoint: str or PathLike
+            Path of the checkpoint file.
+        timeout: Optional[timedelta] = None
+            Time limit of the resumed solve, by default it is the rest of the saved time limit.
+        stop_when: Optional[StopWhen] = None
+            Criteria to stop the solver before the optimum is proven.
+
+        Returns
+        -------
+        Result: Result
+            result of the model solution, value of variables can be reached by dict syntax.
+        """
+        data = checkpoint_file.load(checkpoint)
+        model = self._root()
+        if data["model"] != model_name(model):
+            raise ValueError(f"checkpoint is saved for {data['model']}, but the model is {model_name(model)}")
+        saved = data["options"]
+        if timeout is None and saved["timeout"] is not None:
+            rest = saved["timeout"] - data["elapsed"]
+            if rest <= 0:
+                raise ValueError("the time limit of the checkpoint is spent, please specify a new timeout")
+            timeout = timedelta(seconds=rest)
+        method, objective = data["method"], data["objective"]
+        # the saved solution is feasible, so the objective can't be worse than its value
+        incumbent, bound = data["objective_value"], data["bound"]
+        lower_bound, upper_bound = (incumbent, bound) if method == "maximize" else (bound, incumbent)
+        options = _SolveOptions(
+            result_as=result_as,
+            verbose=verbose,
+            solver=saved["solver"],
+            optimisation_level=saved["optimisation_level"],
+            n_processes=saved["n_processes"],
             timeout=timeout,
+            random_seed=saved["random_seed"],
+            warm_start=data["solution"],
+            lower_bound=lower_bound,
+            upper_bound=upper_bound,
+            stop_when=stop_when,
+            checkpoint=Checkpoint(checkpoint, data["model"], method, objective, saved, data["elapsed"]),
+        )
+        return self._solve((method, objective), options)
+
+    def solve_lns(
+        self,
+        objective,
+        /,
+        *,
+        maximize: bool = False,
+        neighbourhood: Neighbourhood = 0.3,
+        iterations: int = 100,
+        time_per_iteration: timedelta = timedelta(seconds=1),
+        workers: int = 1,
+        solver: str = "gecode",
+        random_seed: Optional[int] = None,
+    ) -> Result:
+        """Improves the solution of optimisation problem by large neighbourhood search
+
+        The first solution is found with ``time_per_iteration`` limit, then every iteration fixes a part of
+        integer decision variables to their values in the best solution, requires the objective to be better
+        and solves the rest of the model with ``time_per_iteration`` limit. The model isn't recompiled,
+        iterations are solved as its branches (see ``branch``). The search is stopped after ``iterations``
+        or if the first solution is proven to be optimal, the best solution found is returned.
+
+        Parameters
+        ----------
+        objective:
+            expression to minimize or maximize
+        maximize: bool
+            If True the objective is maximized, otherwise minimized.
+        neighbourhood: float or Callable
+            Fraction of decision variables (and elements of decision arrays) which are randomly chosen
+            to be free in every iteration, the other ones are fixed.
+            Or function ``neighbourhood(best_result, rng) -> list of constraints``, which returns
+            constraints for the next iteration, e.g. ``[self.x == best_result["x"]]``.
+        iterations: int
+            Number of iterations.
+        time_per_iteration: timedelta
+            Time limit of every iteration.
+        workers: int
+            Number of neighbourhoods which are solved in parallel processes in every iteration,
+            each of them is counted as an iteration.
+        solver: str
+            Name of the solver.
+        random_seed: Optional[int]
+            Seed of the neighbourhood choice, seeds of the solver are derived from it.
+
+        Returns
+        -------
+        Result: Result
+            The best solution found.
+        """
+        return lns(
+            self._root(),
+            objective,
+            constraints=self._branch_constraints(),
+            maximize=maximize,
+            neighbourhood=neighbourhood,
+            iterations=iterations,
+            time_per_iteration=time_per_iteration,
+            workers=workers,
+            solver=solver,
             random_seed=random_seed,
         )
-        return result_as(result) if result_as else Result(result)
+
+    def solve_lexicographic(
+        self,
+        objectives: Sequence,
+        /,
+        *,
+        maximize: Union[bool, Sequence[bool]] = False,
+        time_per_stage: Optional[timedelta] = None,
+        solver: str = "gecode",
+    ) -> List[Stage]:
+        """Optimises objectives in order of their priority
+
+        Every objective is optimised in its own stage, objectives of previous stages can't be worse than
+        the values they got. The model isn't recompiled, stages are solved as its branches (see ``branch``),
+        and the solution of the previous stage is passed to the next one as a warm start hint.
+
+        Parameters
+        ----------
+        objectives: sequence
+            expressions to optimise, the first one has the highest priority
+        maximize: bool or sequence of bool
+            If True objectives are maximized, otherwise minimized. Can be set for every objective separately.
+        time_per_stage: Optional[timedelta]
+            Time limit of every stage.
+        solver: str
+            Name of the solver.
+
+        Returns
+        -------
+        stages: list of Stage
+            Result and wall time of every stage, the result of the last stage is the solution.
+            If a stage finds no solution, the following stages aren't solved.
+
+        Examples
+        --------
+
+        >>> import zython as zn
+        >>> class MyModel(zn.Model):
+        ...     def __init__(self):
+        ...         self.a = zn.var(range(10))
+        ...         self.b = zn.var(range(10))
+        ...         self.constraints = [self.a + self.b <= 12]
+        >>> model = MyModel()
+        >>> stages = model.solve_lexicographic([model.a, model.b], maximize=True)
+        >>> [stage.result.original.objective for stage in stages]
+        [9, 3]
+        """
+        return lexicographic(
+            self._root(),
+            objectives,
+            constraints=self._branch_constraints(),
+            maximize=maximize,
+            time_per_stage=time_per_stage,
+            solver=solver,
+        )
+
+    def pareto_front(
+        self,
+        objectives: Sequence,
+        /,
+        *,
+        maximize: Union[bool, Sequence[bool]] = False,
+        time_per_stage: Optional[timedelta] = None,
+        max_points: Optional[int] = None,
+        workers: int = 1,
+        solver: str = "gecode",
+    ) -> List[ParetoPoint]:
+        """Finds solutions, which can't be improved by one objective without making another objective worse
+
+        Every point is found by lexicographic optimisation (see ``solve_lexicographic``) of the solutions,
+        which are better than every found point by at least one objective, until there are no such solutions.
+        With time limits the points may be dominated.
+
+        Parameters
+        ----------
+        objectives: sequence
+            expressions to optimise
+        maximize: bool or sequence of bool
+            If True objectives are maximized, otherwise minimized. Can be set for every objective separately.
+        time_per_stage: Optional[timedelta]
+            Time limit of every stage.
+        max_points: Optional[int]
+            Maximal number of points to find, by default the whole front is found.
+        workers: int
+            Number of concurrent searches, every search starts from another objective,
+            so there are at most as many searches as objectives.
+        solver: str
+            Name of the solver.
+
+        Returns
+        -------
+        points: list of ParetoPoint
+            Values of objectives, solutions and their stages, sorted by values of objectives.
+        """
+        return pareto_front(
+            self._root(),
+            objectives,
+            constraints=self._branch_constraints(),
+            maximize=maximize,
+            time_per_stage=time_per_stage,
+            max_points=max_points,
+            workers=workers,
+            solver=solver,
+        )
+
+    def evaluate(self, assignments, /, objective=None) -> "Evaluation":
+        """Evaluates constraints and the objective for a batch of assignments by numpy, the solver isn't used
+
+        It is useful to verify solutions or to screen many candidates, e.g. produced by a heuristic,
+        before solving. It requires numpy to be installed.
+
+        Parameters
+        ----------
+        assignments: dict of sequences or sequence of dicts
+            Values of variables by name for every assignment, e.g. ``{"x": [1, 2], "a": [[1, 2], [3, 4]]}``
+            or ``[{"x": 1, "a": [1, 2]}, {"x": 2, "a": [3, 4]}]``. Values of all decision variables should be passed,
+            values of variables defined by expressions are optional, if they are passed, they are checked.
+        objective: optional
+            Expression to evaluate for every assignment.
+
+        Returns
+        -------
+        evaluation: Evaluation
+            Satisfaction of every constraint, validity and the objective of every assignment.
+
+        Examples
+        --------
+
+        >>> import zython as zn
+        >>> class MyModel(zn.Model):
+        ...     def __init__(self):
+        ...         self.a = zn.var(range(10))
+        ...         self.b = zn.var(range(10))
+        ...         self.constraints = [self.a < self.b, self.a + self.b == 10]
+        >>> model = MyModel()
+        >>> evaluation = model.evaluate({"a": [1, 5, 2], "b": [9, 5, 7]}, objective=model.b - model.a)
+        >>> evaluation.feasible.tolist()
+        [True, False, False]
+        >>> evaluation.satisfied.tolist()
+        [[True, True], [False, True], [True, False]]
+        >>> evaluation.objective.tolist()
+        [8, 0, 5]
+        """
+        return _evaluate(self._root(), self._branch_constraints(), assignments, objective)
+
+    def _solve(self, how_to_solve: tuple, options: "_SolveOptions"):
+        return _solve(self, how_to_solve, options)
+
+    @abstractmethod
+    def _root(self) -> "Model":
+        # the model, which declares variables and constraints
+        ...
+
+    @abstractmethod
+    def _branch_constraints(self) -> list:
+        # constraints added to the constraints of the model
+        ...
+
+
+class Model(_Solvable):
+    """Base class for user-defined models to solve"""
+
+    constraint: List[Constraint]
+
+    def branch(self, *constraints) -> "Branch":
+        """Returns child of the model, which can be extended with constraints and solved without recompilation
+
+        The model is compiled and its data is set only once, branches add their constraints and the solve item
+        on top of it, so it is cheap to ask many what-if questions about the same model.
+
+        Parameters
+        ----------
+        constraints:
+            constraints to add, more can be appended to ``constraints`` attribute of the branch later
+
+        Examples
+        --------
+
+        >>> import zython as zn
+        >>> class MyModel(zn.Model):
+        ...     def __init__(self):
+        ...         self.a = zn.var(range(10))
+        ...         self.b = zn.var(range(10))
+        ...         self.constraints = [self.a + self.b == 10]
+        >>> model = MyModel()
+        >>> model.branch(model.a == 3).solve_satisfy()["b"]
+        7
+        >>> model.branch(model.a > 5).solve_minimize(model.b)["a"]
+        9
+        """
+        return Branch(self, list(constraints))
 
     @property
     def constraints(self):
@@ -166,14 +604,23 @@ class Model(ABC):
     def constraints(self, value):
         self._constraints = value
 
-    def compile(self, how_to_solve):
-        if not hasattr(self, "_ir"):
-            self._ir = IR(self, how_to_solve)
-            result = to_zinc(self._ir)
-            self._src = result
-        assert self._src, "Model wasn't compiled"
+    def compile(self, how_to_solve, annotations=(), output=None):
+        self._src = "\n".join((self._compile_declarations(output), solve_item(how_to_solve, annotations)))
         return self._src
 
+    def _compile_declarations(self, output=None):
+        # the model without the solve item, it is shared with branches, which set their own goals,
+        # it is compiled once for every set of variables printed by the solver
+        if not hasattr(self, "_ir"):
+            with tracing.phase("ir"):
+                self._ir = IR(self, None)
+            self._declarations = {}
+        key = _output_names(self._ir, output)
+        if key not in self._declarations:
+            with tracing.phase("to_zinc"):
+                self._declarations[key] = to_zinc(self._ir, key)
+        return self._declarations[key]
+
     @property
     def src(self):
         assert hasattr(self, "_src"), "Please solve or compile first"
@@ -186,14 +633,400 @@ class Model(ABC):
             if isinstance(attr, Constraint):
                 return var(attr)
 
-    def _create_inst(self, model, solver):
+    def _create_inst(self, model, solver, src=None):
         inst = minizinc.Instance(solver, model)
-        for name, param in self._ir.pars.items():
-            inst[name] = param.value
-        for name, param in self._ir.vars.items():
-            # minizinc support values passing in data files
-            # https://www.minizinc.org/doc-2.6.4/en/modelling.html#real-number-solving
-            # so there is need to assign such variables
-            if param.value is not None and not isinstance(param.value, Constraint):
-                inst[name] = param.value
+        self._set_data(inst)
+        if src:
+            inst.add_string(src)
+        return inst
+
+    def _set_data(self, inst: minizinc.Instance):
+        for name, value in self._instance_data().items():
+            inst[name] = value
+
+    def _split_parts(self, split: int, split_on, constraints=()) -> List[list]:
+        # constraints of disjoint parts of the problem, ``constraints`` of the branch are used to order variables
+        self._compile_declarations()
+        if split_on is None:
+            order = self._constraint_graph(constraints).order("most_constrained")
+            variables = [self._ir.vars[name] for name in order]
+            return partition.split_domains(partition.domains(variables, skip_unsupported=True), split)
+        if not isinstance(split_on, (list, tuple)):
+            split_on = [split_on]
+        return partition.split_domains(partition.domains(split_on), split)
+
+    def _checkpoint(self, how_to_solve, options: "_SolveOptions") -> Optional[Checkpoint]:
+        checkpoint = options.checkpoint
+        if checkpoint is None or isinstance(checkpoint, Checkpoint):
+            return checkpoint
+        timeout = options.timeout
+        saved = dict(
+            solver=options.solver,
+            n_processes=options.n_processes,
+            optimisation_level=options.optimisation_level,
+            random_seed=options.random_seed,
+            timeout=None if timeout is None else timeout.total_seconds(),
+        )
+        return Checkpoint(checkpoint, model_name(self), how_to_solve[0], to_str(how_to_solve[1]), saved)
+
+    @tracing.phase("solver")
+    def _solve_components(self, constraints, how_to_solve, options: "_SolveOptions", annotations):
+        # returns None if the model doesn't consist of independent components and should be solved as a whole
+        customised = annotations or options.customised or options.output is not None
+        if not isinstance(options.solver, str) or options.all_solutions or customised:
+            raise ValueError(
+                "decompose can't be combined with several solvers, all_solutions, split, search, "
+                "bisect strategy, stop_when, checkpoint and output"
+            )
+        parts = components.decompose(self, constraints, how_to_solve)
+        if parts is None:
+            return None
+        mzn_solver = registry.lookup(options.solver)
+        return components.solve(self, parts, mzn_solver, options.n_processes, **options.solve_kwargs)
+
+    def _solve_annotations(self, warm_start, search=None, auto_search=False, constraints=()) -> List[Annotation]:
+        # ``constraints`` of the branch are used to order variables of ``auto_search``
+        self._compile_declarations()
+        # annotations of the user go first, so their search strategy takes precedence over the derived one
+        annotations = list(_as_annotations(search))
+        if auto_search:
+            ordering = "most_constrained" if auto_search is True else auto_search
+            auto = _auto_search(self._ir.vars, self._constraint_graph(constraints).order(ordering), ordering)
+            if auto is not None:
+                annotations.append(auto)
+        if warm_start is not None:
+            hint = _warm_start(self._ir.vars, warm_start)
+            if hint is not None:
+                annotations.append(hint)
+        return annotations
+
+    def _constraint_graph(self, constraints=()) -> ConstraintGraph:
+        # the graph is built for every solve, because constraints of the model and branches can be changed
+        return ConstraintGraph(self._ir, list(self.constraints) + list(constraints))
+
+    def _base_instance(self, solver: minizinc.Solver, output=None) -> minizinc.Instance:
+        # instance with compiled model and data, branches are created from it
+        if not hasattr(self, "_base_instances"):
+            self._base_instances = {}
+        key = (solver.id, _output_names(self._ir, output))
+        inst = self._base_instances.get(key)
+        if inst is None:
+            inst = self._base_instances[key] = self._create_inst(self._declarations_model(output), solver)
+        return inst
+
+    def _declarations_model(self, output=None) -> minizinc.Model:
+        model = minizinc.Model()
+        model.add_string(self._compile_declarations(output))
+        return model
+
+    def _instance_data(self):
+        return _instance_data(self._ir)
+
+    def _root(self) -> "Model":
+        return self
+
+    def _branch_constraints(self) -> list:
+        return []
+
+
+class Branch(_Solvable):
+    """Child of the model with additional constraints, see ``Model.branch``
+
+    Branches are built on ``minizinc.Instance.branch``: the compiled model and its data are passed to minizinc
+    by the parent instance, a branch adds only its constraints, constraints of parent branches and the solve item.
+    Branches of the same model are solved one after another, because minizinc locks the parent instance
+    while its child is alive.
+
+    Attributes
+    ----------
+    constraints: list
+        constraints of the branch, constraints of the model and parent branches are applied as well
+    """
+
+    def __init__(self, model: Model, constraints: list, parent: Optional["Branch"] = None):
+        self._model = model
+        self._parent = parent
+        self.constraints = constraints
+
+    @property
+    def model(self) -> Model:
+        return self._model
+
+    def branch(self, *constraints) -> "Branch":
+        """Returns child of the branch, it inherits all constraints of the branch"""
+        return Branch(self._model, list(constraints), self)
+
+    def _root(self) -> Model:
+        return self._model
+
+    def _branch_constraints(self) -> list:
+        if self._parent is None:
+            return list(self.constraints)
+        return self._parent._branch_constraints() + list(self.constraints)
+
+
+class _SolveOptions(NamedTuple):
+    # options of the solve, public solve methods pass them to ``_solve`` and it passes them to the strategies
+    all_solutions: bool = False
+    result_as: Optional[Callable] = None
+    verbose: bool = False
+    solver: Union[str, Sequence[str]] = "gecode"
+    optimisation_level: Optional[int] = None
+    n_processes: Optional[int] = None
+    timeout: Optional[timedelta] = None
+    random_seed: Optional[int] = None
+    warm_start: Optional[Union[dict, Result]] = None
+    search: Optional[Union[Annotation, List[Annotation]]] = None
+    auto_search: Union[bool, str] = False
+    split: Optional[int] = None
+    split_on: Any = None
+    decompose: bool = False
+    lower_bound: Optional[int] = None
+    upper_bound: Optional[int] = None
+    strategy: str = "default"
+    workers: int = 1
+    stop_when: Optional[StopWhen] = None
+    checkpoint: Optional[Union[str, os.PathLike, Checkpoint]] = None
+    output: Optional[Sequence[str]] = None
+    limits: Optional[Limits] = None
+
+    @property
+    def solve_kwargs(self) -> dict:
+        # options of ``minizinc.Instance.solve``
+        return dict(
+            all_solutions=self.all_solutions,
+            optimisation_level=self.optimisation_level,
+            timeout=self.timeout,
+            random_seed=self.random_seed,
+        )
+
+    @property
+    def monitored(self) -> bool:
+        # the solver is watched by zython while it is running
+        return self.stop_when is not None or self.checkpoint is not None
+
+    @property
+    def customised(self) -> bool:
+        # the solve isn't a single run of the solver
+        return bool(self.split) or self.strategy != "default" or self.monitored
+
+
+@tracing.traced
+def _solve(owner: _Solvable, how_to_solve: tuple, options: _SolveOptions):
+    # solves the model or the branch by numpy or by minizinc
+    model = owner._root()
+    bounds = _objective_bounds(how_to_solve, options.lower_bound, options.upper_bound, options.strategy)
+    constraints = owner._branch_constraints() + bounds
+    if options.solver == "numpy":
+        solver, result = options.solver, _solve_vectorised(model, constraints, how_to_solve, options)
+    else:
+        solver, result = _solve_minizinc(owner, constraints, how_to_solve, options)
+    return _as_result(result, solver, options.result_as, owner, how_to_solve)
+
+
+def _solve_minizinc(owner: _Solvable, constraints: list, how_to_solve: tuple, options: _SolveOptions):
+    # ``constraints`` are added to the constraints of the model, returns the solver and the result
+    model = owner._root()
+    declarations = model._compile_declarations(options.output)
+    annotations = model._solve_annotations(options.warm_start, options.search, options.auto_search, constraints)
+    with tracing.phase("to_zinc"):
+        tail = constraints_to_zinc(constraints, how_to_solve, annotations)
+    src = f"{declarations}\n{tail}"
+    if owner is model:
+        model._src = src
+    if options.verbose:
+        print(src)
+    with contextlib.ExitStack() as stack:
+        governor = stack.enter_context(resources.governed(options.limits, options.solver))
+        solver, result = options.solver, None
+        if options.decompose:
+            result = model._solve_components(list(model.constraints) + constraints, how_to_solve, options, annotations)
+        if result is None:
+            create_inst = _instance_factory(stack, owner, src, tail, options.output)
+            strategy = _solve_bisect if options.strategy == "bisect" else _solve_instances
+            solver, result = strategy(owner, create_inst, how_to_solve, src, options)
+    return solver, resources.with_usage(result, governor.usage)
+
+
+def _instance_factory(stack: contextlib.ExitStack, owner: _Solvable, src: str, tail: str, output):
+    # returns function, which creates the instance for the solver or for the part of the problem,
+    # instances are released when ``stack`` is closed
+    model = owner._root()
+
+    def create_inst(mzn_solver, part_src=None):
+        if part_src is not None:
+            # parts are solved concurrently, so every part gets its own instance
+            mzn_model = minizinc.Model()
+            mzn_model.add_string(src)
+            return model._create_inst(mzn_model, mzn_solver, part_src)
+        if owner is model:
+            # the analysed instance of the source code is reused by solves of the same model
+            inst = stack.enter_context(prepared.branch(src, mzn_solver))
+            model._set_data(inst)
+            return inst
+        # the branch adds its constraints and the solve item to the instance with compiled model and data
+        inst = stack.enter_context(model._base_instance(mzn_solver, output).branch())
+        inst.add_string(tail)
         return inst
+
+    return create_inst
+
+
+@tracing.phase("solver")
+def _solve_instances(owner: _Solvable, create_inst, how_to_solve: tuple, src: str, options: _SolveOptions):
+    # solves instances created for every solver (or for every part of the problem), returns the solver and result
+    model = owner._root()
+    method, solver, n_processes = how_to_solve[0], options.solver, options.n_processes
+    solve_kwargs = options.solve_kwargs
+    if options.monitored and not isinstance(solver, str):
+        raise ValueError("stop_when and checkpoint can't be combined with several solvers")
+    if options.split:
+        if not isinstance(solver, str):
+            raise ValueError("split can't be combined with several solvers")
+        parts = model._split_parts(options.split, options.split_on, owner._branch_constraints())
+        mzn_solver = registry.lookup(solver)
+        instances = [create_inst(mzn_solver, constraints_to_zinc(part)) for part in parts]
+        return solver, partition.solve(mzn_solver, instances, n_processes, **solve_kwargs)
+    if isinstance(solver, str) and options.monitored:
+        mzn_solver = registry.lookup(solver)
+        inst = create_inst(mzn_solver)
+        maximize = method == "maximize"
+        bound = options.upper_bound if maximize else options.lower_bound
+        checkpoint = model._checkpoint(how_to_solve, options)
+        result = stopping.solve(
+            inst, mzn_solver, n_processes, options.stop_when, maximize, bound, checkpoint, **solve_kwargs
+        )
+        return solver, result
+    if isinstance(solver, str):
+
+        def solve():
+            mzn_solver = registry.lookup(solver)
+            inst = create_inst(mzn_solver)
+            with solver_threads(mzn_solver, n_processes) as processes:
+                return inst.solve(processes=processes, **solve_kwargs)
+
+        # the source code and the data of the instance are the key of the result cache
+        return solver, solve_cached(solve, method, src, model._instance_data(), solver, n_processes, solve_kwargs)
+    instances = {tag: (s, create_inst(s)) for tag, s in portfolio.lookup_available(solver)}
+    return portfolio.solve(instances, method, processes=n_processes, **solve_kwargs)
+
+
+@tracing.phase("solver")
+def _solve_bisect(owner: _Solvable, create_inst, how_to_solve: tuple, src: str, options: _SolveOptions):
+    # probes are solved concurrently, so they are created as parts of the problem
+    if not isinstance(options.solver, str) or options.monitored:
+        raise ValueError("bisect strategy can't be combined with several solvers, stop_when and checkpoint")
+    mzn_solver = registry.lookup(options.solver)
+    result = bisection.solve(
+        lambda constraints: create_inst(mzn_solver, constraints_to_zinc(constraints)),
+        how_to_solve[1],
+        how_to_solve[0] == "maximize",
+        mzn_solver,
+        options.lower_bound,
+        options.upper_bound,
+        options.workers,
+        options.n_processes,
+        **options.solve_kwargs,
+    )
+    return options.solver, result
+
+
+def _solve_vectorised(model: Model, constraints: list, how_to_solve: tuple, options: _SolveOptions) -> minizinc.Result:
+    # ``constraints`` are added to the constraints of the model,
+    # numpy is an optional dependency, so the solver is imported on demand
+    from zython.solver import vectorised
+
+    if options.customised or options.decompose or options.limits is not None:
+        raise ValueError(
+            "numpy solver can't be combined with split, decompose, bisect strategy, stop_when, checkpoint and limits"
+        )
+    model._compile_declarations()
+    constraints = list(model.constraints) + constraints
+    output = _output_names(model._ir, options.output)
+    with tracing.phase("solver"):
+        return vectorised.solve(
+            model._ir,
+            constraints,
+            how_to_solve,
+            all_solutions=options.all_solutions,
+            timeout=options.timeout,
+            output=output,
+        )
+
+
+def _output_names(ir, output) -> Optional[FrozenSet[str]]:
+    # names of variables printed by the solver, None means all variables, which aren't declared with output=False
+    if output is None:
+        return None
+    names = frozenset([output] if isinstance(output, str) else output)
+    unknown = names - ir.vars.keys()
+    if unknown:
+        raise ValueError(f"output should contain names of variables, but {sorted(unknown)} aren't variables")
+    return names
+
+
+def _evaluate(model, constraints, assignments, objective):
+    # ``constraints`` are added to the constraints of the model,
+    # numpy is an optional dependency, so the evaluation is imported on demand
+    from zython.evaluation import evaluate
+
+    model._compile_declarations()
+    return evaluate(model._ir, list(model.constraints) + constraints, assignments, objective)
+
+
+def _as_result(result, solver, result_as, model, how_to_solve):
+    # the result keeps the model and the objective, so solutions can be verified
+    if result_as:
+        return result_as(result)
+    objective = how_to_solve[1] if len(how_to_solve) > 1 else None
+    # the objective restored from the checkpoint is minizinc source code, which can't be evaluated
+    objective = None if isinstance(objective, str) else objective
+    return Result(result, solver=solver, model=model, objective=objective, timings=_timings(result))
+
+
+def _timings(result) -> dict:
+    # durations of phases measured by zython and durations of flattening and search reported by minizinc,
+    # durations of the result are written to its own dict, the timings of the solve are shared, because
+    # the solve phase ends after the result is created
+    timings = {}
+    for phase, name in (("flatten", "flatTime"), ("search", "solveTime")):
+        value = result.statistics.get(name)
+        if isinstance(value, timedelta):
+            timings[phase] = value.total_seconds()
+    solve_timings = tracing.current_timings()
+    return collections.ChainMap(timings) if solve_timings is None else collections.ChainMap(timings, solve_timings)
+
+
+def _objective_bounds(how_to_solve, lower_bound, upper_bound, strategy) -> list:
+    # known bounds of the objective are added as constraints
+    if strategy not in ("default", "bisect"):
+        raise ValueError(f"strategy should be 'default' or 'bisect', but it is {strategy!r}")
+    if how_to_solve[0] == "satisfy":
+        return []
+    objective = how_to_solve[1]
+    bounds = []
+    if isinstance(objective, str):
+        # the objective is restored from the checkpoint as minizinc source code
+        if lower_bound is not None:
+            bounds.append(f"({objective}) >= {lower_bound}")
+        if upper_bound is not None:
+            bounds.append(f"({objective}) <= {upper_bound}")
+        return bounds
+    if lower_bound is not None:
+        bounds.append(objective >= lower_bound)
+    if upper_bound is not None:
+        bounds.append(objective <= upper_bound)
+    return bounds
+
+
+def _instance_data(ir: IR) -> dict:
+    data = {name: param.value for name, param in ir.pars.items()}
+    for name, param in ir.vars.items():
+        # minizinc support values passing in data files
+        # https://www.minizinc.org/doc-2.6.4/en/modelling.html#real-number-solving
+        # so there is need to assign such variables
+        if param.value is not None and not isinstance(param.value, Constraint):
+            data[name] = param.value
+    for e in ir.enums:
+        data[e.__name__] = e
+    return data
@@ -0,0 +1,176 @@
+"""Lexicographic and Pareto optimisation of several objectives on top of one compiled model."""
+
+import asyncio
+import functools
+import operator
+import time
+from datetime import timedelta
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import minizinc
+
+from zython._compile.zinc.zinc import constraints_to_zinc
+from zython.result import Result
+from zython.solver import registry
+from zython.solver.cpu_budget import solver_threads_async
+
+
+class Stage(NamedTuple):
+    """Stage of lexicographic optimisation
+
+    Attributes
+    ----------
+    objective:
+        expression optimised at the stage
+    result: Result
+        the best solution found at the stage, objectives of previous stages are fixed to their values
+    time: timedelta
+        wall time of the stage
+    """
+
+    objective: Any
+    result: Result
+    time: timedelta
+
+
+class ParetoPoint(NamedTuple):
+    """Solution, which isn't dominated by other solutions
+
+    Attributes
+    ----------
+    values: tuple
+        values of objectives in the order they were passed
+    result: Result
+        the solution
+    stages: list of Stage
+        stages of lexicographic optimisation, which found the solution
+    """
+
+    values: Tuple[Any, ...]
+    result: Result
+    stages: List[Stage]
+
+
+def lexicographic(
+    model,
+    objectives: Sequence[Any],
+    *,
+    constraints: Sequence[Any] = (),
+    maximize: Union[bool, Sequence[bool]] = False,
+    time_per_stage: Optional[timedelta] = None,
+    solver: str = "gecode",
+) -> List[Stage]:
+    """Optimises objectives one by one, every objective is bounded by its best value for the next ones
+
+    See ``zn.Model.solve_lexicographic`` for the description of parameters,
+    ``constraints`` are added to every stage, they are used to optimise a branch of the model.
+    """
+    goals = _goals(objectives, maximize)
+    mzn_solver = registry.lookup(solver)
+    base = model._base_instance(mzn_solver)
+    return asyncio.run(_lexicographic(model, base, solver, list(constraints), goals, dict(timeout=time_per_stage)))
+
+
+def pareto_front(
+    model,
+    objectives: Sequence[Any],
+    *,
+    constraints: Sequence[Any] = (),
+    maximize: Union[bool, Sequence[bool]] = False,
+    time_per_stage: Optional[timedelta] = None,
+    max_points: Optional[int] = None,
+    workers: int = 1,
+    solver: str = "gecode",
+) -> List[ParetoPoint]:
+    """Finds solutions, which aren't dominated by other solutions
+
+    See ``zn.Model.pareto_front`` for the description of parameters,
+    ``constraints`` are added to every stage, they are used to explore a branch of the model.
+    """
+    if not 0 < workers:
+        raise ValueError(f"workers should be positive, but it is {workers}")
+    goals = _goals(objectives, maximize)
+    mzn_solver = registry.lookup(solver)
+    # concurrent searches need their own base instances, because minizinc locks the parent of a branch
+    bases = [model._base_instance(mzn_solver)]
+    for _ in range(min(workers, len(goals)) - 1):
+        bases.append(model._create_inst(model._declarations_model(), mzn_solver))
+    # every search optimises objectives in its own order, so searches end at different points of the front
+    orders = [list(range(i, len(goals))) + list(range(i)) for i in range(len(bases))]
+    solve_kwargs = dict(timeout=time_per_stage)
+    front: List[ParetoPoint] = []
+    while max_points is None or len(front) < max_points:
+        region = list(constraints) + [_not_dominated(goals, point.values) for point in front]
+        searches = asyncio.run(_explore(model, bases, solver, region, goals, orders, solve_kwargs))
+        found = False
+        for order, stages in zip(orders, searches):
+            if len(stages) < len(goals) or not stages[-1].result.original.status.has_solution():
+                continue
+            values: List[Any] = [None] * len(goals)
+            for i, stage in zip(order, stages):
+                values[i] = stage.result.original.objective
+            if any(point.values == tuple(values) for point in front):
+                continue
+            front.append(ParetoPoint(tuple(values), stages[-1].result, stages))
+            found = True
+        if not found:
+            break
+    return sorted(front[:max_points], key=lambda point: point.values)
+
+
+async def _explore(model, bases, solver, region, goals, orders, solve_kwargs) -> List[List[Stage]]:
+    searches = [
+        _lexicographic(model, base, solver, region, [goals[i] for i in order], solve_kwargs)
+        for base, order in zip(bases, orders)
+    ]
+    return await asyncio.gather(*searches)
+
+
+async def _lexicographic(
+    model,
+    base: minizinc.Instance,
+    solver: str,
+    constraints: List[Any],
+    goals: List[Tuple[str, Any]],
+    solve_kwargs: Dict[str, Any],
+) -> List[Stage]:
+    stages: List[Stage] = []
+    fixed: List[Any] = []
+    previous = None
+    for method, objective in goals:
+        # the solution of the previous stage is feasible for the next one
+        annotations = model._solve_annotations(previous)
+        src = constraints_to_zinc(constraints + fixed, (method, objective), annotations)
+        start = time.monotonic()
+        with base.branch() as inst:
+            inst.add_string(src)
+            async with solver_threads_async(registry.lookup(solver), None) as processes:
+                mzn_result = await inst.solve_async(processes=processes, **solve_kwargs)
+            # the result keeps the branch of the stage, so its solution can be verified
+            branch = model.branch(*constraints, *fixed)
+            result = Result(mzn_result, solver=solver, model=branch, objective=objective)
+        stages.append(Stage(objective, result, timedelta(seconds=time.monotonic() - start)))
+        if not mzn_result.status.has_solution():
+            break
+        # the objective is bounded by its value rather than fixed, equality of float objectives is fragile
+        value = mzn_result.objective
+        fixed.append(objective >= value if method == "maximize" else objective <= value)
+        previous = result
+    return stages
+
+
+def _goals(objectives: Sequence[Any], maximize: Union[bool, Sequence[bool]]) -> List[Tuple[str, Any]]:
+    objectives = list(objectives)
+    if not objectives:
+        raise ValueError("at least one objective should be specified")
+    if isinstance(maximize, bool):
+        maximize = [maximize] * len(objectives)
+    elif len(maximize) != len(objectives):
+        raise ValueError(f"{len(objectives)} objectives, but {len(maximize)} maximize flags are specified")
+    return [("maximize" if m else "minimize", objective) for m, objective in zip(maximize, objectives)]
+
+
+def _not_dominated(goals: List[Tuple[str, Any]], values: Tuple[Any, ...]):
+    # the solution should be better than the point by at least one objective
+    better = [objective > v if method == "maximize" else objective < v for (method, objective), v in zip(goals, values)]
+    return functools.reduce(operator.or_, better)
@@ -0,0 +1,268 @@
+from collections.abc import Mapping
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from zython.result import Result
+from zython.var_par.collections.array import ArrayMixin, ArrayView
+from zython.var_par.collections.set import SetVar
+from zython.var_par.get_type import is_enum
+from zython.var_par.var import var
+
+
+class Annotation:
+    """Annotation of the solve item, it is compiled as minizinc call ``name(params)``"""
+
+    def __init__(self, name: str, *params):
+        self.name = name
+        self.params = params
+
+
+VAR_SELECT = (
+    "input_order",
+    "first_fail",
+    "anti_first_fail",
+    "smallest",
+    "largest",
+    "occurrence",
+    "most_constrained",
+    "max_regret",
+    "dom_w_deg",
+)
+INT_VAL_SELECT = (
+    "indomain_min",
+    "indomain_max",
+    "indomain_middle",
+    "indomain_median",
+    "indomain",
+    "indomain_random",
+    "indomain_split",
+    "indomain_reverse_split",
+    "indomain_interval",
+)
+FLOAT_VAL_SELECT = ("indomain_split", "indomain_reverse_split")
+SET_VAL_SELECT = ("indomain_min", "indomain_max", "outdomain_min", "outdomain_max")
+
+
+def int_search(variables, var_select: str = "input_order", val_select: str = "indomain_min") -> Annotation:
+    """Search annotation for integer variables
+
+    Parameters
+    ----------
+    variables: var, Array, slice of Array or list of var
+        variables to search on, arrays are searched in the row-major order
+    var_select: str
+        how the next variable to assign is chosen, one of ``VAR_SELECT``, e.g. "first_fail"
+    val_select: str
+        how the value for the variable is chosen, one of ``INT_VAL_SELECT``, e.g. "indomain_min"
+
+    Examples
+    --------
+
+    >>> import zython as zn
+    >>> class MyModel(zn.Model):
+    ...     def __init__(self):
+    ...         self.a = zn.Array(zn.var(range(10)), shape=5)
+    ...         self.constraints = [zn.alldifferent(self.a)]
+    >>> model = MyModel()
+    >>> model.solve_satisfy(search=zn.int_search(model.a, "input_order", "indomain_max"))["a"]
+    [9, 8, 7, 6, 5]
+    """
+    _check_choice("var_select", var_select, VAR_SELECT)
+    _check_choice("val_select", val_select, INT_VAL_SELECT)
+    return Annotation("int_search", _search_variables(variables), var_select, val_select)
+
+
+def float_search(
+    variables, precision: float, var_select: str = "input_order", val_select: str = "indomain_split"
+) -> Annotation:
+    """Search annotation for float variables
+
+    Parameters
+    ----------
+    variables: var, Array, slice of Array or list of var
+        variables to search on
+    precision: float
+        minimal size of the domain, when the variable is considered as assigned
+    var_select: str
+        one of ``VAR_SELECT``
+    val_select: str
+        one of ``FLOAT_VAL_SELECT``
+    """
+    _check_choice("var_select", var_select, VAR_SELECT)
+    _check_choice("val_select", val_select, FLOAT_VAL_SELECT)
+    return Annotation("float_search", _search_variables(variables), precision, var_select, val_select)
+
+
+def set_search(variables, var_select: str = "input_order", val_select: str = "indomain_min") -> Annotation:
+    """Search annotation for set variables
+
+    Parameters
+    ----------
+    variables: var or list of var
+        set variables to search on
+    var_select: str
+        one of ``VAR_SELECT``
+    val_select: str
+        one of ``SET_VAL_SELECT``
+    """
+    _check_choice("var_select", var_select, VAR_SELECT)
+    _check_choice("val_select", val_select, SET_VAL_SELECT)
+    return Annotation("set_search", _search_variables(variables), var_select, val_select)
+
+
+def seq_search(searches: Sequence[Annotation]) -> Annotation:
+    """Applies search annotations one after another
+
+    Examples
+    --------
+
+    >>> import zython as zn
+    >>> class MyModel(zn.Model):
+    ...     def __init__(self):
+    ...         self.a = zn.Array(zn.var(range(10)), shape=(2, 3))
+    ...         self.x = zn.var(range(10))
+    ...         self.constraints = [zn.alldifferent(self.a[0, :]), self.x > self.a[0, 0]]
+    >>> model = MyModel()
+    >>> search = zn.seq_search([zn.int_search(model.a[0, :], "first_fail"), zn.int_search(model.x)])
+    >>> model.solve_satisfy(search=search)["x"]
+    1
+    """
+    searches = list(searches)
+    if not searches or not all(isinstance(s, Annotation) for s in searches):
+        raise ValueError("seq_search expects non-empty sequence of search annotations")
+    return Annotation("seq_search", searches)
+
+
+def restart_constant(scale: int) -> Annotation:
+    """Restarts the search after ``scale`` nodes"""
+    return Annotation("restart_constant", scale)
+
+
+def restart_linear(scale: int) -> Annotation:
+    """Restarts the search, the i-th restart happens after ``i * scale`` nodes"""
+    return Annotation("restart_linear", scale)
+
+
+def restart_geometric(base: float, scale: int) -> Annotation:
+    """Restarts the search, the i-th restart happens after ``scale * base ** i`` nodes"""
+    return Annotation("restart_geometric", float(base), scale)
+
+
+def restart_luby(scale: int) -> Annotation:
+    """Restarts the search according to Luby sequence multiplied by ``scale``"""
+    return Annotation("restart_luby", scale)
+
+
+def restart_none() -> Annotation:
+    """Disables restarts"""
+    return Annotation("restart_none")
+
+
+def _check_choice(param: str, value: str, allowed):
+    if value not in allowed:
+        raise ValueError(f"{param} should be one of {allowed}, but it is {value!r}")
+
+
+def _search_variables(variables):
+    # minizinc searches on an array, scalar variables should be wrapped into it
+    if _is_scalar(variables):
+        return [variables]
+    if isinstance(variables, ArrayMixin):
+        return variables
+    if isinstance(variables, (list, tuple)):
+        if not all(_is_scalar(v) for v in variables):
+            raise TypeError("list of variables to search can contain only scalar variables and array elements")
+        return list(variables)
+    raise TypeError(f"Can't search on {type(variables).__name__}, variable, array or list of variables expected")
+
+
+def _is_scalar(v) -> bool:
+    if isinstance(v, ArrayView):
+        return not any(isinstance(p, slice) for p in v.pos)
+    return isinstance(v, var) and not isinstance(v, ArrayMixin)
+
+
+def _auto_search(variables: Dict[str, var], order: List[str], ordering: str) -> Optional[Annotation]:
+    """Returns search annotation, which assigns variables in the specified order
+
+    Consecutive scalar variables are searched by one ``int_search``.
+    """
+    var_select = "first_fail" if ordering == "most_constrained" else "input_order"
+    groups: List[Any] = []
+    for name in order:
+        v = variables[name]
+        if isinstance(v, ArrayMixin):
+            groups.append(v)
+        elif groups and isinstance(groups[-1], list):
+            groups[-1].append(v)
+        else:
+            groups.append([v])
+    searches = [int_search(g, var_select, "indomain_min") for g in groups]
+    if not searches:
+        return None
+    if len(searches) == 1:
+        return searches[0]
+    return seq_search(searches)
+
+
+def _as_annotations(search: Union[None, Annotation, Sequence[Annotation]]) -> List[Annotation]:
+    if search is None:
+        return []
+    if isinstance(search, Annotation):
+        return [search]
+    search = list(search)
+    if not all(isinstance(s, Annotation) for s in search):
+        raise TypeError("search should be an annotation or a list of annotations, e.g. zn.int_search(...)")
+    return search
+
+
+def _warm_start(variables: Dict[str, var], values) -> Optional[Annotation]:
+    """Returns ``warm_start_array`` annotation with hints for the solver
+
+    Parameters
+    ----------
+    variables: dict
+        variables of the model by name
+    values: dict or Result
+        values of variables by name, e.g. a result of the previous solution.
+        Fields of the result, which aren't variables of the model (e.g. objective), are skipped.
+    """
+    from_result = isinstance(values, Result)
+    if from_result:
+        values = _last_solution(values)
+    elif not isinstance(values, Mapping):
+        raise TypeError(f"warm_start should be a dict or Result, but it is {type(values).__name__}")
+    hints = []
+    for name, value in values.items():
+        v = variables.get(name)
+        if v is None:
+            if from_result:
+                continue
+            raise ValueError(f"warm_start refers to '{name}', which isn't a variable of the model")
+        # minizinc supports warm start for int, float, bool and set variables only, zython enums are skipped
+        if value is None or is_enum(v.type) or isinstance(v, SetVar):
+            continue
+        if isinstance(v, ArrayMixin):
+            hints.append(Annotation("warm_start", v, _flatten(value)))
+        else:
+            hints.append(Annotation("warm_start", [v], [value]))
+    if not hints:
+        return None
+    return Annotation("warm_start_array", hints)
+
+
+def _last_solution(result) -> Dict[str, Any]:
+    # for several solutions the last one is used, it is the best for optimisation problems
+    solution = result.original.solution
+    if isinstance(solution, list):
+        solution = solution[-1] if solution else None
+    if solution is None:
+        return {}
+    return {name: value for name, value in vars(solution).items() if not name.startswith("_")}
+
+
+def _flatten(value) -> List[Any]:
+    if hasattr(value, "tolist"):
+        value = value.tolist()
+    if not isinstance(value, (list, tuple)):
+        return [value]
+    return [item for v in value for item in _flatten(v)]
@@ -1,10 +1,15 @@
+import functools
+import itertools
+import math
 from collections import namedtuple
 from functools import singledispatch
-from typing import Any
-import typing
+from types import SimpleNamespace
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Type
 
 import minizinc
 
+from zython import tracing
+
 
 class Result:
     """Represents model solution
@@ -16,30 +21,151 @@ class Result:
 
     """
 
-    def __init__(self, mzn_result: minizinc.Result):
+    def __init__(
+        self, mzn_result: minizinc.Result, solver: Optional[str] = None, model=None, objective=None, timings=None
+    ):
         self._original = mzn_result
-        if mzn_result.solution is not None:
-            if isinstance(mzn_result.solution, list):
-                if mzn_result.solution:
-                    # several solutions
-                    names, Solution = _generate_solution_class_and_field_names(mzn_result.solution[0])
-                    solutions = []
-                    for i in range(len(mzn_result.solution)):
-                        solutions.append(Solution(*convert_result_value((mzn_result[i, name]) for name in names)))
-                    self._solution = solutions
-                else:
+        self._solver = solver
+        # the model (or its branch) and the objective, which were solved, they are used by ``verify``
+        self._model = model
+        self._objective = objective
+        # values of variables by name, they are converted on demand
+        self._columns = {}
+        self._timings = {} if timings is None else timings
+
+    @functools.cached_property
+    def _solution(self):
+        # solutions are converted on the first access only, many results are used through ``original`` or columns
+        solution = self._original.solution
+        if solution is None:
+            return None
+        with tracing.phase("convert", self._timings):
+            if isinstance(solution, list):
+                if not solution:
                     # no solutions while all_solutions=True
-                    self._solution = None
-            else:
-                names, Solution = _generate_solution_class_and_field_names(mzn_result.solution)
-                self._solution = Solution(*(convert_result_value(mzn_result[name]) for name in names))
-        else:
-            self._solution = None
+                    return None
+                names = _field_names(solution[0])
+                Solution = _solution_class(names)
+                return [Solution(*(convert_result_value(getattr(s, name)) for name in names)) for s in solution]
+            names = _field_names(solution)
+            return _solution_class(names)(*(convert_result_value(getattr(solution, name)) for name in names))
 
     @property
     def original(self):
         return self._original
 
+    @property
+    def solver(self) -> Optional[str]:
+        """Tag of the solver which found the result, useful when several solvers were raced"""
+        return self._solver
+
+    @property
+    def resources(self):
+        """Wall time, CPU time and peak memory of minizinc and solver processes, see ``zn.ResourceUsage``
+
+        None if the solve had no ``limits`` and usage accounting wasn't enabled by ``zn.set_usage_accounting``,
+        or the result wasn't solved by minizinc, e.g. it was returned from the result cache.
+        """
+        return self._original.statistics.get("resources")
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        """Durations of phases of the solve in seconds
+
+        - "solve": the whole ``solve_*`` call
+        - "ir" and "to_zinc": compilation of the model, they are missing if the compiled model was reused
+        - "solver": the run of minizinc or another solver
+        - "flatten" and "search": flattening and search reported by minizinc
+        - "convert": conversion of solutions, it is added on the first access to values
+        """
+        return dict(self._timings)
+
+    def verify(self) -> bool:
+        """Checks by numpy that all solutions satisfy the constraints of the model and the objective is correct
+
+        It is a shortcut of ``Model.evaluate`` for the solutions of the result, which doesn't use the solver.
+        True is returned if there are no solutions.
+
+        Raises
+        ------
+        ValueError
+            If the result isn't returned by ``solve_*`` method of the model or its branch,
+            decision variables weren't returned because of ``output`` argument or ``output=False`` of the variables,
+            or the model can't be evaluated by numpy.
+        """
+        from zython.model import Model
+
+        if self._model is None:
+            raise ValueError("the result isn't bound to the model, please use Model.evaluate")
+        if self._solution is None:
+            return True
+        solutions = self._solution if isinstance(self._solution, list) else [self._solution]
+        model = self._model if isinstance(self._model, Model) else self._model.model
+        model._compile_declarations()
+        # variables defined by expressions are evaluated, values of decision variables are required
+        missing = [name for name, v in model._ir.vars.items() if v.value is None and name not in solutions[0]._fields]
+        if missing:
+            raise ValueError(
+                f"the result can't be verified, because values of {sorted(missing)} weren't returned by the solver, "
+                "they are excluded by output argument of solve_* method or output=False of the variables"
+            )
+        evaluation = self._model.evaluate([s._asdict() for s in solutions], objective=self._objective)
+        if not evaluation.feasible.all():
+            return False
+        if self._objective is None or "objective" not in solutions[0]._fields:
+            return True
+        return all(math.isclose(s.objective, value) for s, value in zip(solutions, evaluation.objective.tolist()))
+
+    def to_numpy(self, name: str):
+        """Returns values of the variable as numpy array
+
+        If the result has several solutions, the first axis is the number of the solution,
+        other axes are the axes of the array variable. Columns are cached, so the values are converted once.
+
+        Raises
+        ------
+        KeyError
+            If there is no solution or the variable with such name.
+        """
+        import numpy as np
+
+        column = self._columns.get(name)
+        if column is None:
+            solution = self._original.solution
+            if not solution:
+                raise KeyError(f"the result has no solution, so there is no value of {name}")
+            if isinstance(solution, list):
+                column = np.asarray([getattr(s, name) for s in solution])
+            else:
+                column = np.asarray(getattr(solution, name))
+            if column.dtype.kind == "f":
+                # the same as convert_result_value: -0.0 is converted to 0.0
+                column = column + 0.0
+            self._columns[name] = column
+        return column
+
+    def to_dataframe(self):
+        """Returns solutions as pandas DataFrame, one row per solution
+
+        Elements of array variables are separate columns, e.g. ``a[0, 1]``. It requires pandas to be installed.
+        """
+        import pandas as pd
+
+        solution = self._original.solution
+        if not solution:
+            return pd.DataFrame()
+        columns = {}
+        for name in _field_names(solution[0] if isinstance(solution, list) else solution):
+            values = self.to_numpy(name)
+            if not isinstance(solution, list):
+                values = values[None]
+            if values.ndim == 1:
+                columns[name] = values
+                continue
+            for index in itertools.product(*map(range, values.shape[1:])):
+                columns[f"{name}[{', '.join(map(str, index))}]"] = values[(slice(None), *index)]
+        return pd.DataFrame(columns)
+
     def __getitem__(self, item):
         return self._original[item]
 
@@ -63,6 +189,20 @@ def as_original(mzn_result: minizinc.Result):
     return mzn_result
 
 
+def detach(mzn_result: minizinc.Result) -> minizinc.Result:
+    """Returns copy of the result, which doesn't refer to solution classes generated by minizinc
+
+    minizinc generates solution dataclass for every instance, so its results can't be pickled
+    and sent to another process.
+    """
+    solution = mzn_result.solution
+    if isinstance(solution, list):
+        solution = [SimpleNamespace(**vars(s)) for s in solution]
+    elif solution is not None:
+        solution = SimpleNamespace(**vars(solution))
+    return minizinc.Result(mzn_result.status, solution, mzn_result.statistics)
+
+
 @singledispatch
 def convert_result_value(value: Any) -> Any:
     return value
@@ -73,9 +213,11 @@ def _(value: float) -> float:
     return -value if value == -0.0 else value
 
 
-def _generate_solution_class_and_field_names(
-    mzn_solution,
-) -> typing.Tuple[typing.Tuple[str, ...], typing.NamedTuple]:
-    names = [name for name in vars(mzn_solution) if not name.startswith("_")]
-    Solution = namedtuple("Solution", names)
-    return names, Solution
+def _field_names(mzn_solution) -> Tuple[str, ...]:
+    return tuple(name for name in vars(mzn_solution) if not name.startswith("_"))
+
+
+@functools.lru_cache(maxsize=256)
+def _solution_class(names: Tuple[str, ...]) -> Type[NamedTuple]:
+    # solution classes are shared by results with the same variables, e.g. results of the same model
+    return namedtuple("Solution", names)
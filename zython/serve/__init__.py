@@ -0,0 +1,26 @@
+"""Local solve service, which lets short-living processes share prepared models and a concurrency limit
+
+Start the service with ``python -m zython.serve --port 8765`` or ``python -m zython.serve --socket /tmp/zython.sock``
+and send jobs with ``zython.serve.client.solve``.
+
+A job is a json object with either
+
+- ``model``: path of the model class as ``"package.module:ClassName"``, ``kwargs`` to create it,
+  ``method`` ("satisfy", "minimize" or "maximize") and ``objective`` - name of the model attribute to optimise,
+
+or
+
+- ``src``: compiled source code (``zn.Model.src``) and ``data`` with values of its parameters.
+
+Optional fields are ``solver``, ``all_solutions``, ``optimisation_level``, ``n_processes``, ``random_seed``,
+``timeout`` (seconds), ``priority`` (jobs with higher priority are solved first) and ``deadline``
+(seconds since submission, after which the job is cancelled).
+
+Jobs, which reached their deadline, are answered with 504 status, jobs, which were rejected or were still queued
+when the service stopped, with 503 status.
+
+``GET /metrics`` returns queue depth, number of running and processed jobs and latency percentiles.
+"""
+
+from zython.serve.server import serve, create_server, close_server
+from zython.serve.service import Job, SolveService
@@ -0,0 +1,21 @@
+import argparse
+
+from zython.serve.server import serve
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog="python -m zython.serve", description="Run local zython solve service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--socket", dest="socket_path", help="listen the unix socket instead of tcp port")
+    parser.add_argument("--workers", type=int, default=4, help="maximal number of concurrent solves")
+    parser.add_argument("--max-queue", type=int, default=1000, help="maximal number of waiting jobs")
+    args = parser.parse_args(args)
+    try:
+        serve(args.host, args.port, socket_path=args.socket_path, workers=args.workers, max_queue=args.max_queue)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
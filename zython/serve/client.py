@@ -0,0 +1,72 @@
+import http.client
+import json
+import socket
+from typing import Any, Dict
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout=None):
+        super().__init__("localhost", timeout=timeout)
+        self._path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
+
+
+class ServiceError(Exception):
+    """Error returned by the solve service"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+
+
+def solve(job: Dict[str, Any], address: str = "http://127.0.0.1:8765", timeout=None) -> Dict[str, Any]:
+    """Sends the job to the solve service and waits for the result
+
+    Parameters
+    ----------
+    job: dict
+        job description, see ``zython.serve`` module documentation.
+    address: str
+        ``http://host:port`` or ``unix:///path/to/socket``
+
+    Returns
+    -------
+    result: dict
+        ``status``, ``solution``, ``statistics`` and time the job spent in the service.
+
+    Raises
+    ------
+    ServiceError
+        If the job was rejected or failed.
+    """
+    return _request("POST", "/solve", address, job, timeout)
+
+
+def metrics(address: str = "http://127.0.0.1:8765", timeout=None) -> Dict[str, Any]:
+    """Returns queue depth, number of running and processed jobs and latency percentiles of the service"""
+    return _request("GET", "/metrics", address, None, timeout)
+
+
+def _request(method, path, address, body, timeout):
+    conn = _connect(address, timeout)
+    try:
+        payload = json.dumps(body).encode() if body is not None else None
+        conn.request(method, path, body=payload, headers={"Content-Type": "application/json"})
+        response = conn.getresponse()
+        reply = json.loads(response.read())
+    finally:
+        conn.close()
+    if response.status != 200:
+        raise ServiceError(response.status, reply.get("error", ""))
+    return reply
+
+
+def _connect(address: str, timeout):
+    if address.startswith("unix://"):
+        return _UnixHTTPConnection(address[len("unix://") :], timeout=timeout)
+    host = address.removeprefix("http://").rstrip("/")
+    return http.client.HTTPConnection(host, timeout=timeout)
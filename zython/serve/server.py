@@ -0,0 +1,115 @@
+import json
+import os
+import socketserver
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from zython.serve.service import DeadlineError, Job, JobError, QueueFullError, ServiceStoppedError, SolveService
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "socketserver.BaseServer"
+
+    def do_GET(self):
+        if self.path == "/metrics":
+            self._reply(HTTPStatus.OK, self.server.service.metrics())
+        else:
+            self._reply(HTTPStatus.NOT_FOUND, {"error": f"unknown path {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/solve":
+            self._reply(HTTPStatus.NOT_FOUND, {"error": f"unknown path {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            spec = json.loads(self.rfile.read(length))
+        except ValueError as e:
+            # invalid length, utf-8 or json
+            self._reply(HTTPStatus.BAD_REQUEST, {"error": f"body should be a json object: {e}"})
+            return
+        try:
+            job = self.server.service.submit(Job(spec))
+        except (QueueFullError, ServiceStoppedError) as e:
+            self._reply(HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(e)})
+            return
+        except JobError as e:
+            self._reply(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+            return
+        job.wait()
+        timings = {"queue_wait": job.started - job.submitted, "latency": job.finished - job.submitted}
+        if job.error is None:
+            self._reply(HTTPStatus.OK, {**job.result, **timings})
+        elif isinstance(job.error, DeadlineError):
+            self._reply(HTTPStatus.GATEWAY_TIMEOUT, {"error": str(job.error), **timings})
+        elif isinstance(job.error, ServiceStoppedError):
+            self._reply(HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(job.error), **timings})
+        else:
+            self._reply(HTTPStatus.UNPROCESSABLE_ENTITY, {"error": str(job.error), **timings})
+
+    def _reply(self, status: HTTPStatus, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        # unix socket clients have no address, and access log is too noisy for the local service
+        pass
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    *,
+    socket_path: Optional[str] = None,
+    workers: int = 4,
+    max_queue: int = 1000,
+):
+    """Runs solve service until it is interrupted
+
+    Parameters
+    ----------
+    host: str
+        Interface to listen, the service isn't supposed to be exposed to network,
+        as it imports and runs model classes specified by clients.
+    port: int
+        Port to listen.
+    socket_path: Optional[str]
+        If specified, the service listens the unix socket instead of tcp port.
+    workers: int
+        Maximal number of jobs solved concurrently.
+    max_queue: int
+        Maximal number of waiting jobs.
+    """
+    server = create_server(host, port, socket_path=socket_path, workers=workers, max_queue=max_queue)
+    try:
+        server.serve_forever()
+    finally:
+        close_server(server)
+
+
+def create_server(host="127.0.0.1", port=8765, *, socket_path=None, workers=4, max_queue=1000):
+    """Creates the server with started worker pool, see ``serve`` for the parameters description"""
+    if socket_path is not None:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = _UnixHTTPServer(socket_path, _Handler)
+    else:
+        server = ThreadingHTTPServer((host, port), _Handler)
+    server.service = SolveService(workers=workers, max_queue=max_queue).start()
+    server.socket_path = socket_path
+    return server
+
+
+def close_server(server):
+    server.server_close()
+    server.service.stop()
+    if server.socket_path is not None and os.path.exists(server.socket_path):
+        os.unlink(server.socket_path)
@@ -0,0 +1,277 @@
+import enum
+import importlib
+import itertools
+import queue
+import statistics
+import threading
+import time
+from collections import deque
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from zython.solver.source import solve_source
+
+
+class JobError(Exception):
+    """Job can't be processed, the message is returned to the client"""
+
+
+class QueueFullError(JobError):
+    pass
+
+
+class DeadlineError(JobError):
+    pass
+
+
+class ServiceStoppedError(JobError):
+    pass
+
+
+class Job:
+    """Solve request, submitted to the service
+
+    The job is either a model class path with keyword arguments for its creation,
+    or already compiled source code with data.
+
+    Parameters
+    ----------
+    spec: dict
+        job description, see ``zython.serve`` module documentation.
+    """
+
+    def __init__(self, spec: Dict[str, Any]):
+        if not isinstance(spec, dict):
+            raise JobError(f"job should be a json object, but it is {type(spec).__name__}")
+        if ("model" in spec) == ("src" in spec):
+            raise JobError("exactly one of 'model' or 'src' should be specified")
+        if not isinstance(spec.get("solver", "gecode"), str):
+            raise JobError("only one solver can be specified")
+        self.spec = spec
+        try:
+            self.priority = int(spec.get("priority", 0))
+            deadline = spec.get("deadline")
+            deadline = float(deadline) if deadline is not None else None
+        except (TypeError, ValueError):
+            raise JobError("priority and deadline should be numbers") from None
+        self.submitted = time.monotonic()
+        self.deadline = self.submitted + deadline if deadline is not None else None
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[Exception] = None
+        self._done = threading.Event()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def compile(self):
+        """Returns source code and data of the job"""
+        spec = self.spec
+        if "src" in spec:
+            return spec["src"], spec.get("data", {})
+        model_cls = _import(spec["model"])
+        model = model_cls(**spec.get("kwargs", {}))
+        method = spec.get("method", "satisfy")
+        how_to_solve = (method,)
+        if method != "satisfy":
+            if "objective" not in spec:
+                raise JobError(f"objective should be specified for {method}")
+            how_to_solve = (method, getattr(model, spec["objective"]))
+        return model.compile(how_to_solve), model._instance_data()
+
+    def solve_kwargs(self, remaining: Optional[float]):
+        spec = self.spec
+        timeout = spec.get("timeout")
+        if remaining is not None:
+            timeout = remaining if timeout is None else min(float(timeout), remaining)
+        return dict(
+            all_solutions=spec.get("all_solutions", False),
+            optimisation_level=spec.get("optimisation_level"),
+            processes=spec.get("n_processes"),
+            timeout=timedelta(seconds=float(timeout)) if timeout is not None else None,
+            random_seed=spec.get("random_seed"),
+        )
+
+    def _finish(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.finished = time.monotonic()
+        self._done.set()
+
+
+class SolveService:
+    """Bounded pool of worker threads, which solve queued jobs by priority
+
+    Every job is solved by minizinc subprocess, so threads are enough to load all cores.
+    Prepared minizinc models and solvers are cached by the process, so jobs with the same source code
+    don't pay for their preparation.
+
+    Parameters
+    ----------
+    workers: int
+        Maximal number of jobs solved concurrently.
+    max_queue: int
+        Maximal number of waiting jobs, new jobs are rejected if the queue is full.
+    """
+
+    def __init__(self, workers: int = 4, max_queue: int = 1000):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._running = 0
+        self._counters = dict.fromkeys(("submitted", "completed", "failed", "rejected", "expired", "cancelled"), 0)
+        self._latencies: deque = deque(maxlen=1000)
+        self._waits: deque = deque(maxlen=1000)
+        self._threads = []
+        self._stopped = threading.Event()
+
+    def start(self):
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"zython-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self):
+        """Stops workers after their current jobs, jobs still in the queue fail with ``ServiceStoppedError``"""
+        with self._lock:
+            self._stopped.set()
+        while True:
+            try:
+                _, _, job = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            job.started = time.monotonic()
+            self._account(job, "cancelled")
+            job._finish(error=ServiceStoppedError("service was stopped before the job was started"))
+        for _ in self._threads:
+            self._queue.put((float("-inf"), next(self._counter), None))
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def submit(self, job: Job) -> Job:
+        with self._lock:
+            if self._stopped.is_set():
+                raise ServiceStoppedError("service is stopped")
+            if self._queue.qsize() >= self.max_queue:
+                self._counters["rejected"] += 1
+                raise QueueFullError(f"queue is full ({self.max_queue} jobs)")
+            self._counters["submitted"] += 1
+            # the job is queued under the lock, so ``stop`` can't miss it
+            # higher priority first, FIFO for the same priority
+            self._queue.put((-job.priority, next(self._counter), job))
+        return job
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(
+                queue_depth=self._queue.qsize(),
+                running=self._running,
+                workers=self.workers,
+                **self._counters,
+                latency=_percentiles(self._latencies),
+                queue_wait=_percentiles(self._waits),
+            )
+
+    def _work(self):
+        while not self._stopped.is_set():
+            _, _, job = self._queue.get()
+            if job is None:
+                return
+            self._process(job)
+
+    def _process(self, job: Job):
+        job.started = time.monotonic()
+        remaining = None
+        if job.deadline is not None:
+            remaining = job.deadline - job.started
+            if remaining <= 0:
+                self._account(job, "expired")
+                job._finish(error=DeadlineError("deadline was exceeded while the job was queued"))
+                return
+        with self._lock:
+            self._running += 1
+        try:
+            src, data = job.compile()
+            solver = job.spec.get("solver", "gecode")
+            mzn_result = solve_source(src, data, solver, job.solve_kwargs(remaining), remaining, job.priority)
+        except TimeoutError:
+            # the solver was terminated, because it was still running at the deadline
+            self._account(job, "expired")
+            job._finish(error=DeadlineError("deadline was exceeded while the job was solved"))
+        except (JobError, TypeError, ValueError, RuntimeError) as e:
+            # invalid kwargs or model, compilation errors and minizinc failures (re-raised by solve_source)
+            self._account(job, "failed")
+            job._finish(error=e)
+        else:
+            self._account(job, "completed")
+            job._finish(result=result_to_json(mzn_result))
+        finally:
+            with self._lock:
+                self._running -= 1
+            if not job._done.is_set():
+                # the error is a bug, it is raised to the worker thread, but the client shouldn't wait forever
+                self._account(job, "failed")
+                job._finish(error=JobError("internal error of the service"))
+
+    def _account(self, job: Job, counter: str):
+        now = time.monotonic()
+        with self._lock:
+            self._counters[counter] += 1
+            self._waits.append(job.started - job.submitted)
+            self._latencies.append(now - job.submitted)
+
+
+def result_to_json(mzn_result) -> Dict[str, Any]:
+    """Converts minizinc result to json serializable dict"""
+    solution = mzn_result.solution
+    if isinstance(solution, list):
+        solution = [_solution_to_json(s) for s in solution]
+    elif solution is not None:
+        solution = _solution_to_json(solution)
+    return dict(
+        status=str(mzn_result.status),
+        solution=solution,
+        statistics={k: _to_json(v) for k, v in mzn_result.statistics.items()},
+    )
+
+
+def _solution_to_json(solution):
+    return {k: _to_json(v) for k, v in vars(solution).items() if not k.startswith("_")}
+
+
+def _to_json(value):
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, enum.Enum):
+        return value.name
+    if isinstance(value, (set, frozenset)):
+        return sorted(_to_json(v) for v in value)
+    if isinstance(value, (list, tuple, range)):
+        return [_to_json(v) for v in value]
+    return value
+
+
+def _percentiles(values):
+    if not values:
+        return None
+    values = sorted(values)
+    return dict(
+        p50=statistics.median(values),
+        p95=values[min(len(values) - 1, int(len(values) * 0.95))],
+        max=values[-1],
+    )
+
+
+def _import(path: str):
+    module_name, _, name = path.partition(":")
+    if not name:
+        raise JobError(f"model should be specified as 'package.module:ClassName', but it is {path!r}")
+    try:
+        return getattr(importlib.import_module(module_name), name)
+    except (ImportError, AttributeError) as e:
+        raise JobError(f"model {path!r} can't be imported: {e}") from None
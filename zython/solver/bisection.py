@@ -0,0 +1,137 @@
+"""Parallel bisection over the objective of an optimisation problem with bounded probes."""
+
+import asyncio
+import contextlib
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+import minizinc
+from minizinc import Status
+
+from zython.solver.cpu_budget import solver_threads_async
+
+
+def probes(lower: int, upper: int, workers: int) -> List[int]:
+    """Returns bounds to probe, which split values from ``lower`` to ``upper - 1`` into ``workers + 1`` parts
+
+    ``lower`` is the proven bound of the objective and ``upper`` is the objective of the best solution,
+    both are for minimisation.
+    """
+    return sorted({lower + (upper - lower) * i // (workers + 1) for i in range(1, workers + 1)})
+
+
+def solve(
+    create_inst: Callable[[List[Any]], minizinc.Instance],
+    objective,
+    maximize: bool,
+    solver: minizinc.Solver,
+    lower_bound: Optional[int],
+    upper_bound: Optional[int],
+    workers: int = 1,
+    processes: Optional[int] = None,
+    **solve_kwargs,
+) -> minizinc.Result:
+    """Finds the optimum by probes ``objective <= k`` for several ``k`` concurrently
+
+    Every probe is stopped after its first solution. A probe with solution improves the best solution,
+    an unsatisfiable probe proves the bound of the objective, so the interval between them is narrowed
+    until it's empty or the timeout is reached. Proven bounds are returned in ``lower_bound``
+    and ``upper_bound`` statistics.
+
+    Parameters
+    ----------
+    create_inst:
+        function, which returns the instance of the optimisation problem with additional constraints
+    objective:
+        integer objective of the problem
+    maximize: bool
+        If True the objective is maximized, otherwise minimized.
+    solver: minizinc.Solver
+        solver of probes
+    lower_bound, upper_bound: Optional[int]
+        known bounds of the objective, the bound, which the objective is optimised towards, is required
+    workers: int
+        number of concurrent probes
+    processes: Optional[int]
+        number of threads of every probe
+    """
+    known = upper_bound if maximize else lower_bound
+    if known is None:
+        side = "upper_bound" if maximize else "lower_bound"
+        raise ValueError(f"bisect strategy requires {side} of the objective")
+    if not 0 < workers:
+        raise ValueError(f"workers should be positive, but it is {workers}")
+    sign = -1 if maximize else 1
+
+    def create_probe(k: Optional[int]) -> minizinc.Instance:
+        # k is the bound of the minimised value sign * objective
+        if k is None:
+            return create_inst([])
+        return create_inst([objective >= -k if maximize else objective <= k])
+
+    return asyncio.run(_bisect(create_probe, sign, sign * known, solver, workers, processes, solve_kwargs))
+
+
+async def _bisect(create_probe, sign, lower, solver, workers, processes, solve_kwargs) -> minizinc.Result:
+    timeout = solve_kwargs.pop("timeout", None)
+    deadline = None if timeout is None else time.monotonic() + timeout.total_seconds()
+    best = await _probe(create_probe(None), solver, processes, _remaining(deadline, solve_kwargs))
+    count = 1
+    if not best.status.has_solution():
+        return minizinc.Result(best.status, None, {"probes": count})
+    upper = sign * best.objective
+    if not isinstance(upper, int):
+        raise ValueError(f"bisect strategy supports integer objectives only, but objective is {best.objective}")
+    while lower < upper and (deadline is None or time.monotonic() < deadline):
+        kwargs = _remaining(deadline, solve_kwargs)
+        tasks = {
+            asyncio.create_task(_probe(create_probe(k), solver, processes, kwargs)): k
+            for k in probes(lower, upper, workers)
+        }
+        count += len(tasks)
+        progress = False
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if result.status.has_solution() and sign * result.objective < upper:
+                        best, upper, progress = result, sign * result.objective, True
+                    elif result.status == Status.UNSATISFIABLE and tasks[task] >= lower:
+                        lower, progress = tasks[task] + 1, True
+                # probes out of the new interval can't narrow it
+                for task in [t for t in pending if not lower <= tasks[t] < upper]:
+                    task.cancel()
+        finally:
+            for task in pending:
+                task.cancel()
+            # wait for cancellation, so minizinc processes are terminated before return
+            await asyncio.gather(*pending, return_exceptions=True)
+        if not progress:
+            break
+    status = Status.OPTIMAL_SOLUTION if lower >= upper else Status.SATISFIED
+    bounds = sorted((sign * lower, sign * upper))
+    statistics = {"probes": count, "lower_bound": bounds[0], "upper_bound": bounds[1]}
+    return minizinc.Result(status, best.solution, statistics)
+
+
+def _remaining(deadline: Optional[float], solve_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    if deadline is None:
+        return solve_kwargs
+    return {**solve_kwargs, "timeout": timedelta(seconds=max(deadline - time.monotonic(), 0.001))}
+
+
+async def _probe(inst: minizinc.Instance, solver: minizinc.Solver, processes: Optional[int], solve_kwargs):
+    # the first solution of the bounded problem is enough, the solver is terminated after it
+    status, statistics = Status.UNKNOWN, {}
+    async with solver_threads_async(solver, processes) as processes:
+        solutions = inst.solutions(processes=processes, intermediate_solutions=True, **solve_kwargs)
+        async with contextlib.aclosing(solutions):
+            async for result in solutions:
+                if result.solution is not None:
+                    return result
+                status = result.status
+                statistics.update(result.statistics)
+    return minizinc.Result(status, None, statistics)
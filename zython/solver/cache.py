@@ -0,0 +1,318 @@
+"""Opt-in process-level cache of solve results, which skips minizinc for repeated requests."""
+
+import collections
+import enum
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, NamedTuple, Optional, Union
+
+import minizinc
+from minizinc import Status
+
+from zython.result import detach
+from zython.solver import registry
+
+_VERSION = 2
+_SUFFIX = ".pickle"
+
+
+class CacheStats(NamedTuple):
+    """Counters of the cache lookups
+
+    Attributes
+    ----------
+    hits: int
+        results returned from the cache
+    misses: int
+        lookups, which weren't found in the cache, so the problem was solved
+    skipped: int
+        solves, which weren't looked up because their configuration is non-deterministic
+        or the key can't be computed exactly
+    evictions: int
+        results removed from the cache because of its size or expired time to live
+    """
+
+    hits: int
+    misses: int
+    skipped: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache:
+    """Keeps results of solves in memory and optionally on disk
+
+    The key of the result is the hash of the compiled source code, the instance data, the solver and its version
+    and the options, which affect the solution: ``all_solutions``, ``optimisation_level``, ``random_seed``
+    and ``n_processes``. Solves with data, which has no exact representation in the key
+    (values other than numbers, strings, collections, enums and numpy arrays), aren't cached.
+    Only complete results are stored: proven optimum, all solutions,
+    unsatisfiability or the solution of satisfaction problem, so ``timeout`` isn't a part of the key.
+    Statistics of the cached result have ``cached`` item.
+
+    Parameters
+    ----------
+    maxsize: int
+        Maximal number of results kept in memory, the least recently used result is evicted first.
+    directory: str or PathLike, optional
+        Directory of the disk tier, results are shared with other processes, which use the same directory.
+        Files are unpickled, so the directory should be writable by trusted users only.
+    max_bytes: int, optional
+        Maximal size of the files of the disk tier, the least recently used files are removed first.
+    ttl: timedelta, optional
+        Time to live of the result in both tiers.
+    allow_nondeterministic: bool
+        Cache results of solves, which may return another solution when repeated:
+        ``n_processes`` greater than 1 without ``random_seed``.
+
+    Examples
+    --------
+
+    > cache = ResultCache(maxsize=2)
+    > result = minizinc.Result(Status.UNSATISFIABLE, None, {})
+    > key = cache.key("var 1..3: x; constraint x > 3;", {}, "gecode", None)
+    > cache.put(key, result)
+    > cache.get(key).status.name, cache.stats.hits
+    ('UNSATISFIABLE', 1)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        directory: Optional[Union[str, os.PathLike]] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[timedelta] = None,
+        allow_nondeterministic: bool = False,
+    ):
+        if maxsize < 0:
+            raise ValueError(f"maxsize should be non-negative, but it is {maxsize}")
+        if max_bytes is not None and directory is None:
+            raise ValueError("max_bytes can be specified for the disk tier only, please set directory")
+        self.maxsize = maxsize
+        self.directory = None if directory is None else Path(directory)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.allow_nondeterministic = allow_nondeterministic
+        self._memory: "collections.OrderedDict[str, tuple]" = collections.OrderedDict()
+        self._counts = dict(hits=0, misses=0, skipped=0, evictions=0)
+        self._lock = threading.Lock()
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**self._counts)
+
+    def key(
+        self,
+        src: str,
+        data: Dict[str, Any],
+        solver: str,
+        n_processes: Optional[int],
+        all_solutions: bool = False,
+        optimisation_level: Optional[int] = None,
+        random_seed: Optional[int] = None,
+        **_,
+    ) -> Optional[str]:
+        """Returns the key of the solve or None if the solve shouldn't be cached
+
+        The solve isn't cached if it is non-deterministic, the solver isn't found
+        or the data can't be represented exactly.
+        """
+        if n_processes is not None and n_processes > 1 and random_seed is None and not self.allow_nondeterministic:
+            return None
+        version = _solver_version(solver)
+        if version is None:
+            return None
+        options = [all_solutions, optimisation_level, random_seed, n_processes]
+        try:
+            content = json.dumps([_VERSION, src, data, solver, version, options], sort_keys=True, default=_stable)
+        except TypeError:
+            # e.g. an object, which repr doesn't identify its value, or keys of different types
+            return None
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[minizinc.Result]:
+        """Returns the cached result or None, the lookup is counted as a hit or a miss"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and self._expired(entry[0]):
+                del self._memory[key]
+                self._counts["evictions"] += 1
+                entry = None
+            if entry is None:
+                entry = self._load(key)
+                if entry is not None:
+                    self._remember(key, entry)
+            else:
+                self._memory.move_to_end(key)
+            self._counts["hits" if entry is not None else "misses"] += 1
+        if entry is None:
+            return None
+        result = entry[1]
+        return minizinc.Result(result.status, result.solution, {**result.statistics, "cached": True})
+
+    def put(self, key: str, result: minizinc.Result):
+        entry = (time.time(), result)
+        with self._lock:
+            self._remember(key, entry)
+            if self.directory is not None:
+                self._dump(key, entry)
+
+    def skip(self):
+        """Counts the solve, which isn't cached because of its configuration"""
+        with self._lock:
+            self._counts["skipped"] += 1
+
+    def clear(self):
+        """Removes all results from both tiers, counters aren't reset"""
+        with self._lock:
+            self._memory.clear()
+            if self.directory is not None:
+                for path in self.directory.glob(f"*{_SUFFIX}"):
+                    path.unlink(missing_ok=True)
+
+    def _expired(self, created: float) -> bool:
+        return self.ttl is not None and time.time() - created > self.ttl.total_seconds()
+
+    def _remember(self, key: str, entry: tuple):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+            self._counts["evictions"] += 1
+
+    def _load(self, key: str) -> Optional[tuple]:
+        if self.directory is None:
+            return None
+        path = self.directory / f"{key}{_SUFFIX}"
+        try:
+            with open(path, "rb") as f:
+                created, result = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError, ImportError):
+            # the file is damaged or it was written by another version of the model, it is solved again
+            path.unlink(missing_ok=True)
+            return None
+        if self._expired(created):
+            path.unlink(missing_ok=True)
+            self._counts["evictions"] += 1
+            return None
+        # the modification time is the time of the last access, it is used to evict files
+        os.utime(path)
+        return created, result
+
+    def _dump(self, key: str, entry: tuple):
+        created, result = entry
+        # solution classes are generated by minizinc python, so they can't be pickled
+        payload = (created, detach(result))
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=f".{key}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(payload, f)
+            os.replace(tmp, self.directory / f"{key}{_SUFFIX}")
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        if self.max_bytes is not None:
+            self._shrink()
+
+    def _shrink(self):
+        files = []
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self._counts["evictions"] += 1
+
+
+def _stable(value):
+    # exact json representation of the values, which aren't json types, it doesn't depend on the order of sets,
+    # TypeError is raised for other values, so they aren't cached
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if isinstance(value, enum.EnumMeta):
+        return [value.__qualname__, [member.name for member in value]]
+    if isinstance(value, enum.Enum):
+        return repr(value)
+    if isinstance(value, range):
+        return [value.start, value.stop, value.step]
+    if hasattr(value, "dtype") and hasattr(value, "tolist"):
+        # numpy arrays and scalars, repr of big arrays is abbreviated, so all values are taken
+        return [str(value.dtype), list(value.shape), value.tolist()]
+    raise TypeError(f"{type(value).__name__} can't be a part of the cache key")
+
+
+def _solver_version(solver: str) -> Optional[str]:
+    # results of another version of the solver can differ, e.g. the disk tier is shared by upgraded solvers
+    try:
+        return registry.lookup(solver).version
+    except (LookupError, minizinc.ConfigurationError):
+        return None
+
+
+def _is_complete(status: Status, method: str, all_solutions: bool) -> bool:
+    # the result, which doesn't depend on the time limit
+    if status in (Status.OPTIMAL_SOLUTION, Status.ALL_SOLUTIONS, Status.UNSATISFIABLE):
+        return True
+    return status == Status.SATISFIED and method == "satisfy" and not all_solutions
+
+
+_cache: Optional[ResultCache] = None
+
+
+def set_result_cache(cache: Optional[ResultCache]):
+    """Sets the cache, which is used by all solves in the process, pass None to disable it"""
+    global _cache
+    _cache = cache
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    return _cache
+
+
+def solve_cached(
+    solve: Callable[[], minizinc.Result],
+    method: str,
+    src: str,
+    data: Dict[str, Any],
+    solver: str,
+    n_processes: Optional[int],
+    solve_kwargs: Dict[str, Any],
+) -> minizinc.Result:
+    """Returns the result from the process cache, or calls ``solve`` and caches its complete result"""
+    cache = _cache
+    if cache is None:
+        return solve()
+    key = cache.key(src, data, solver, n_processes, **solve_kwargs)
+    if key is None:
+        cache.skip()
+        return solve()
+    result = cache.get(key)
+    if result is None:
+        result = solve()
+        if _is_complete(result.status, method, solve_kwargs.get("all_solutions", False)):
+            cache.put(key, result)
+    return result
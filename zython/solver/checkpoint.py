@@ -0,0 +1,102 @@
+"""Checkpoints of long optimisations, which can be resumed after the process is stopped."""
+
+import enum
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import minizinc
+
+PathLike = Union[str, os.PathLike]
+
+_VERSION = 1
+
+
+class Checkpoint:
+    """Writes the incumbent solution, its objective, the proven bound and solve options to the file
+
+    The file is replaced atomically, so it is consistent even if the process is killed while writing.
+
+    Parameters
+    ----------
+    path: str or PathLike
+        path of the checkpoint file
+    model: str
+        name of the model class
+    method: str
+        "minimize" or "maximize"
+    objective: str
+        minizinc source code of the objective
+    options: dict
+        options of the solve, which are used to resume it
+    elapsed: float
+        number of seconds spent by previous runs of the solve
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        model: str,
+        method: str,
+        objective: str,
+        options: Dict[str, Any],
+        elapsed: float = 0.0,
+    ):
+        self.path = Path(path)
+        self._header = dict(version=_VERSION, model=model, method=method, objective=objective, options=options)
+        self._started = time.monotonic() - elapsed
+
+    def save(self, mzn_result: minizinc.Result, bound: Optional[float]):
+        data = dict(
+            self._header,
+            status=mzn_result.status.name,
+            objective_value=mzn_result.objective,
+            bound=bound,
+            elapsed=time.monotonic() - self._started,
+            solution=_solution(mzn_result.solution),
+        )
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+def load(path: PathLike) -> Dict[str, Any]:
+    """Reads the checkpoint file
+
+    Raises
+    ------
+    ValueError
+        If the file isn't a checkpoint or it was written by unsupported version of zython.
+    """
+    with open(path) as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or data.get("version") != _VERSION:
+        raise ValueError(f"{path} isn't a checkpoint or its version isn't supported")
+    return data
+
+
+def model_name(model) -> str:
+    return f"{type(model).__module__}.{type(model).__qualname__}"
+
+
+def _solution(solution) -> Dict[str, Any]:
+    # values, which can be passed as a warm start, enums and sets are skipped
+    return {
+        name: value
+        for name, value in vars(solution).items()
+        if not name.startswith("_") and name != "objective" and _is_number(value)
+    }
+
+
+def _is_number(value) -> bool:
+    if isinstance(value, list):
+        return all(_is_number(v) for v in value)
+    return isinstance(value, (bool, int, float)) and not isinstance(value, enum.Enum)
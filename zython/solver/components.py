@@ -0,0 +1,176 @@
+"""Solving of models, which consist of independent subproblems, as several smaller models concurrently."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+import minizinc
+from minizinc import Status
+
+from zython._compile.graph import ConstraintGraph, referenced_vars
+from zython._compile.zinc.zinc import to_zinc
+from zython.operations._op_codes import _Op_code
+from zython.operations.constraint import Constraint
+from zython.solver.cpu_budget import solver_threads_async
+
+
+class Component(NamedTuple):
+    """Independent subproblem of the model
+
+    Attributes
+    ----------
+    names: list of str
+        names of variables of the subproblem
+    src: str
+        minizinc source code of the subproblem
+    method: str
+        "satisfy", "minimize" or "maximize", subproblems without objective terms are satisfaction problems
+    """
+
+    names: List[str]
+    src: str
+    method: str
+
+
+class _ComponentIR(NamedTuple):
+    # the part of IR, which is used by ``to_zinc``
+    enums: Set[Any]
+    pars: Dict[str, Any]
+    vars: Dict[str, Any]
+    constraints: List[Any]
+    how_to_solve: Tuple[Any, ...]
+    defined: Set[str]
+
+
+def decompose(model, constraints: List[Any], how_to_solve: Tuple[Any, ...]) -> Optional[List[Component]]:
+    """Compiles every independent subproblem of the model as a separate minizinc model
+
+    Returns None if the model has only one component or its objective isn't a sum of terms,
+    each of which refers to the variables of one component.
+    Constraints, which don't refer to any variable, and variables without constraints
+    are added to the first component.
+    """
+    ir = model._ir
+    graph = ConstraintGraph(ir, constraints)
+    groups = []
+    free = []
+    for names in graph.components():
+        if len(names) == 1 and graph.degree[names[0]] == 0:
+            free.extend(names)
+        else:
+            groups.append(names)
+    if len(groups) < 2:
+        return None
+    groups[0] = [name for name in ir.vars if name in set(groups[0]) | set(free)]
+    ids = {id(v): name for name, v in ir.vars.items()}
+    component_of = {name: i for i, names in enumerate(groups) for name in names}
+    objectives: List[Any] = [None] * len(groups)
+    if len(how_to_solve) == 2:
+        for sign, term in _sum_terms(how_to_solve[1]):
+            owners = {component_of[name] for name in referenced_vars(term, ids)}
+            if len(owners) > 1:
+                return None
+            i = owners.pop() if owners else 0
+            objectives[i] = _add(objectives[i], sign, term)
+    buckets: List[List[Any]] = [[] for _ in groups]
+    for c in constraints:
+        # strings are added by the compiler for variables defined by expressions, they are recompiled below
+        if isinstance(c, Constraint):
+            scope = referenced_vars(c, ids)
+            buckets[component_of[next(iter(scope))] if scope else 0].append(c)
+    result = []
+    for names, bucket, objective in zip(groups, buckets, objectives):
+        sub_how_to_solve = ("satisfy",) if objective is None else (how_to_solve[0], objective)
+        sub_ir = _ComponentIR(ir.enums, ir.pars, {n: ir.vars[n] for n in names}, bucket, sub_how_to_solve, set())
+        result.append(Component(names, to_zinc(sub_ir), sub_how_to_solve[0]))
+    return result
+
+
+def _sum_terms(expr) -> List[Tuple[int, Any]]:
+    # (sign, term) pairs of the expression, which is a sum and difference of terms
+    terms = []
+    stack = [(1, expr)]
+    while stack:
+        sign, e = stack.pop()
+        op = getattr(e, "op", None)
+        if op is _Op_code.add:
+            stack.extend(((sign, e.params[1]), (sign, e.params[0])))
+        elif op is _Op_code.sub:
+            stack.extend(((-sign, e.params[1]), (sign, e.params[0])))
+        else:
+            terms.append((sign, e))
+    return terms
+
+
+def _add(expr, sign: int, term):
+    if expr is None:
+        return term if sign > 0 else 0 - term
+    return expr + term if sign > 0 else expr - term
+
+
+def solve(
+    model,
+    components: List[Component],
+    solver: minizinc.Solver,
+    processes: Optional[int] = None,
+    **solve_kwargs,
+) -> minizinc.Result:
+    """Solves components concurrently and stitches their solutions
+
+    Objectives of the components are summed. If any component is unsatisfiable,
+    other ones are terminated and the result is unsatisfiable.
+    """
+    data = model._instance_data()
+    instances = []
+    for component in components:
+        mzn_model = minizinc.Model()
+        mzn_model.add_string(component.src)
+        inst = minizinc.Instance(solver, mzn_model)
+        for name, value in data.items():
+            # values of variables of other components are undefined here
+            if name not in model._ir.vars or name in component.names:
+                inst[name] = value
+        instances.append(inst)
+    results = asyncio.run(_solve_components(solver, instances, processes, **solve_kwargs))
+    return _stitch(model, components, results)
+
+
+async def _solve_components(solver, instances, processes, **solve_kwargs) -> List[Optional[minizinc.Result]]:
+    tasks = [asyncio.create_task(_solve(solver, inst, processes, **solve_kwargs)) for inst in instances]
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if any(task.result().status == Status.UNSATISFIABLE for task in done):
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+        # wait for cancellation, so minizinc processes are terminated before return
+        await asyncio.gather(*pending, return_exceptions=True)
+    return [None if task.cancelled() else task.result() for task in tasks]
+
+
+async def _solve(solver: minizinc.Solver, inst: minizinc.Instance, processes: Optional[int], **solve_kwargs):
+    async with solver_threads_async(solver, processes) as processes:
+        return await inst.solve_async(processes=processes, **solve_kwargs)
+
+
+def _stitch(model, components: List[Component], results: List[Optional[minizinc.Result]]) -> minizinc.Result:
+    statistics = {"components": [c.names for c in components]}
+    finished = [r for r in results if r is not None]
+    if any(r.status == Status.UNSATISFIABLE for r in finished):
+        return minizinc.Result(Status.UNSATISFIABLE, None, statistics)
+    if len(finished) < len(results) or not all(r.status.has_solution() for r in finished):
+        return minizinc.Result(Status.UNKNOWN, None, statistics)
+    values = {}
+    for r in results:
+        values.update({k: v for k, v in vars(r.solution).items() if not k.startswith("_") and k != "objective"})
+    fields = {name: values[name] for name in model._ir.vars if name in values}
+    optimised = [(c, r) for c, r in zip(components, results) if c.method != "satisfy"]
+    status = Status.SATISFIED
+    if optimised:
+        fields["objective"] = sum(r.objective for _, r in optimised)
+        if all(r.status == Status.OPTIMAL_SOLUTION for _, r in optimised):
+            status = Status.OPTIMAL_SOLUTION
+    return minizinc.Result(status, SimpleNamespace(**fields), statistics)
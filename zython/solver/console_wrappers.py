@@ -1,6 +1,6 @@
 from typing import Tuple
 
-import minizinc as mz
+from zython.solver.registry import registry
 
 
 def available_solver_tags(refresh: bool = False) -> Tuple[str, ...]:
@@ -18,8 +18,10 @@ def available_solver_tags(refresh: bool = False) -> Tuple[str, ...]:
 
     Notes
     -----
-    1. The method calls minizinc cli
-    2. The list of solvers might be cached for future usage.
+    1. The method calls minizinc cli on the first call only
+    2. The list of solvers is cached by the process solver registry, it is shared with solve methods.
         The refresh argument can be used to ignore the current cache.
     """
-    return tuple(mz.default_driver.available_solvers(refresh=refresh).keys())
+    if refresh:
+        registry.refresh()
+    return registry.tags()
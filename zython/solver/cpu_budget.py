@@ -0,0 +1,224 @@
+"""Process-wide limit of solver threads shared by concurrent solves."""
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import os
+import threading
+from typing import Callable, List, Optional
+
+import minizinc
+
+POLICIES = ("fair_share", "priority", "max_throughput")
+
+
+class _Waiter:
+    __slots__ = ("key", "requested", "granted", "notify")
+
+    def __init__(self, key, requested: Optional[int], notify: Callable[[], None]):
+        self.key = key
+        self.requested = requested
+        self.granted: Optional[int] = None
+        self.notify = notify
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+class CpuBudget:
+    """Distributes a fixed number of cores between concurrent solves
+
+    Every solve asks the budget for a number of threads before the solver is started.
+    The solve gets the thread count according to the policy or waits until other solves finish
+    and release their cores. Started solvers can't change their number of threads,
+    so released cores are given to the solves which are waiting or started later.
+
+    Parameters
+    ----------
+    cores: Optional[int]
+        Number of cores to distribute, by default the number of cores available for the process.
+    policy: str
+        - "fair_share": cores are split equally between running and waiting solves, solves are served in FIFO order.
+        - "priority": solves with higher priority are served first and get as many threads as they requested.
+        - "max_throughput": every solve gets ``min_threads`` threads, so the maximal number of solves runs at once.
+    min_threads: int
+        Minimal number of threads for a solve, the solve waits if there is less free cores.
+
+    Examples
+    --------
+
+    >>> budget = CpuBudget(cores=8, policy="fair_share")
+    >>> with budget.acquire(4) as first, budget.acquire(8) as second:
+    ...     first, second
+    (4, 4)
+    """
+
+    def __init__(self, cores: Optional[int] = None, policy: str = "fair_share", min_threads: int = 1):
+        if policy not in POLICIES:
+            raise ValueError(f"policy should be one of {POLICIES}, but it is {policy!r}")
+        if cores is None:
+            cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+        if not 0 < min_threads <= cores:
+            raise ValueError(f"min_threads should be in 1..{cores}, but it is {min_threads}")
+        self.cores = cores
+        self.policy = policy
+        self.min_threads = min_threads
+        self._used = 0
+        self._running = 0
+        self._waiters: List[_Waiter] = []
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def free(self) -> int:
+        return self.cores - self._used
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    @contextlib.contextmanager
+    def acquire(self, requested: Optional[int] = None, priority: int = 0):
+        """Waits until threads are assigned to the solve and returns their number
+
+        Parameters
+        ----------
+        requested: Optional[int]
+            Maximal number of threads the solve can use, if None the budget decides.
+        priority: int
+            Solves with higher priority are served first if the policy is "priority".
+        """
+        event = threading.Event()
+        waiter = self._enqueue(requested, priority, event.set)
+        try:
+            event.wait()
+        except BaseException:
+            self._cancel(waiter)
+            raise
+        try:
+            yield waiter.granted
+        finally:
+            self._release(waiter.granted)
+
+    @contextlib.asynccontextmanager
+    async def acquire_async(self, requested: Optional[int] = None, priority: int = 0):
+        """Asynchronous version of ``acquire``, which doesn't block the event loop"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiter = self._enqueue(requested, priority, lambda: loop.call_soon_threadsafe(_set_done, future))
+        try:
+            await future
+        except BaseException:
+            self._cancel(waiter)
+            raise
+        try:
+            yield waiter.granted
+        finally:
+            self._release(waiter.granted)
+
+    def _enqueue(self, requested, priority, notify) -> _Waiter:
+        if requested is not None and requested < 1:
+            raise ValueError(f"requested number of threads should be positive, but it is {requested}")
+        order = next(self._order)
+        key = (-priority, order) if self.policy == "priority" else (0, order)
+        waiter = _Waiter(key, requested, notify)
+        with self._lock:
+            heapq.heappush(self._waiters, waiter)
+            self._dispatch()
+        return waiter
+
+    def _cancel(self, waiter: _Waiter):
+        with self._lock:
+            if waiter.granted is None:
+                self._waiters.remove(waiter)
+                heapq.heapify(self._waiters)
+                self._dispatch()
+                return
+        self._release(waiter.granted)
+
+    def _release(self, threads: int):
+        with self._lock:
+            self._used -= threads
+            self._running -= 1
+            self._dispatch()
+
+    def _dispatch(self):
+        while self._waiters:
+            waiter = self._waiters[0]
+            threads = self._grant(waiter)
+            if threads is None:
+                return
+            heapq.heappop(self._waiters)
+            self._used += threads
+            self._running += 1
+            waiter.granted = threads
+            waiter.notify()
+
+    def _grant(self, waiter: _Waiter) -> Optional[int]:
+        if self.free < self.min_threads:
+            return None
+        requested = waiter.requested if waiter.requested is not None else self.cores
+        if self.policy == "fair_share":
+            share = max(self.min_threads, self.cores // (self._running + len(self._waiters)))
+            threads = min(requested, share, self.free)
+        elif self.policy == "priority":
+            threads = min(requested, self.free)
+        else:
+            threads = self.min_threads
+        # min_threads is reserved, but the solve doesn't get more threads than it requested
+        return min(requested, max(threads, self.min_threads))
+
+
+def _set_done(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+_budget: Optional[CpuBudget] = None
+
+
+def set_cpu_budget(budget: Optional[CpuBudget]):
+    """Sets the budget, which is used by all solves in the process, pass None to disable it"""
+    global _budget
+    _budget = budget
+
+
+def get_cpu_budget() -> Optional[CpuBudget]:
+    return _budget
+
+
+@contextlib.contextmanager
+def solver_threads(solver: minizinc.Solver, n_processes: Optional[int], priority: int = 0):
+    """Returns the number of processes which should be passed to the solver according to the process budget
+
+    Solvers which don't support ``-p`` flag and solves without ``n_processes`` occupy one core
+    and run with the ``n_processes`` passed, so the budget doesn't change the default number of solver threads.
+    """
+    budget = _budget
+    if budget is None:
+        yield n_processes
+    elif n_processes is not None and "-p" in solver.stdFlags:
+        with budget.acquire(n_processes, priority) as threads:
+            yield threads
+    else:
+        with budget.acquire(1, priority):
+            yield n_processes
+
+
+@contextlib.asynccontextmanager
+async def solver_threads_async(solver: minizinc.Solver, n_processes: Optional[int], priority: int = 0):
+    """Asynchronous version of ``solver_threads``"""
+    budget = _budget
+    if budget is None:
+        yield n_processes
+    elif n_processes is not None and "-p" in solver.stdFlags:
+        async with budget.acquire_async(n_processes, priority) as threads:
+            yield threads
+    else:
+        async with budget.acquire_async(1, priority):
+            yield n_processes
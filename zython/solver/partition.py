@@ -0,0 +1,143 @@
+"""Parallel solving of a satisfaction problem split into disjoint parts by domains of branching variables."""
+
+import asyncio
+import itertools
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+import minizinc
+from minizinc import Status
+
+from zython.solver.cpu_budget import solver_threads_async
+from zython.var_par.collections.array import ArrayMixin, ArrayView
+from zython.var_par.get_type import is_int_range, is_range
+
+
+def split_domains(variables: Sequence[Tuple[Any, range]], parts: int) -> List[List[Any]]:
+    """Returns lists of constraints, which split the search space into disjoint parts
+
+    Domains of the variables are split into subranges one by one, until there are at least ``parts`` parts,
+    so every part is a combination of subranges of the variables.
+
+    Parameters
+    ----------
+    variables: sequence of (variable, domain) pairs
+        variables to split and their integer domains
+    parts: int
+        number of parts
+    """
+    if parts < 1:
+        raise ValueError(f"number of parts should be positive, but it is {parts}")
+    result: List[List[Any]] = [[]]
+    for v, domain in variables:
+        if len(result) >= parts:
+            break
+        k = min(len(domain), -(-parts // len(result)))
+        result = [part + [_in(v, chunk)] for part in result for chunk in _chunks(domain, k)]
+    return result
+
+
+def domains(variables: Iterable[Any], skip_unsupported: bool = False) -> List[Tuple[Any, range]]:
+    """Returns (variable, domain) pairs for variables and array elements, arrays are split to their elements
+
+    Raises
+    ------
+    ValueError
+        If the variable isn't integer variable with bounded domain and ``skip_unsupported`` is False.
+    """
+    result = []
+    for v in variables:
+        t = getattr(v, "type", None)
+        if not is_range(t) or not is_int_range(t) or isinstance(v, ArrayView) and _has_slice(v):
+            if skip_unsupported:
+                continue
+            raise ValueError("only integer variables with range domain and their arrays can be split")
+        domain = range(t.start, t.stop)
+        if isinstance(v, ArrayMixin) and not isinstance(v, ArrayView):
+            result.extend((v[index], domain) for index in itertools.product(*(range(s) for s in v._shape)))
+        else:
+            result.append((v, domain))
+    return result
+
+
+def _has_slice(view: ArrayView) -> bool:
+    return any(isinstance(p, slice) for p in view.pos)
+
+
+def _in(v, chunk: range):
+    if len(chunk) == 1:
+        return v == chunk.start
+    return (v >= chunk.start) & (v <= chunk.stop - 1)
+
+
+def _chunks(domain: range, k: int) -> List[range]:
+    size, rest = divmod(len(domain), k)
+    result = []
+    start = domain.start
+    for i in range(k):
+        stop = start + size + (1 if i < rest else 0)
+        result.append(range(start, stop))
+        start = stop
+    return result
+
+
+def solve(
+    solver: minizinc.Solver,
+    instances: List[minizinc.Instance],
+    processes: Optional[int] = None,
+    **solve_kwargs,
+) -> minizinc.Result:
+    """Solves parts of the problem concurrently and merges their results
+
+    If all solutions are requested, solutions of all parts are concatenated,
+    otherwise the first found solution is returned and other parts are terminated.
+    Every part asks the process CPU budget for its threads, if the budget is set.
+    """
+    return asyncio.run(_solve_parts(solver, instances, processes, **solve_kwargs))
+
+
+async def _solve_parts(solver, instances, processes, **solve_kwargs):
+    all_solutions = solve_kwargs.get("all_solutions", False)
+    tasks = [asyncio.create_task(_solve(solver, inst, processes, **solve_kwargs)) for inst in instances]
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                if not all_solutions and result.status.has_solution():
+                    return result
+    finally:
+        for task in pending:
+            task.cancel()
+        # wait for cancellation, so minizinc processes are terminated before return
+        await asyncio.gather(*pending, return_exceptions=True)
+    return _merge([task.result() for task in tasks], all_solutions)
+
+
+async def _solve(solver: minizinc.Solver, inst: minizinc.Instance, processes: Optional[int], **solve_kwargs):
+    async with solver_threads_async(solver, processes) as processes:
+        return await inst.solve_async(processes=processes, **solve_kwargs)
+
+
+def _merge(results: List[minizinc.Result], all_solutions: bool) -> minizinc.Result:
+    statuses = {r.status for r in results}
+    if all_solutions:
+        solution = [s for r in results if r.solution for s in r.solution]
+    else:
+        solution = None
+    if statuses <= {Status.UNSATISFIABLE}:
+        status = Status.UNSATISFIABLE
+    elif statuses <= {Status.UNSATISFIABLE, Status.ALL_SOLUTIONS}:
+        status = Status.ALL_SOLUTIONS
+    elif solution:
+        status = Status.SATISFIED
+    else:
+        status = Status.UNKNOWN
+    statistics = {}
+    for r in results:
+        for key, value in r.statistics.items():
+            # counters are summed, other statistics (e.g. time) can't be merged
+            if isinstance(value, int) and not isinstance(value, bool):
+                statistics[key] = statistics.get(key, 0) + value
+    statistics["partitions"] = len(results)
+    return minizinc.Result(status, solution, statistics)
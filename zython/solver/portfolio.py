@@ -0,0 +1,130 @@
+"""Portfolio solving: the same model is run by several solvers concurrently, the first answer wins."""
+
+import asyncio
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import minizinc
+from minizinc import Status
+
+from zython.solver import registry
+from zython.solver.cpu_budget import solver_threads_async
+
+# statuses after which other solvers can't improve the answer
+_PROVEN = {Status.OPTIMAL_SOLUTION, Status.ALL_SOLUTIONS, Status.UNSATISFIABLE, Status.UNBOUNDED}
+
+
+class PortfolioError(RuntimeError):
+    """All solvers of the portfolio failed
+
+    Attributes
+    ----------
+    errors: dict
+        exception raised by every solver by its tag
+    """
+
+    def __init__(self, errors: Dict[str, BaseException]):
+        super().__init__("all solvers failed: " + "; ".join(f"{tag}: {error!r}" for tag, error in errors.items()))
+        self.errors = errors
+
+
+def lookup_available(tags: Iterable[str]) -> List[Tuple[str, minizinc.Solver]]:
+    """Returns (tag, solver) pairs for solvers which are installed, unknown tags are skipped
+
+    Raises
+    ------
+    LookupError
+        If none of the solvers is available.
+    """
+    tags = tuple(tags)
+    solvers = []
+    for tag in tags:
+        try:
+            solvers.append((tag, registry.lookup(tag)))
+        except LookupError:
+            continue
+    if not solvers:
+        raise LookupError(f"None of the solvers {tags} is available")
+    return solvers
+
+
+def solve(
+    instances: Dict[str, Tuple[minizinc.Solver, minizinc.Instance]],
+    method: str,
+    processes: Optional[int] = None,
+    **solve_kwargs,
+) -> Tuple[str, minizinc.Result]:
+    """Solves every instance concurrently and returns the tag of the winner and its result
+
+    Every instance is solved in its own minizinc subprocess.
+    For satisfaction problems the first solution is returned,
+    for optimisation ones the first proven optimum is returned. If no solver proves the optimum
+    (e.g. the timeout is reached) the best solution found is returned.
+    Solvers which are still running when the answer is known are terminated.
+    Every solver asks the process CPU budget for its threads, if the budget is set.
+    ``processes`` and ``random_seed`` are passed to the solvers, which support them.
+
+    Raises
+    ------
+    PortfolioError
+        If several solvers are raced and all of them failed, the error of a single solver is raised as is.
+    """
+    return asyncio.run(_race(instances, method, processes, **solve_kwargs))
+
+
+async def _race(instances, method: str, processes: Optional[int], **solve_kwargs):
+    tasks = {
+        asyncio.create_task(_solve(solver, inst, processes, **solve_kwargs)): tag
+        for tag, (solver, inst) in instances.items()
+    }
+    pending = set(tasks)
+    finished = []
+    errors = {}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is not None:
+                    errors[tasks[task]] = task.exception()
+                    continue
+                result = task.result()
+                if _is_final(result, method, solve_kwargs.get("all_solutions", False)):
+                    return tasks[task], result
+                finished.append((tasks[task], result))
+    finally:
+        for task in pending:
+            task.cancel()
+        # wait for cancellation, so minizinc processes are terminated before return
+        await asyncio.gather(*pending, return_exceptions=True)
+    if not finished:
+        first = next(iter(errors.values()))
+        if len(errors) == 1:
+            raise first
+        raise PortfolioError(errors) from first
+    return _best(finished, method)
+
+
+async def _solve(solver: minizinc.Solver, inst: minizinc.Instance, processes: Optional[int], **solve_kwargs):
+    capabilities = registry.SolverCapabilities.from_solver(solver)
+    if not capabilities.random_seed:
+        solve_kwargs.pop("random_seed", None)
+    async with solver_threads_async(solver, processes) as processes:
+        if not capabilities.parallel:
+            processes = None
+        return await inst.solve_async(processes=processes, **solve_kwargs)
+
+
+def _is_final(result: minizinc.Result, method: str, all_solutions: bool) -> bool:
+    if result.status in _PROVEN:
+        return True
+    return method == "satisfy" and not all_solutions and result.status.has_solution()
+
+
+def _best(finished, method):
+    with_solution = [(tag, result) for tag, result in finished if result.status.has_solution()]
+    if not with_solution:
+        return finished[0]
+    if method == "minimize":
+        return min(with_solution, key=lambda r: r[1].objective)
+    if method == "maximize":
+        return max(with_solution, key=lambda r: r[1].objective)
+    return with_solution[0]
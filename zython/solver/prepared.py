@@ -0,0 +1,150 @@
+"""Process-level pool of analysed minizinc instances, which are reused by solves of the same source code."""
+
+import collections
+import contextlib
+import hashlib
+import threading
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import minizinc
+
+
+class PoolStats(NamedTuple):
+    """State of the pool
+
+    Attributes
+    ----------
+    hits: int
+        solves, which reused an analysed instance
+    misses: int
+        solves, which created and analysed a new instance
+    evictions: int
+        instances removed from the pool because of its size, removals by ``evict`` aren't counted
+    instances: int
+        number of idle instances in the pool
+    bytes: int
+        size of the source code held by idle instances
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    instances: int
+    bytes: int
+
+
+class InstancePool:
+    """Keeps analysed instances without data, solves branch them and attach their data only
+
+    ``minizinc.Instance`` runs minizinc to analyse the interface of the model before the first solve.
+    Instances in the pool are analysed once, their branches copy the interface and are solved without analysis.
+    The parent instance is locked while its branch is alive, so the instance is taken from the pool for the solve,
+    and concurrent solves of the same source code get different instances.
+
+    Parameters
+    ----------
+    maxsize: int
+        Maximal number of idle instances, the least recently used source code is evicted first.
+    max_bytes: Optional[int]
+        Maximal size of the source code of idle instances.
+    """
+
+    def __init__(self, maxsize: int = 64, max_bytes: Optional[int] = None):
+        if maxsize < 0:
+            raise ValueError(f"maxsize should be non-negative, but it is {maxsize}")
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._idle: "collections.OrderedDict[Tuple[str, str], List[minizinc.Instance]]" = collections.OrderedDict()
+        self._sizes: Dict[Tuple[str, str], int] = {}
+        self._counts = dict(hits=0, misses=0, evictions=0)
+        self._instances = 0
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(**self._counts, instances=self._instances, bytes=self._bytes)
+
+    @contextlib.contextmanager
+    def branch(self, src: str, solver: minizinc.Solver) -> Iterator[minizinc.Instance]:
+        """Yields the branch of analysed instance of the source code, data should be set to the branch
+
+        The instance is returned to the pool when the branch is closed.
+        """
+        key = (hashlib.sha256(src.encode()).hexdigest(), solver.id)
+        base = self._take(key)
+        if base is None:
+            model = minizinc.Model()
+            model.add_string(src)
+            # the instance is analysed when it is created, its branches copy the interface
+            base = minizinc.Instance(solver, model)
+        with base.branch() as child:
+            yield child
+        # the instance isn't returned if the solve failed
+        self._put(key, base, len(src.encode()))
+
+    def evict(self, src: Optional[str] = None):
+        """Removes idle instances of the source code or all idle instances if ``src`` isn't set"""
+        digest = None if src is None else hashlib.sha256(src.encode()).hexdigest()
+        with self._lock:
+            for key in [key for key in self._idle if digest is None or key[0] == digest]:
+                while key in self._idle:
+                    self._pop(key)
+
+    def _take(self, key) -> Optional[minizinc.Instance]:
+        with self._lock:
+            instances = self._idle.get(key)
+            if not instances:
+                self._counts["misses"] += 1
+                return None
+            self._counts["hits"] += 1
+            return self._pop(key)
+
+    def _put(self, key, base: minizinc.Instance, size: int):
+        with self._lock:
+            self._idle.setdefault(key, []).append(base)
+            self._idle.move_to_end(key)
+            self._sizes[key] = size
+            self._instances += 1
+            self._bytes += size
+            while self._idle and (
+                self._instances > self.maxsize or (self.max_bytes is not None and self._bytes > self.max_bytes)
+            ):
+                self._pop(next(iter(self._idle)))
+                self._counts["evictions"] += 1
+
+    def _pop(self, key) -> minizinc.Instance:
+        # removes one idle instance of the key, the size of the source code is forgotten with its last instance
+        instances = self._idle[key]
+        base = instances.pop()
+        self._instances -= 1
+        self._bytes -= self._sizes[key]
+        if not instances:
+            del self._idle[key]
+            del self._sizes[key]
+        return base
+
+
+pool = InstancePool()
+
+
+def branch(src: str, solver: minizinc.Solver):
+    """Yields the branch of the analysed instance from the process pool, see ``InstancePool.branch``"""
+    return pool.branch(src, solver)
+
+
+def stats() -> PoolStats:
+    """Returns the state of the process pool
+
+    Examples
+    --------
+    > stats()
+    PoolStats(hits=12, misses=2, evictions=0, instances=2, bytes=1480)
+    """
+    return pool.stats
+
+
+def evict(src: Optional[str] = None):
+    """Removes idle instances of the source code from the process pool, all instances if ``src`` isn't set"""
+    pool.evict(src)
@@ -0,0 +1,145 @@
+"""Process-level lookup of the solvers available for minizinc and cache of their capabilities."""
+
+import threading
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import minizinc
+
+
+class SolverCapabilities(NamedTuple):
+    """Description of the solver features
+
+    Attributes
+    ----------
+    id: str
+        unique identifier of the solver, e.g. "org.gecode.gecode"
+    name: str
+        name of the solver
+    version: str
+        version of the solver
+    tags: tuple of str
+        tags of the solver, e.g. "cp", "mip", "float"
+    std_flags: tuple of str
+        standard command line flags supported by the solver, e.g. "-a", "-p", "-r"
+    """
+
+    id: str
+    name: str
+    version: str
+    tags: Tuple[str, ...]
+    std_flags: Tuple[str, ...]
+
+    @classmethod
+    def from_solver(cls, solver: minizinc.Solver) -> "SolverCapabilities":
+        return cls(solver.id, solver.name, solver.version, tuple(solver.tags), tuple(solver.stdFlags))
+
+    @property
+    def parallel(self) -> bool:
+        """solver can use several threads, ``n_processes`` argument"""
+        return "-p" in self.std_flags
+
+    @property
+    def random_seed(self) -> bool:
+        """``random_seed`` argument is supported"""
+        return "-r" in self.std_flags
+
+    @property
+    def all_solutions(self) -> bool:
+        """solver can return all solutions of satisfaction problem"""
+        return "-a" in self.std_flags
+
+    @property
+    def intermediate_solutions(self) -> bool:
+        """solver can return intermediate solutions of optimisation problem"""
+        return "-i" in self.std_flags or "-a" in self.std_flags
+
+    @property
+    def free_search(self) -> bool:
+        """solver can ignore search annotations"""
+        return "-f" in self.std_flags
+
+    @property
+    def float(self) -> bool:
+        """solver supports float variables"""
+        return "float" in self.tags
+
+
+class SolverRegistry:
+    """Looks solvers up in minizinc driver and caches their capabilities
+
+    The list of solvers is cached by the driver itself and is read on the first usage,
+    so there is no need in ``minizinc`` executable until the first solve.
+    Use ``refresh`` if solvers were installed or removed while the process is running.
+
+    Parameters
+    ----------
+    driver: Optional[minizinc.Driver]
+        minizinc driver to read solvers from, ``minizinc.default_driver`` if not set.
+    """
+
+    def __init__(self, driver: Optional[minizinc.Driver] = None):
+        self._driver = driver
+        self._lock = threading.Lock()
+        self._capabilities: Dict[str, SolverCapabilities] = {}
+
+    def refresh(self):
+        """Rereads available solvers from minizinc"""
+        with self._lock:
+            self._get_driver().available_solvers(refresh=True)
+            self._capabilities = {}
+
+    def tags(self) -> Tuple[str, ...]:
+        """Returns tags and ids of all available solvers"""
+        return tuple(self._get_driver().available_solvers().keys())
+
+    def lookup(self, tag: str) -> minizinc.Solver:
+        """Returns the solver by tag or id, the same way as ``minizinc --solver tag`` does
+
+        Raises
+        ------
+        LookupError
+            If there is no such solver.
+        """
+        solvers = self._get_driver().available_solvers()
+        if not solvers.get(tag):
+            raise LookupError(f"No solver id or tag '{tag}' found, available options: {sorted(solvers.keys())}")
+        return solvers[tag][0]
+
+    def capabilities(self, tag: str) -> SolverCapabilities:
+        """Returns features of the solver by tag or id"""
+        capabilities = self._capabilities.get(tag)
+        if capabilities is None:
+            capabilities = SolverCapabilities.from_solver(self.lookup(tag))
+            with self._lock:
+                self._capabilities[tag] = capabilities
+        return capabilities
+
+    def _get_driver(self) -> minizinc.Driver:
+        driver = self._driver or minizinc.default_driver
+        if driver is None:
+            raise minizinc.ConfigurationError("minizinc executable wasn't found, please add it to $PATH")
+        return driver
+
+
+registry = SolverRegistry()
+
+
+def lookup(tag: str) -> minizinc.Solver:
+    """Returns the solver by tag or id from the process registry"""
+    return registry.lookup(tag)
+
+
+def capabilities(tag: str) -> SolverCapabilities:
+    """Returns features of the solver by tag or id from the process registry
+
+    Examples
+    --------
+    > capabilities("gecode").parallel
+    True
+    """
+    return registry.capabilities(tag)
+
+
+def refresh():
+    """Rereads available solvers of the process registry"""
+    registry.refresh()
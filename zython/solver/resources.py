@@ -0,0 +1,340 @@
+"""Limits of memory, CPU and flattening time of minizinc processes and measurement of their resource usage."""
+
+import asyncio
+import contextlib
+import contextvars
+import math
+import os
+import signal
+import threading
+import time
+from datetime import timedelta
+from typing import Iterable, List, NamedTuple, Optional, Union
+
+import minizinc
+
+from zython.solver import registry
+
+# resource usage is read from /proc, so it is measured on Linux only
+_PROC = os.path.isdir("/proc/self/task")
+_TICKS = os.sysconf("SC_CLK_TCK") if _PROC else 100
+_PAGE = os.sysconf("SC_PAGE_SIZE") if _PROC else 4096
+INTERVAL = 0.05
+
+
+class LimitExceeded(RuntimeError):
+    """The solve was stopped, because minizinc or the solver exceeded the limit"""
+
+
+class Limits:
+    """Resource limits of a solve, minizinc and solver processes are terminated if any of them is exceeded
+
+    Limits are applied on Linux only, ``RuntimeError`` is raised on other platforms.
+
+    Parameters
+    ----------
+    memory: Optional[int]
+        Maximal size of the address space (``RLIMIT_AS``) of minizinc and every solver process in bytes.
+        A process, which can't allocate memory, fails with minizinc error.
+    cpu: Optional[timedelta]
+        Maximal user and system CPU time of minizinc and solver processes together.
+    flatten_time: Optional[timedelta]
+        Maximal wall time of flattening, which is counted until the solver process is started.
+        It is supported for solvers run as separate executables, e.g. gecode and chuffed.
+
+    Examples
+    --------
+
+    >>> Limits(memory=2**30, cpu=timedelta(minutes=5))
+    Limits(memory=1073741824, cpu=0:05:00)
+    """
+
+    def __init__(
+        self,
+        *,
+        memory: Optional[int] = None,
+        cpu: Optional[timedelta] = None,
+        flatten_time: Optional[timedelta] = None,
+    ):
+        if memory is None and cpu is None and flatten_time is None:
+            raise ValueError("at least one limit should be specified")
+        if memory is not None and memory <= 0:
+            raise ValueError(f"memory should be positive, but it is {memory}")
+        if cpu is not None and cpu <= timedelta(0):
+            raise ValueError(f"cpu should be positive, but it is {cpu}")
+        if flatten_time is not None and flatten_time <= timedelta(0):
+            raise ValueError(f"flatten_time should be positive, but it is {flatten_time}")
+        self.memory = memory
+        self.cpu = cpu
+        self.flatten_time = flatten_time
+
+    def __repr__(self):
+        limits = ", ".join(f"{name}={value}" for name, value in vars(self).items() if value is not None)
+        return f"Limits({limits})"
+
+
+class ResourceUsage(NamedTuple):
+    """Resources used by minizinc and solver processes of a solve
+
+    CPU time and memory are sampled from /proc every ``INTERVAL`` seconds while minizinc runs, so they are
+    lower bounds: the last interval of every minizinc process isn't counted, it is most of the time of short solves.
+
+    Attributes
+    ----------
+    wall: timedelta
+        elapsed time of the solve
+    user: Optional[timedelta]
+        user CPU time of all processes, None if it can't be measured on the platform
+    system: Optional[timedelta]
+        system CPU time of all processes
+    peak_rss: Optional[int]
+        peak resident memory of the processes in bytes, the sum for processes run at the same time
+    """
+
+    wall: timedelta
+    user: Optional[timedelta]
+    system: Optional[timedelta]
+    peak_rss: Optional[int]
+
+
+class GovernedDriver(minizinc.Driver):
+    """minizinc driver, which applies the limits of the current solve to the started processes
+
+    It behaves as ``minizinc.Driver`` for solves, which aren't governed.
+    """
+
+    async def _create_process(self, args, solver=None):
+        proc = await super()._create_process(args, solver)
+        governor = _governor.get()
+        if governor is not None:
+            governor.attach(proc)
+        return proc
+
+
+class _Tree:
+    # resource usage of minizinc process and its descendants, it is sampled from /proc while the process is alive
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.user = 0.0
+        self.system = 0.0
+        self.peak_rss = 0
+        # the solver process was started, so flattening is finished
+        self.flattened = False
+
+    def sample(self):
+        pids = _descendants(self.pid)
+        user = system = 0.0
+        rss = 0
+        for pid in pids:
+            stat = _stat(pid)
+            if stat is not None:
+                # times of finished children are added to their parent
+                user += stat[0] + stat[2]
+                system += stat[1] + stat[3]
+                rss += stat[4]
+        self.user = max(self.user, user)
+        self.system = max(self.system, system)
+        self.peak_rss = max(self.peak_rss, rss)
+        self.flattened = self.flattened or len(pids) > 1
+
+    def terminate(self):
+        for pid in reversed(_descendants(self.pid)):
+            with contextlib.suppress(ProcessLookupError, PermissionError):
+                os.kill(pid, signal.SIGTERM)
+
+
+class _Governor:
+    def __init__(self, limits: Optional[Limits]):
+        self.limits = limits
+        self.exceeded: Optional[str] = None
+        self._trees: List[_Tree] = []
+        self._tasks = set()
+        self._started = time.monotonic()
+        self._finished: Optional[float] = None
+
+    @property
+    def usage(self) -> Optional[ResourceUsage]:
+        # None if no process was started, e.g. the result was taken from the cache
+        if not self._trees:
+            return None
+        wall = timedelta(seconds=(self._finished or time.monotonic()) - self._started)
+        if not _PROC:
+            return ResourceUsage(wall, None, None, None)
+        return ResourceUsage(
+            wall,
+            timedelta(seconds=sum(tree.user for tree in self._trees)),
+            timedelta(seconds=sum(tree.system for tree in self._trees)),
+            sum(tree.peak_rss for tree in self._trees),
+        )
+
+    def attach(self, proc: asyncio.subprocess.Process):
+        limits = self.limits
+        if limits is not None and (limits.memory is not None or limits.cpu is not None):
+            _set_rlimits(proc.pid, limits)
+        tree = _Tree(proc.pid)
+        self._trees.append(tree)
+        if _PROC:
+            # the task is referenced until it is finished, otherwise it can be garbage collected
+            task = asyncio.get_running_loop().create_task(self._monitor(proc, tree))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _monitor(self, proc: asyncio.subprocess.Process, tree: _Tree):
+        started = time.monotonic()
+        while proc.returncode is None:
+            tree.sample()
+            if self.exceeded is None:
+                self.exceeded = self._check(tree, time.monotonic() - started)
+                if self.exceeded is not None:
+                    tree.terminate()
+            await asyncio.sleep(INTERVAL)
+
+    def _check(self, tree: _Tree, elapsed: float) -> Optional[str]:
+        limits = self.limits
+        if limits is None:
+            return None
+        if limits.cpu is not None:
+            used = sum(t.user + t.system for t in self._trees)
+            if used > limits.cpu.total_seconds():
+                return f"cpu time {used:.1f}s exceeded the limit {limits.cpu}"
+        if limits.flatten_time is not None and not tree.flattened and elapsed > limits.flatten_time.total_seconds():
+            return f"flattening exceeded the limit {limits.flatten_time}"
+        return None
+
+
+_governor: contextvars.ContextVar = contextvars.ContextVar("zython_governor", default=None)
+_accounting = False
+# the governed driver is the default one while any solve is governed, the replaced driver is restored after them
+_driver_lock = threading.Lock()
+_driver_users = 0
+_replaced: Optional[minizinc.Driver] = None
+_governed_driver: Optional[GovernedDriver] = None
+
+
+def set_usage_accounting(enabled: bool):
+    """Enables measurement of resources used by every solve of the process, see ``Result.resources``
+
+    Resources of solves with ``limits`` are measured regardless of this setting.
+    The default minizinc driver is replaced by ``GovernedDriver`` while measured solves are running.
+    """
+    global _accounting
+    _accounting = enabled
+
+
+@contextlib.contextmanager
+def governed(limits: Optional[Limits], solver: Union[str, Iterable[str]]):
+    """Applies the limits to minizinc processes started in the context and measures their resources
+
+    Processes are governed only if there are limits or usage accounting is enabled, see ``set_usage_accounting``.
+    The governor is passed to the processes through the context, ``asyncio.run`` copies it to the event loop.
+    If any limit is exceeded, ``LimitExceeded`` is raised instead of the error of terminated minizinc.
+    """
+    governor = _Governor(limits)
+    if limits is None and not _accounting:
+        # nothing is measured, so the default driver isn't replaced and processes aren't monitored
+        yield governor
+        return
+    if limits is not None:
+        _check_supported(limits, [solver] if isinstance(solver, str) else list(solver))
+    with _default_driver() as installed:
+        if limits is not None and not installed:
+            raise RuntimeError("limits can't be applied, because the default minizinc driver is replaced")
+        token = _governor.set(governor)
+        try:
+            yield governor
+        except Exception as e:
+            if governor.exceeded is not None:
+                raise LimitExceeded(governor.exceeded) from e
+            raise
+        finally:
+            _governor.reset(token)
+            governor._finished = time.monotonic()
+    if governor.exceeded is not None:
+        raise LimitExceeded(governor.exceeded)
+
+
+def with_usage(mzn_result: minizinc.Result, usage: Optional[ResourceUsage]) -> minizinc.Result:
+    """Returns copy of the result, which has ``resources`` statistics"""
+    if usage is None:
+        return mzn_result
+    return minizinc.Result(mzn_result.status, mzn_result.solution, {**mzn_result.statistics, "resources": usage})
+
+
+def _check_supported(limits: Limits, tags: List[str]):
+    if not _PROC or not hasattr(_resource(), "prlimit"):
+        raise RuntimeError("resource limits are supported on Linux only")
+    if limits.flatten_time is not None and tags:
+        available = set(registry.registry.tags())
+        if not all(registry.lookup(tag).executable for tag in tags if tag in available):
+            raise ValueError("flatten_time is supported for solvers, which run as separate executables")
+
+
+@contextlib.contextmanager
+def _default_driver():
+    # the governed driver replaces the default driver in the context, because branches of instances always use
+    # the default one, yields False if the default driver is customised, so processes can't be governed
+    global _driver_users, _replaced, _governed_driver
+    with _driver_lock:
+        driver = minizinc.default_driver
+        if _driver_users == 0 and driver is not None and type(driver) is minizinc.Driver:
+            if _governed_driver is None or _governed_driver.executable != driver.executable:
+                # the state of the driver is copied, so the executable isn't run again to check its version
+                _governed_driver = GovernedDriver.__new__(GovernedDriver)
+                vars(_governed_driver).update(vars(driver))
+            _replaced = driver
+            _governed_driver.make_default()
+        # minizinc isn't found, so the solve fails with configuration error
+        installed = minizinc.default_driver is None or isinstance(minizinc.default_driver, GovernedDriver)
+        _driver_users += 1
+    try:
+        yield installed
+    finally:
+        with _driver_lock:
+            _driver_users -= 1
+            if _driver_users == 0 and _replaced is not None:
+                _replaced.make_default()
+                _replaced = None
+
+
+def _resource():
+    # resource module isn't available on Windows
+    import resource
+
+    return resource
+
+
+def _set_rlimits(pid: int, limits: Limits):
+    # limits are set right after the start of minizinc, solver processes inherit them
+    resource = _resource()
+    if limits.memory is not None:
+        resource.prlimit(pid, resource.RLIMIT_AS, (limits.memory, limits.memory))
+    if limits.cpu is not None:
+        # the total time of all processes is checked by the governor, it is the limit of every process
+        seconds = math.ceil(limits.cpu.total_seconds())
+        resource.prlimit(pid, resource.RLIMIT_CPU, (seconds, seconds + 1))
+
+
+def _descendants(pid: int) -> List[int]:
+    # the process and its descendants, parents go first
+    pids = [pid]
+    for parent in pids:
+        try:
+            with open(f"/proc/{parent}/task/{parent}/children") as f:
+                pids.extend(int(child) for child in f.read().split())
+        except OSError:
+            continue
+    return pids
+
+
+def _stat(pid: int) -> Optional[tuple]:
+    # user, system time, user and system time of finished children in seconds and resident memory in bytes
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            stat = f.read()
+    except OSError:
+        return None
+    # the name of the process is in parentheses and can contain spaces
+    fields = stat[stat.rindex(")") + 2 :].split()
+    utime, stime, cutime, cstime = (int(v) / _TICKS for v in fields[11:15])
+    return utime, stime, cutime, cstime, int(fields[21]) * _PAGE
@@ -0,0 +1,59 @@
+"""Solving of already compiled source code with reuse of prepared minizinc instances."""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+import minizinc
+
+from zython.result import detach
+from zython.solver import prepared, registry
+from zython.solver.cpu_budget import solver_threads
+
+
+def solve_source(
+    src: str,
+    data: Dict[str, Any],
+    solver: str,
+    solve_kwargs: Dict[str, Any],
+    hard_timeout: Optional[float] = None,
+    priority: int = 0,
+) -> minizinc.Result:
+    """Solves compiled minizinc source code with the specified data
+
+    The returned result is detached from minizinc generated classes, so it can be pickled.
+    All errors are re-raised as ``RuntimeError``, because minizinc exceptions lose their messages when pickled,
+    except ``TimeoutError``, which is raised if the hard timeout is reached.
+
+    Parameters
+    ----------
+    src: str
+        minizinc source code, e.g. ``zn.Model.src``
+    data: dict
+        values of parameters and enums
+    solver: str
+        solver name
+    solve_kwargs: dict
+        arguments of ``minizinc.Instance.solve``
+    hard_timeout: Optional[float]
+        number of seconds after which the solving is cancelled and the solver is terminated
+    priority: int
+        priority of the solve for the process CPU budget
+    """
+    try:
+        mzn_solver = registry.lookup(solver)
+        # an instance with the same source is analysed by minizinc only once, see ``prepared.InstancePool``
+        with (
+            prepared.branch(src, mzn_solver) as inst,
+            solver_threads(mzn_solver, solve_kwargs.get("processes"), priority) as processes,
+        ):
+            for name, value in data.items():
+                inst[name] = value
+            coroutine = inst.solve_async(**{**solve_kwargs, "processes": processes})
+            if hard_timeout is not None:
+                coroutine = asyncio.wait_for(coroutine, hard_timeout)
+            return detach(asyncio.run(coroutine))
+    except asyncio.TimeoutError:
+        # asyncio.TimeoutError isn't the builtin one before python 3.11
+        raise TimeoutError(f"the solve was terminated after {hard_timeout} seconds") from None
+    except Exception as e:
+        raise RuntimeError(f"{type(e).__name__}: {e}") from None
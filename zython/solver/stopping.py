@@ -0,0 +1,149 @@
+"""Monitoring of intermediate solutions of optimisation: early termination and checkpoints."""
+
+import asyncio
+import contextlib
+from datetime import timedelta
+from typing import Optional
+
+import minizinc
+from minizinc import Status
+
+from zython.solver.checkpoint import Checkpoint
+from zython.solver.cpu_budget import solver_threads_async
+
+
+class StopWhen:
+    """Criteria to stop optimisation before the optimum is proven, the best solution found is returned
+
+    The solver is terminated as soon as any of the criteria is met,
+    the met criterion is reported in ``stopped`` statistics of the original result.
+
+    Parameters
+    ----------
+    target: Optional[float]
+        The objective reaches the value: it is less or equal to it for minimisation
+        and greater or equal for maximisation.
+    gap: Optional[float]
+        Relative gap between the objective and the best bound is less or equal to the value, e.g. 0.01 for 1%.
+        The bound is reported by the solver as ``objectiveBound`` statistics,
+        or passed as ``lower_bound`` (``upper_bound`` for maximisation) to ``solve_*`` method.
+    stall: Optional[timedelta]
+        The objective isn't improved for the time, it is counted from the last improvement.
+
+    Examples
+    --------
+
+    >>> import zython as zn
+    >>> from datetime import timedelta
+    >>> zn.StopWhen(gap=0.05, stall=timedelta(seconds=30))
+    StopWhen(gap=0.05, stall=0:00:30)
+    """
+
+    def __init__(
+        self,
+        *,
+        target: Optional[float] = None,
+        gap: Optional[float] = None,
+        stall: Optional[timedelta] = None,
+    ):
+        if target is None and gap is None and stall is None:
+            raise ValueError("at least one criterion should be specified")
+        if gap is not None and gap < 0:
+            raise ValueError(f"gap should be non-negative, but it is {gap}")
+        if stall is not None and stall <= timedelta(0):
+            raise ValueError(f"stall should be positive, but it is {stall}")
+        self.target = target
+        self.gap = gap
+        self.stall = stall
+
+    def __repr__(self):
+        criteria = ", ".join(f"{name}={value}" for name, value in vars(self).items() if value is not None)
+        return f"StopWhen({criteria})"
+
+    def reason(self, objective, bound, maximize: bool) -> Optional[str]:
+        """Returns the name of met criterion for the objective of the best solution, or None"""
+        if self.target is not None and (objective >= self.target if maximize else objective <= self.target):
+            return "target"
+        if self.gap is not None and bound is not None and gap(objective, bound) <= self.gap:
+            return "gap"
+        return None
+
+
+def gap(objective, bound) -> float:
+    """Relative gap between the objective and its bound"""
+    if objective == bound:
+        return 0.0
+    if objective == 0:
+        return float("inf")
+    return abs(objective - bound) / abs(objective)
+
+
+def solve(
+    inst: minizinc.Instance,
+    solver: minizinc.Solver,
+    processes: Optional[int],
+    criteria: Optional[StopWhen],
+    maximize: bool,
+    bound=None,
+    checkpoint: Optional[Checkpoint] = None,
+    **solve_kwargs,
+) -> minizinc.Result:
+    """Solves optimisation problem, until it is solved or any of the criteria is met
+
+    Parameters
+    ----------
+    bound:
+        known bound of the objective, it is used if the solver doesn't report a better one
+    checkpoint: Optional[Checkpoint]
+        if set, every intermediate solution and the final result are saved to the checkpoint
+    """
+    return asyncio.run(_solve(inst, solver, processes, criteria, maximize, bound, checkpoint, solve_kwargs))
+
+
+async def _solve(inst, solver, processes, criteria, maximize, bound, checkpoint, solve_kwargs) -> minizinc.Result:
+    best = None
+    status, statistics = Status.UNKNOWN, {}
+    stall = None if criteria is None or criteria.stall is None else criteria.stall.total_seconds()
+    loop = asyncio.get_running_loop()
+    improved = None
+    async with solver_threads_async(solver, processes) as processes:
+        solutions = inst.solutions(processes=processes, intermediate_solutions=True, **solve_kwargs)
+        async with contextlib.aclosing(solutions):
+            while True:
+                # the stall is measured from the last improvement, messages without solutions don't reset it
+                timeout = None if stall is None or improved is None else improved + stall - loop.time()
+                try:
+                    if timeout is not None and timeout <= 0:
+                        raise asyncio.TimeoutError
+                    # every intermediate solution improves the objective
+                    result = await asyncio.wait_for(solutions.__anext__(), timeout)
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    statistics["stopped"] = "stall"
+                    break
+                status = result.status
+                statistics.update(result.statistics)
+                if result.solution is None:
+                    continue
+                best = result
+                improved = loop.time()
+                best_bound = _best_bound(bound, statistics, maximize)
+                if checkpoint is not None:
+                    checkpoint.save(best, best_bound)
+                reason = None if criteria is None else criteria.reason(best.objective, best_bound, maximize)
+                if reason is not None:
+                    statistics["stopped"] = reason
+                    break
+    result = minizinc.Result(status, None if best is None else best.solution, statistics)
+    if checkpoint is not None and best is not None:
+        # the final status, e.g. proven optimality, is saved as well
+        checkpoint.save(result, _best_bound(bound, statistics, maximize))
+    return result
+
+
+def _best_bound(known, statistics, maximize: bool):
+    reported = statistics.get("objectiveBound")
+    if known is None or reported is None:
+        return reported if known is None else known
+    return min(known, reported) if maximize else max(known, reported)
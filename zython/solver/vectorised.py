@@ -0,0 +1,169 @@
+"""In-process solver of tiny integer models: all assignments are enumerated and checked by numpy."""
+
+import math
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import AbstractSet, Dict, List, Optional, Tuple
+
+import minizinc
+import numpy as np
+from minizinc import Status
+
+from zython._compile.ir import IR
+from zython._compile.vectorised import Evaluator
+from zython._compile.zinc.zinc import is_output
+from zython.var_par.collections.array import ArrayMixin
+from zython.var_par.collections.set import SetVar
+from zython.operations.constraint import Constraint
+
+MAX_CANDIDATES = 10**7
+BLOCK_SIZE = 2**16
+
+
+def solve(
+    ir: IR,
+    constraints: list,
+    how_to_solve: tuple,
+    all_solutions: bool = False,
+    timeout: Optional[timedelta] = None,
+    max_candidates: Optional[int] = None,
+    block_size: Optional[int] = None,
+    output: Optional[AbstractSet[str]] = None,
+) -> minizinc.Result:
+    """Checks all assignments of decision variables block by block, no minizinc process is started
+
+    Assignments are enumerated in lexicographic order of variables declaration, so the first solution
+    (the first optimum for optimisation problems) in this order is returned.
+
+    Parameters
+    ----------
+    ir: IR
+        compiled model, decision variables should have int range domains
+    constraints: list
+        constraints of the model, strings added by the compiler are skipped
+    how_to_solve: tuple
+        ("satisfy",), ("minimize", objective) or ("maximize", objective)
+    all_solutions: bool
+        return all solutions of satisfaction problem
+    timeout: Optional[timedelta]
+        the search is stopped after the block, which exceeded the time limit
+    max_candidates: Optional[int]
+        maximal number of assignments, ``MAX_CANDIDATES`` if not set
+    block_size: Optional[int]
+        number of assignments checked at once, ``BLOCK_SIZE`` if not set
+    output: Optional[AbstractSet[str]]
+        names of variables to return, variables declared with ``output=False`` are skipped if not set
+
+    Raises
+    ------
+    ValueError
+        If the model has too many assignments or unsupported variables and constraints.
+    """
+    method = how_to_solve[0]
+    objective = how_to_solve[1] if method != "satisfy" else None
+    if isinstance(objective, str):
+        raise ValueError("objective compiled to minizinc source can't be evaluated by numpy solver")
+    if all_solutions and objective is not None:
+        raise ValueError("all_solutions is supported for satisfaction problems only")
+    decision, dims = _decision_vars(ir)
+    total = math.prod(dims)
+    max_candidates = MAX_CANDIDATES if max_candidates is None else max_candidates
+    if total > max_candidates:
+        raise ValueError(f"the model has {total} assignments, numpy solver checks at most {max_candidates}")
+    block_size = BLOCK_SIZE if block_size is None else block_size
+    started = time.monotonic()
+    found: List[int] = []
+    best = None
+    checked = 0
+    timed_out = False
+    for start in range(0, total, block_size):
+        indices = np.arange(start, min(start + block_size, total))
+        evaluator = _evaluator(ir, decision, dims, indices)
+        mask = evaluator.feasible(constraints)
+        checked += len(indices)
+        if objective is not None:
+            values = np.broadcast_to(evaluator(objective), mask.shape)[mask]
+            if values.size:
+                i = np.argmax(values) if method == "maximize" else np.argmin(values)
+                if best is None or (values[i] > best if method == "maximize" else values[i] < best):
+                    best, found = values[i], [int(indices[mask][i])]
+        else:
+            found.extend(indices[mask].tolist())
+            if found and not all_solutions:
+                del found[1:]
+                break
+        if timeout is not None and time.monotonic() - started > timeout.total_seconds():
+            timed_out = checked < total
+            break
+    statistics = dict(
+        nSolutions=len(found), candidates=checked, solveTime=timedelta(seconds=time.monotonic() - started)
+    )
+    return minizinc.Result(
+        _status(found, timed_out, all_solutions, objective),
+        _solutions(ir, found, decision, dims, objective, all_solutions, output),
+        statistics,
+    )
+
+
+def _decision_vars(ir: IR) -> Tuple[Dict[str, range], List[int]]:
+    # domains of decision variables and sizes of the grid dimensions, every array element is a dimension
+    decision = {}
+    dims = []
+    for name, v in ir.vars.items():
+        if v.value is not None:
+            continue
+        if isinstance(v, SetVar) or not isinstance(v.type, range):
+            raise ValueError(f"numpy solver supports variables with int range domains only, but {name} is {v.type}")
+        decision[name] = v.type
+        dims.extend([len(v.type)] * (math.prod(v._shape) if isinstance(v, ArrayMixin) else 1))
+    return decision, dims
+
+
+def _evaluator(ir: IR, decision: Dict[str, range], dims: List[int], indices: np.ndarray) -> Evaluator:
+    # the index of the assignment is a number with mixed radix, its digits are offsets in domains
+    digits = []
+    rest = indices
+    for size in reversed(dims):
+        digits.append(rest % size)
+        rest = rest // size
+    digits.reverse()
+    values = {}
+    position = 0
+    for name, domain in decision.items():
+        v = ir.vars[name]
+        shape = v._shape if isinstance(v, ArrayMixin) else ()
+        count = math.prod(shape)
+        value = np.stack(digits[position : position + count], axis=1) if shape else digits[position]
+        values[name] = domain.start + value.reshape(len(indices), *shape)
+        position += count
+    return Evaluator(ir, values, len(indices))
+
+
+def _status(found: List[int], timed_out: bool, all_solutions: bool, objective) -> Status:
+    if not found:
+        return Status.UNKNOWN if timed_out else Status.UNSATISFIABLE
+    if timed_out:
+        return Status.SATISFIED
+    if all_solutions:
+        return Status.ALL_SOLUTIONS
+    return Status.SATISFIED if objective is None else Status.OPTIMAL_SOLUTION
+
+
+def _solutions(ir: IR, found: List[int], decision, dims, objective, all_solutions: bool, output=None):
+    if not found:
+        return [] if all_solutions else None
+    evaluator = _evaluator(ir, decision, dims, np.asarray(found))
+    columns = {}
+    if objective is not None:
+        columns["objective"] = np.broadcast_to(evaluator(objective), (len(found),)).tolist()
+    for name, v in ir.vars.items():
+        if not is_output(v, output):
+            continue
+        if v.value is not None and not isinstance(v.value, Constraint):
+            columns[name] = [v.value] * len(found)
+        else:
+            shape = v._shape if isinstance(v, ArrayMixin) else ()
+            columns[name] = np.broadcast_to(evaluator(v), (len(found), *shape)).tolist()
+    solutions = [SimpleNamespace(**{name: values[i] for name, values in columns.items()}) for i in range(len(found))]
+    return solutions if all_solutions else solutions[0]
@@ -0,0 +1,129 @@
+"""Solving of many small instances of one model class as a single minizinc model."""
+
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+import minizinc
+from minizinc import Status
+
+from zython._compile.ir import IR
+from zython._compile.zinc.to_str import to_str
+from zython._compile.zinc.zinc import is_output, solve_item, to_zinc
+from zython.model import Model, _instance_data
+from zython.result import Result
+from zython.solver import registry
+from zython.solver.cpu_budget import solver_threads
+
+
+def solve_stacked(
+    model_cls: Type[Model],
+    kwargs_list: Iterable[Dict[str, Any]],
+    *,
+    method: str = "satisfy",
+    objective: Optional[Callable[[Model], Any]] = None,
+    solver: str = "gecode",
+    optimisation_level: Optional[int] = None,
+    n_processes: Optional[int] = None,
+    timeout: Optional[timedelta] = None,
+    random_seed: Optional[int] = None,
+) -> List[Result]:
+    """Solves ``model_cls(**kwargs)`` for every kwargs in ``kwargs_list`` by one minizinc run
+
+    Every instance (scenario) is compiled with its own prefix of names, e.g. ``x`` of the third scenario
+    is ``s2_x``, and all scenarios are joined into one model with the sum of their objectives.
+    So the solver is started and the model is flattened only once, which is much faster than separate solves
+    for tiny models. If the joined model is unsatisfiable, it is split into halves, which are solved separately,
+    so satisfiable scenarios get their solutions.
+
+    Parameters
+    ----------
+    model_cls: type
+        Subclass of ``zn.Model`` to solve, models with enums can't be stacked.
+    kwargs_list: iterable of dict
+        Keyword arguments to create an instance of ``model_cls`` for every scenario.
+    method: str
+        "satisfy", "minimize" or "maximize"
+    objective: Callable, optional
+        Function, which accepts created model and returns the expression to optimise.
+        Required if ``method`` is "minimize" or "maximize", objectives of scenarios are summed,
+        so the optimum of the sum is the optimum of every scenario.
+    timeout: Optional[timedelta]
+        Time limit of every minizinc run.
+
+    Other parameters have the same meaning as in ``zn.Model.solve_satisfy``.
+
+    Returns
+    -------
+    results: list of Result
+        Results of scenarios in the order of ``kwargs_list``.
+    """
+    if method not in ("satisfy", "minimize", "maximize"):
+        raise ValueError(f"method should be 'satisfy', 'minimize' or 'maximize', but it is {method!r}")
+    if method != "satisfy" and objective is None:
+        raise ValueError(f"objective should be specified for {method}")
+    models = [model_cls(**kwargs) for kwargs in kwargs_list]
+    # results keep their models and objectives, so they can be verified
+    objectives = {id(model): objective(model) if objective is not None else None for model in models}
+    solve_kwargs = dict(optimisation_level=optimisation_level, timeout=timeout, random_seed=random_seed)
+    mzn_solver = registry.lookup(solver)
+    results: List[Result] = []
+    # scenarios are solved in chunks, the chunk is halved while it is unsatisfiable
+    chunks = [models] if models else []
+    while chunks:
+        chunk = chunks.pop()
+        src, data, names = _stack(chunk, method, objective)
+        mzn_model = minizinc.Model()
+        mzn_model.add_string(src)
+        inst = minizinc.Instance(mzn_solver, mzn_model)
+        for name, value in data.items():
+            inst[name] = value
+        with solver_threads(mzn_solver, n_processes) as processes:
+            mzn_result = inst.solve(processes=processes, **solve_kwargs)
+        if mzn_result.status == Status.UNSATISFIABLE and len(chunk) > 1:
+            middle = len(chunk) // 2
+            chunks.extend((chunk[middle:], chunk[:middle]))
+            continue
+        for model, r in zip(chunk, _split(mzn_result, names)):
+            results.append(Result(r, solver=solver, model=model, objective=objectives[id(model)]))
+    return results
+
+
+def _stack(models: List[Model], method: str, objective) -> Tuple[str, Dict[str, Any], List[List[str]]]:
+    # source code of all scenarios, their data and names of variables of every scenario
+    src, data, names, objectives = [], {}, [], []
+    for i, model in enumerate(models):
+        prefix = f"s{i}_"
+        ir = IR(model, None)
+        if ir.enums:
+            raise ValueError("models with enums can't be stacked")
+        constraints = list(model.constraints)
+        variables = {**ir.pars, **ir.vars}
+        # variables are renamed while the scenario is compiled only, the model keeps its own names
+        for name, v in variables.items():
+            v._name = prefix + name
+        try:
+            src.append(to_zinc(ir))
+            if objective is not None:
+                objectives.append(f"({to_str(objective(model))})")
+        finally:
+            for name, v in variables.items():
+                v._name = name
+            # constraints of variables defined by expressions are added while compiling
+            model.constraints = constraints
+        data.update((prefix + name, value) for name, value in _instance_data(ir).items())
+        names.append([name for name, v in ir.vars.items() if is_output(v)])
+    how_to_solve = ("satisfy",) if method == "satisfy" else (method, " + ".join(objectives))
+    src.append(solve_item(how_to_solve))
+    return "\n".join(src), data, names
+
+
+def _split(mzn_result: minizinc.Result, names: List[List[str]]) -> List[minizinc.Result]:
+    results = []
+    for i, scenario in enumerate(names):
+        solution = None
+        if mzn_result.solution is not None:
+            prefix = f"s{i}_"
+            solution = SimpleNamespace(**{name: getattr(mzn_result.solution, prefix + name) for name in scenario})
+        results.append(minizinc.Result(mzn_result.status, solution, mzn_result.statistics))
+    return results
@@ -0,0 +1,108 @@
+"""Timings of compile and solve phases and hooks, which are called when a phase starts and ends."""
+
+import contextlib
+import contextvars
+import functools
+import logging
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+
+class Event(NamedTuple):
+    """Start or end of the phase
+
+    Attributes
+    ----------
+    phase: str
+        name of the phase, e.g. "ir", "to_zinc", "solver", "convert" or "solve" for the whole ``solve_*`` call
+    kind: str
+        "start" or "end"
+    elapsed: Optional[float]
+        duration of the phase in seconds for "end" events
+    """
+
+    phase: str
+    kind: str
+    elapsed: Optional[float] = None
+
+
+Hook = Callable[[Event], None]
+
+_hooks: List[Hook] = []
+_logger = logging.getLogger(__name__)
+_timings: contextvars.ContextVar = contextvars.ContextVar("zython_timings", default=None)
+
+
+def add_hook(hook: Hook) -> Hook:
+    """Registers the function, which is called with every ``Event``, it can be used as decorator
+
+    Hooks are called synchronously in the thread of the phase, so they should be fast,
+    e.g. forward the event to a tracer or a metrics client.
+    Exceptions of hooks are logged by ``zython.tracing`` logger and don't affect the solve.
+
+    Examples
+    --------
+
+    >>> @add_hook
+    ... def log(event):
+    ...     if event.kind == "end":
+    ...         print(event.phase)
+    >>> with phase("to_zinc"):
+    ...     pass
+    to_zinc
+    >>> remove_hook(log)
+    """
+    _hooks.append(hook)
+    return hook
+
+
+def remove_hook(hook: Hook):
+    _hooks.remove(hook)
+
+
+@contextlib.contextmanager
+def phase(name: str, timings: Optional[Dict[str, float]] = None):
+    """Measures the phase by monotonic timer and calls hooks, it can be used as decorator
+
+    The duration is added to ``timings`` or to timings of the current solve, see ``traced``.
+    """
+    hooks = tuple(_hooks)
+    _call(hooks, Event(name, "start"))
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        if timings is None:
+            timings = _timings.get()
+        if timings is not None:
+            timings[name] = timings.get(name, 0.0) + elapsed
+        _call(hooks, Event(name, "end", elapsed))
+
+
+def _call(hooks, event: Event):
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception:
+            _logger.exception("tracing hook %r failed on %s", hook, event)
+
+
+def traced(solve):
+    """Collects timings of phases of the solve, they are available by ``current_timings`` while it runs"""
+
+    @functools.wraps(solve)
+    def wrapper(*args, **kwargs):
+        token = _timings.set({})
+        try:
+            with phase("solve"):
+                return solve(*args, **kwargs)
+        finally:
+            _timings.reset(token)
+
+    return wrapper
+
+
+def current_timings() -> Optional[Dict[str, float]]:
+    """Returns timings of the current solve, the dictionary is updated until the solve ends"""
+    return _timings.get()
@@ -87,6 +87,7 @@ class ArrayVar(var, ArrayMixin):
         self._type = arg.type
         self._value = None
         self._name = None
+        self._output = arg.output
         self._shape = shape if isinstance(shape, tuple) else (shape,)
 
 
@@ -20,6 +20,7 @@ class SetVar(var, SetMixin):
         self._type = type_
         self._value = None
         self._name = None
+        self._output = arg.output
 
 
 class SetPar(par, SetMixin):
@@ -6,10 +6,14 @@ from zython.var_par.get_type import is_range, is_enum
 
 
 class var(Operation):
-    def __init__(self, /, type_, value=None):
+    # variables created with output=False are internal, they aren't printed by the solver
+    _output = True
+
+    def __init__(self, /, type_, value=None, *, output: bool = True):
         self._name = None
         self._value = value
         self._type = None
+        self._output = output
         if isinstance(type_, Constraint):
             self._type = type_.type
             self._value = type_
@@ -43,5 +47,9 @@ class var(Operation):
     def type(self):
         return self._type
 
+    @property
+    def output(self) -> bool:
+        return self._output
+
     def __repr__(self):
         return f"var({self._type}: {self._name})"